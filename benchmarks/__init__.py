@@ -0,0 +1,29 @@
+""" Benchmarks for the hot paths of `forecaster`.
+
+The benchmarks in this package can be run with the standard library
+alone, e.g.:
+
+    python -m benchmarks
+    python -m benchmarks --filter couple-60 --repeat 5
+    python -m benchmarks --save benchmarks/baseline.json
+    python -m benchmarks --baseline benchmarks/baseline.json
+
+Each benchmark runs a complete forecast for a representative household
+and reports its total wall time, the wall time spent in each kind of
+`SubForecast`, and its peak memory usage (as measured by `tracemalloc`).
+Results can be saved as JSON and compared against a stored baseline;
+see `benchmarks.harness` for details.
+
+Benchmarks are plain functions of no arguments (see `CASES`), so they
+can also be wrapped by other tools, e.g. pytest-benchmark's
+`benchmark` fixture or asv's `time_*`/`peakmem_*` functions.
+"""
+
+from benchmarks.cases import BenchmarkCase, CASES, build_cases
+from benchmarks.harness import (
+    BenchmarkResult, run_case, run_cases, compare, load_results,
+    save_results)
+
+__all__ = [
+    'BenchmarkCase', 'CASES', 'build_cases', 'BenchmarkResult', 'run_case',
+    'run_cases', 'compare', 'load_results', 'save_results']
@@ -0,0 +1,84 @@
+""" Command-line interface for running benchmarks.
+
+Run `python -m benchmarks --help` from the repository root for usage.
+Exits with status 1 if any benchmark regressed relative to `--baseline`.
+"""
+
+import argparse
+import sys
+from benchmarks.cases import CASES
+from benchmarks.harness import (
+    DEFAULT_TOLERANCE, METRICS, run_cases, compare, load_results,
+    save_results)
+
+
+def _parse_args(argv):
+    """ Parses command-line arguments. """
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Benchmarks complete forecasts.')
+    parser.add_argument(
+        '-k', '--filter', action='append', default=[],
+        help='Only run cases whose names contain this substring. '
+        'May be given more than once.')
+    parser.add_argument(
+        '-r', '--repeat', type=int, default=3,
+        help='Number of timed runs per case (default: %(default)s).')
+    parser.add_argument(
+        '--no-memory', action='store_true',
+        help='Skip measuring peak memory.')
+    parser.add_argument(
+        '--baseline', help='Compare results against this JSON file.')
+    parser.add_argument(
+        '--tolerance', type=float, default=DEFAULT_TOLERANCE,
+        help='Relative slowdown treated as noise (default: %(default)s).')
+    parser.add_argument('--save', help='Write results to this JSON file.')
+    parser.add_argument(
+        '--list', action='store_true', help='List cases and exit.')
+    return parser.parse_args(argv)
+
+
+def _report(result):
+    """ Prints a one-line summary of `result`, with subforecast times. """
+    memory = (
+        '{:8.1f} MiB'.format(result.peak_memory / 2**20)
+        if result.peak_memory is not None else '')
+    subforecasts = ', '.join(
+        '{} {:.3f}'.format(name, seconds) for (name, seconds)
+        in sorted(result.subforecasts.items(), key=lambda x: -x[1]))
+    print('{:45} {:8.3f} s {}  [{}]'.format(
+        result.name, result.time, memory, subforecasts))
+    sys.stdout.flush()
+
+
+def main(argv=None):
+    """ Runs benchmarks. Returns an exit status. """
+    args = _parse_args(argv)
+    cases = [
+        case for case in CASES
+        if not args.filter or any(key in case.name for key in args.filter)]
+    if args.list:
+        for case in cases:
+            print(case.name)
+        return 0
+
+    results = run_cases(
+        cases, repeat=args.repeat, measure_memory=not args.no_memory,
+        report=_report)
+
+    if args.save:
+        save_results(results, args.save)
+    if args.baseline:
+        regressions = compare(
+            results, load_results(args.baseline), tolerance=args.tolerance)
+        for name, metric, old, new in regressions:
+            print('REGRESSION {}: {} {:.4g} -> {:.4g} {} ({:+.0%})'.format(
+                name, metric, old, new, METRICS[metric], new / old - 1))
+        if regressions:
+            return 1
+        print('No regressions relative to ' + args.baseline)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,162 @@
+""" Representative forecasts to benchmark.
+
+Each `BenchmarkCase` describes one household (a single person or a
+couple), one forecast horizon, one numeric type, and one kind of
+`Forecaster`. `CASES` provides the full cross-product of the standard
+configurations, which is what `python -m benchmarks` runs by default.
+"""
+
+from decimal import Decimal
+from forecaster import Forecaster, Settings, Person, Account, Debt
+from forecaster.canada import (
+    ForecasterCanada, SettingsCanada, RRSP, TFSA, TaxableAccount)
+
+HOUSEHOLDS = ('single', 'couple')
+HORIZONS = (30, 60, 100)
+PRECISIONS = (None, Decimal)
+FORECASTERS = (Forecaster, ForecasterCanada)
+
+
+class BenchmarkCase(object):
+    """ A forecast to be benchmarked.
+
+    Building the household is not timed; only `run` is. Each call to
+    `setup` builds a fresh household, so that repeated runs don't see
+    state left over from earlier runs.
+
+    Attributes:
+        household (str): Either `'single'` or `'couple'`.
+        num_years (int): The number of years to forecast.
+        high_precision (Callable[[float], HighPrecisionType]): A
+            callable object, such as a class, that converts `float`
+            values to a high-precision type. Optional.
+        forecaster_type (type): `Forecaster` or a subclass of it.
+    """
+
+    def __init__(
+            self, household, num_years, high_precision=None,
+            forecaster_type=Forecaster):
+        """ Inits BenchmarkCase. """
+        if household not in HOUSEHOLDS:
+            raise ValueError('Unknown household: ' + str(household))
+        self.household = household
+        self.num_years = num_years
+        self.high_precision = high_precision
+        self.forecaster_type = forecaster_type
+
+    @property
+    def name(self):
+        """ A unique, human-readable identifier for the case. """
+        precision = (
+            self.high_precision.__name__.lower()
+            if self.high_precision is not None else 'float')
+        return '{}-{}-{}-{}'.format(
+            self.forecaster_type.__name__.lower(), self.household,
+            self.num_years, precision)
+
+    def __repr__(self):
+        return 'BenchmarkCase({})'.format(self.name)
+
+    def _convert(self, value):
+        """ Converts `value` to the case's numeric type. """
+        if self.high_precision is not None:
+            return self.high_precision(value)
+        return value
+
+    def setup(self):
+        """ Builds a forecaster and household for a single run.
+
+        Returns:
+            tuple[Forecaster, set[Person], set[Account], set[Debt]]:
+            A forecaster along with the `people`, `accounts`, and
+            `debts` arguments to pass to its `run_forecast` method.
+        """
+        canadian = issubclass(self.forecaster_type, ForecasterCanada)
+        settings_type = SettingsCanada if canadian else Settings
+        settings = settings_type(high_precision=self.high_precision)
+        settings.num_years = self.num_years
+        forecaster = self.forecaster_type(
+            settings=settings, high_precision=self.high_precision)
+        initial_year = settings.initial_year
+        # NOTE: Nobody may retire at the start of the forecast, since
+        # `LivingExpensesForecast` can't allocate expenses if the
+        # household has no income. The couple's second earner retires
+        # after the forecast ends, so that one person's retirement
+        # (and the resulting withdrawals) are still exercised.
+        last_year = initial_year + self.num_years
+        people = {self._person(
+            initial_year, 'A', 1980, last_year + 1, 100000)}
+        if self.household == 'couple':
+            spouse = self._person(
+                initial_year, 'B', 1982, initial_year + self.num_years // 2,
+                80000)
+            spouse.spouse = next(iter(people))
+            people.add(spouse)
+        accounts = set()
+        debts = set()
+        for person in people:
+            accounts.update(self._accounts(person, canadian))
+            debts.add(Debt(
+                owner=person, balance=self._convert(-20000),
+                rate=self._convert(0.05), minimum_payment=self._convert(1000),
+                accelerated_payment=self._convert(float('inf')),
+                high_precision=self.high_precision))
+        return forecaster, people, accounts, debts
+
+    def run(self, forecaster, people, accounts, debts, profiler=None):
+        """ Runs the forecast. Returns the `Forecast`. """
+        return forecaster.run_forecast(
+            people=people, accounts=accounts, debts=debts, profiler=profiler)
+
+    def __call__(self):
+        """ Builds the household and runs the forecast. """
+        return self.run(*self.setup())
+
+    def _person(self, initial_year, name, birth_year, retirement_year, income):
+        """ Builds a `Person` with the case's numeric type. """
+        return Person(
+            initial_year, name, birth_year,
+            retirement_date=retirement_year,
+            gross_income=self._convert(income),
+            raise_rate=self._convert(0.02),
+            payment_timing='BW',
+            high_precision=self.high_precision)
+
+    def _accounts(self, person, canadian):
+        """ Builds a handful of savings accounts owned by `person`. """
+        if canadian:
+            account_types = (RRSP, TFSA, TaxableAccount)
+        else:
+            account_types = (Account, Account, Account)
+        accounts = set()
+        for i, account_type in enumerate(account_types, start=1):
+            kwargs = {}
+            if account_type in (RRSP, TFSA):
+                kwargs['contribution_room'] = self._convert(10000 * i)
+            accounts.add(account_type(
+                owner=person, balance=self._convert(10000 * i),
+                rate=self._convert(0.04 + 0.01 * i),
+                high_precision=self.high_precision, **kwargs))
+        return accounts
+
+
+def build_cases(
+        households=HOUSEHOLDS, horizons=HORIZONS, precisions=PRECISIONS,
+        forecasters=FORECASTERS):
+    """ Builds a `BenchmarkCase` for each combination of arguments.
+
+    Returns:
+        list[BenchmarkCase]: Cases ordered from cheapest (by horizon)
+        to most expensive.
+    """
+    return [
+        BenchmarkCase(
+            household, num_years, high_precision=high_precision,
+            forecaster_type=forecaster_type)
+        for num_years in horizons
+        for household in households
+        for high_precision in precisions
+        for forecaster_type in forecasters]
+
+
+CASES = build_cases()
@@ -0,0 +1,191 @@
+""" Runs benchmarks and compares their results against a baseline.
+
+Results are plain JSON, so that a baseline can be committed alongside
+the code and regenerated on a given machine with
+`python -m benchmarks --save <path>`. Timings are only comparable
+between runs on the same machine, so `compare` treats any change
+within `tolerance` as noise.
+"""
+
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime
+from forecaster.forecast import ForecastProfiler
+
+# By default, a metric must be 25% worse than its baseline to be
+# reported as a regression:
+DEFAULT_TOLERANCE = 0.25
+# Metrics compared against the baseline, along with a human-readable
+# description of each:
+METRICS = {'time': 'seconds', 'peak_memory': 'bytes'}
+
+
+class BenchmarkResult(object):
+    """ The measurements taken for one `BenchmarkCase`.
+
+    Attributes:
+        name (str): The name of the `BenchmarkCase`.
+        times (list[float]): The wall time of each run, in seconds.
+        subforecasts (dict[str, float]): The wall time spent in each
+            type of `SubForecast` (and in `Forecast.next_year`),
+            averaged over all runs.
+        peak_memory (int): The peak memory allocated during a run, in
+            bytes, or `None` if memory was not measured.
+    """
+
+    def __init__(self, name, times=None, subforecasts=None, peak_memory=None):
+        """ Inits BenchmarkResult. """
+        self.name = name
+        self.times = list(times) if times is not None else []
+        self.subforecasts = (
+            dict(subforecasts) if subforecasts is not None else {})
+        self.peak_memory = peak_memory
+
+    @property
+    def time(self):
+        """ The best (i.e. least noisy) wall time over all runs. """
+        return min(self.times) if self.times else None
+
+    def to_dict(self):
+        """ Converts the result to a JSON-serializable dict. """
+        return {
+            'time': self.time,
+            'times': self.times,
+            'subforecasts': self.subforecasts,
+            'peak_memory': self.peak_memory}
+
+    @classmethod
+    def from_dict(cls, name, values):
+        """ Builds a result from the output of `to_dict`. """
+        return cls(
+            name, times=values.get('times'),
+            subforecasts=values.get('subforecasts'),
+            peak_memory=values.get('peak_memory'))
+
+
+def run_case(case, repeat=3, measure_memory=True):
+    """ Benchmarks a single `BenchmarkCase`.
+
+    The case is run `repeat` times to measure wall time. If memory is
+    measured, it is run once more with `tracemalloc` enabled, since
+    tracing allocations distorts timings.
+
+    Returns:
+        BenchmarkResult: The measurements for the case.
+    """
+    times = []
+    timings = defaultdict(float)
+    for _ in range(repeat):
+        args = case.setup()
+        profiler = ForecastProfiler()
+        gc.collect()
+        start = time.perf_counter()
+        case.run(*args, profiler=profiler)
+        times.append(time.perf_counter() - start)
+        for name, record in profiler.totals().items():
+            timings[name] += record.time
+    subforecasts = {
+        name: total / repeat for (name, total) in timings.items()}
+
+    peak_memory = None
+    if measure_memory:
+        args = case.setup()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            case.run(*args)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return BenchmarkResult(
+        case.name, times=times, subforecasts=subforecasts,
+        peak_memory=peak_memory)
+
+
+def run_cases(cases, repeat=3, measure_memory=True, report=None):
+    """ Benchmarks each of `cases`.
+
+    Args:
+        cases (Iterable[BenchmarkCase]): The cases to run.
+        repeat (int): The number of timed runs for each case.
+        measure_memory (bool): Whether to measure peak memory.
+        report (Callable[[BenchmarkResult], None]): Called with each
+            result as soon as it is available. Optional.
+
+    Returns:
+        dict[str, BenchmarkResult]: Results, keyed by case name.
+    """
+    results = {}
+    for case in cases:
+        result = run_case(
+            case, repeat=repeat, measure_memory=measure_memory)
+        results[result.name] = result
+        if report is not None:
+            report(result)
+    return results
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """ Finds metrics that have regressed relative to `baseline`.
+
+    Cases or metrics that are missing from either `results` or
+    `baseline` are ignored.
+
+    Args:
+        results (dict[str, BenchmarkResult]): The current results.
+        baseline (dict[str, BenchmarkResult]): Previous results.
+        tolerance (float): The relative increase in a metric that is
+            treated as noise, e.g. `0.25` for a 25% increase.
+
+    Returns:
+        list[tuple[str, str, float, float]]: A
+        `(name, metric, baseline_value, current_value)` tuple for
+        each metric that is more than `tolerance` worse than its
+        baseline.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        for metric in METRICS:
+            old = getattr(baseline[name], metric)
+            new = getattr(result, metric)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + tolerance):
+                regressions.append((name, metric, old, new))
+    return regressions
+
+
+def save_results(results, path):
+    """ Writes `results` to `path` as JSON, with machine details. """
+    data = {
+        'meta': {
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'machine': platform.machine()},
+        'results': {
+            name: result.to_dict() for (name, result) in results.items()}}
+    with open(path, 'w') as file:
+        json.dump(data, file, indent=2, sort_keys=True)
+        file.write('\n')
+
+
+def load_results(path):
+    """ Reads results written by `save_results` from `path`.
+
+    Returns:
+        dict[str, BenchmarkResult]: Results, keyed by case name.
+    """
+    with open(path) as file:
+        data = json.load(file)
+    return {
+        name: BenchmarkResult.from_dict(name, values)
+        for (name, values) in data['results'].items()}
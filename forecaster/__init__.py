@@ -26,10 +26,12 @@ from forecaster.tax import Tax
 from forecaster.settings import Settings
 from forecaster.forecast import (
     Forecast, SubForecast, IncomeForecast, LivingExpensesForecast,
-    SavingForecast, WithdrawalForecast, TaxForecast)
+    SavingForecast, WithdrawalForecast, TaxForecast, ForecastSummary,
+    VectorizedForecast, ForecastPath, ForecastProfiler)
 from forecaster.forecaster import Forecaster, Parameter
 from forecaster.value_reader import (
     ValueReader, HighPrecisionJSONEncoder, resolve_path)
 from forecaster.utility import (
     timing, inflation, precision,
-    Timing, transactions_from_timing)
+    Timing, FrozenTiming, frozen_timing, transactions_from_timing,
+    TransactionSeries)
@@ -1,14 +1,14 @@
 """ A module providing the base Account class. """
 
 from copy import copy
-from collections import defaultdict
 from forecaster.person import Person
 from forecaster.ledger import (
     TaxSource, recorded_property, recorded_property_cached)
 from forecaster.utility import (
-    Timing, when_conv, frequency_conv, add_transactions)
+    Timing, Constant, when_conv, frequency_conv, add_transactions,
+    frozen_timing, TransactionSeries)
 from forecaster.accounts.util import (
-    accumulation_function, value_at_time, time_to_value)
+    time_to_value, growth_factor, future_value)
 
 class Account(TaxSource):
     """ An account storing a balance.
@@ -157,11 +157,14 @@ class Account(TaxSource):
         # Set hidden attributes to support properties that need them to
         # be set in advance:
         self._owner = None
-        self._transactions = defaultdict(
-            lambda: self.precision_convert(0)) # Money value
+        self._transactions = TransactionSeries(
+            zero=self.precision_convert(0)) # Money value
         self._rate_callable = None
         self._default_timing = None
         self._nper = None
+        # Growth factors for this year, keyed by `(rate, nper, t)`.
+        # See `growth_factor` for details:
+        self._growth_factors = {}
 
         # Set the various property values based on inputs:
         self.owner = owner
@@ -169,7 +172,7 @@ class Account(TaxSource):
         self.rate_callable = rate
         self.nper = frequency_conv(nper)
         if default_timing is None:
-            self.default_timing = Timing(high_precision=high_precision)
+            self.default_timing = frozen_timing(high_precision=high_precision)
         else:
             self.default_timing = default_timing
         # NOTE: returns is calculated lazily
@@ -206,14 +209,15 @@ class Account(TaxSource):
         """ Sets default_timing. """
         # Cast to `Timing` type:
         if not isinstance(val, Timing):
-            val = Timing(val, high_precision=self.high_precision)
+            val = frozen_timing(val, high_precision=self.high_precision)
         self._default_timing = val
 
     @default_timing.deleter
     def default_timing(self):
         """ Deletes default_timing. """
         # Return default_timing to its default value:
-        self._default_timing = Timing(high_precision=self.high_precision)
+        self._default_timing = frozen_timing(
+            high_precision=self.high_precision)
 
     @recorded_property_cached
     def balance(self):
@@ -228,23 +232,20 @@ class Account(TaxSource):
         # setter defined via metaclass)
 
         # First, grow last year's initial balance based on the rate:
-        balance = value_at_time(
-            # pylint: disable=no-member
-            # Pylint gets confused by attributes added by metaclass.
-            self._balance_history[self.this_year - 1],
-            self.rate, 'start', 'end', nper=self.nper,
-            high_precision=self.high_precision)
+        # pylint: disable=no-member
+        # Pylint gets confused by attributes added by metaclass.
+        balance = (
+            self._balance_history[self.this_year - 1]
+            * self._growth_factor(self.precision_convert(1)))
 
         # Then, grow each transactions and add it to the year-end total.
         # NOTE: This accounts for both inflows and outflows; outflows
         # and their growth are negative and will reduce the balance.
-        # pylint: disable=no-member
-        # Pylint gets confused by attributes added by metaclass.
-        transactions_history = self._transactions_history
-        for when, value in transactions_history[self.this_year - 1].items():
-            balance += value_at_time(
-                value, self.rate, when, 'end', nper=self.nper,
-                high_precision=self.high_precision)
+        balance += future_value(
+            self._transactions_history[self.this_year - 1],
+            self.rate, 'end', nper=self.nper,
+            high_precision=self.high_precision,
+            factors=self._growth_factors)
 
         return balance
 
@@ -266,17 +267,14 @@ class Account(TaxSource):
         returning `val` otherwise.
         """
         # If input isn't callable, convert it to a suitable method:
+        # (These are picklable, unlike lambdas or nested functions.)
         if not callable(val):
             if isinstance(val, dict):
                 # assume dict of {year: rate} pairs
-                def func(year):
-                    """ Wraps dict in a function. """
-                    return val[year]
+                func = val.__getitem__
             else:
                 # If this is scalar, return a constant rate
-                def func(_):
-                    """ Wraps value in a function. """
-                    return val
+                func = Constant(val)
             self._rate_callable = func
         else:
             # If the input is callable, use it without modification.
@@ -305,27 +303,14 @@ class Account(TaxSource):
         # Find returns on the initial balance.
         # This doesn't include any transactions or their growth.
         one = self.precision_convert(1)
-        returns = (
-            self.balance * (
-                accumulation_function(
-                    one, self.rate, self.nper,
-                    # This member exists, though Pylint can't tell.
-                    # pylint: disable=no-member
-                    high_precision=self.high_precision)
-                    # pylint: enable=no-member
-                - one))
+        returns = self.balance * (self._growth_factor(one) - one)
 
         # Add in the returns on each transaction.
         # (Withdrawals will generate returns with the opposite sign of
         # the returns on the initial balance and prior inflows, thereby
         # cancelling out a portion of those returns.)
-        for when in self.transactions:
-            returns += (
-                self.transactions[when] * (
-                    accumulation_function(
-                        one - when, self.rate, self.nper,
-                        high_precision=self.high_precision) - 
-                    one))
+        for when, value in self.transactions.items():
+            returns += value * (self._growth_factor(one - when) - one)
 
         return self.precision_convert(returns)
 
@@ -400,10 +385,14 @@ class Account(TaxSource):
         super().next_year()
 
         # Clear out transactions for the new year:
-        # (We assign a new defaultdict because the old dict is
+        # (We assign a new series because the old series is
         # stored by the `transactions` recorded_property; invoking
         # `clear` will affect past-year records.)
-        self._transactions = defaultdict(lambda: 0) # Money value
+        self._transactions = TransactionSeries(
+            zero=self.precision_convert(0)) # Money value
+        # Last year's growth factors are unlikely to be reused, so
+        # drop them to keep the table small:
+        self._growth_factors = {}
 
     @property
     def max_outflow_limit(self):
@@ -476,6 +465,34 @@ class Account(TaxSource):
             # But no more than the maximum outflow:
             self.max_outflow_limit)
 
+    def max_outflow_curve(self, times, transactions=None):
+        """ The maximum amounts that can be withdrawn at each of `times`.
+
+        This is equivalent to calling `max_outflow` for each time, but
+        it finds the balance at every time in a single pass over the
+        account's transactions (see `balances_at_times`).
+
+        Args:
+            times (Iterable[Decimal, str]): The times at which the
+                maximum outflows are to be determined.
+            transactions (dict[Decimal, float]): If provided, the result
+                of this method will be determined as if the account
+                also had these transactions recorded against it.
+
+        Returns:
+            dict[float, float]: A mapping of each time (converted via
+            `when_conv`) to the maximum outflow at that time, in
+            ascending order of time.
+        """
+        zero = self.precision_convert(0) # Money value
+        # `max_outflow_limit` can be expensive for some subclasses, so
+        # only look it up once:
+        limit = self.max_outflow_limit
+        balances = self.balances_at_times(times, transactions=transactions)
+        return {
+            time: max(min(-balance, zero), limit)
+            for time, balance in balances.items()}
+
     def min_outflow(self, when="end"):
         """ The minimum amount that can be withdrawn at `when`. """
         # The `when` arg is provided for subclasses to use.
@@ -589,11 +606,7 @@ class Account(TaxSource):
         # Since s (the total) is the same for all values, find it first:
         weighted_accum = self.precision_convert(0)
         for timing, weight in normalized_timing.items():
-            weighted_accum += weight * accumulation_function(
-                t=1-timing,
-                rate=self.rate,
-                nper=self.nper,
-                high_precision=self.high_precision)
+            weighted_accum += weight * self._growth_factor(1 - timing)
         total = change / weighted_accum
 
         # Limit total transaction value based on args:
@@ -886,6 +899,19 @@ class Account(TaxSource):
     # Finally, add some methods for calculating growth (i.e. balance
     # at a future time and time to get to a future balance.)
 
+    def _growth_factor(self, t):
+        """ The growth factor A(t) for this year's rate and nper.
+
+        Results are stored in a table that is cleared each year, since
+        most of the account's methods evaluate growth at the same few
+        timings many times per year.
+        """
+        # pylint: disable=invalid-name
+        # `t` is the usual name for the input to A(t) in interest theory.
+        return growth_factor(
+            t, self.rate, self.nper, high_precision=self.high_precision,
+            factors=self._growth_factors)
+
     def balance_at_time(self, time, transactions=None):
         """ Returns the balance at a point in time.
 
@@ -902,9 +928,7 @@ class Account(TaxSource):
 
         # Find the future value (at t=time) of the initial balance.
         # This doesn't include any transactions of their growth.
-        balance = value_at_time(
-            self.balance, self.rate, 'start', time, nper=self.nper,
-            high_precision=self.high_precision)
+        balance = self.balance * self._growth_factor(time)
 
         # Combine the recorded and input transactions, if provided:
         if transactions is not None:
@@ -915,13 +939,58 @@ class Account(TaxSource):
             transactions = self.transactions
         # Add in the future value of each transaction (except that that
         # happen after `time`).
-        for when in [w for w in transactions if w <= time]:
-            balance += value_at_time(
-                transactions[when], self.rate, when, time, nper=self.nper,
-                high_precision=self.high_precision)
+        balance += future_value(
+            transactions, self.rate, time, nper=self.nper,
+            high_precision=self.high_precision,
+            factors=self._growth_factors)
 
         return balance
 
+    def balances_at_times(self, times, transactions=None):
+        """ Returns the balance at each of several points in time.
+
+        This is equivalent to calling `balance_at_time` for each time,
+        but it walks the account's transactions once, in order, growing
+        the running balance from each time to the next rather than
+        summing the growth of every earlier transaction at each time.
+        (Results may therefore differ by rounding error.)
+
+        Args:
+            times (Iterable[Decimal, str]): The times at which the
+                account's balance is to be determined.
+            transactions (dict[Decimal, float]): If provided, the result
+                of this method will be determined as if the account
+                also had these transactions recorded against it.
+
+        Returns:
+            dict[float, float]: A mapping of each time (converted via
+            `when_conv`) to the balance at that time, in ascending
+            order of time.
+        """
+        times = {
+            when_conv(time, high_precision=self.high_precision)
+            for time in times}
+        # Combine the recorded and input transactions, if provided:
+        if transactions is not None:
+            transactions = TransactionSeries(transactions)
+            transactions.add(self.transactions)
+        else:
+            transactions = self.transactions
+        balances = {}
+        balance = self.balance
+        prev = self.precision_convert(0)
+        for time in sorted(times | transactions.keys()):
+            # Grow the running balance to `time`:
+            if time != prev:
+                balance *= self._growth_factor(time - prev)
+                prev = time
+            # Transactions at `time` count towards the balance then:
+            if time in transactions:
+                balance += transactions[time]
+            if time in times:
+                balances[time] = balance
+        return balances
+
     def time_to_balance(self, value, when=0):
         """ Returns the time required to grow to a given balance.
 
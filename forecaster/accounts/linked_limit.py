@@ -1,9 +1,8 @@
 """ A module providing the LinkedLimitAccount class. """
 
-from copy import copy
 from forecaster.accounts.base import Account
 from forecaster.accounts.link import AccountLink
-from forecaster.utility import add_transactions
+from forecaster.utility import Constant, TransactionSeries
 
 class LinkedLimitAccount(Account):
     """ An account with inflow/outflow limits linked to other accounts.
@@ -160,7 +159,7 @@ class LinkedLimitAccount(Account):
             raise AttributeError('Cannot set limit if link is None')
 
     def _process_link(
-            self, link, limit=None, default_factory=lambda: None):
+            self, link, limit=None, default_factory=Constant(None)):
         """ Convenience method for __init__ when processing inputs.
 
         Args:
@@ -219,7 +218,7 @@ class LinkedLimitAccount(Account):
                 linked accounts.
 
         Returns:
-            dict[Number, Money]: A time-series of transactions formed
+            TransactionSeries: A time-series of transactions formed
             by merging `transactions` (if provided) with the
             transactions mapped by any accounts of `group_transactions`
             (if provided) which are linked to this account.
@@ -229,16 +228,17 @@ class LinkedLimitAccount(Account):
             group_transactions = set()
 
         # We want to return `transactions`, but we don't want to mutate
-        # any of the inputs, so copy it first:
+        # any of the inputs, so copy it (into a series that can merge
+        # the other accounts' transactions in one pass each) first:
         if transactions is not None:
-            transactions = copy(transactions)
+            transactions = TransactionSeries(transactions)
         elif self in group_transactions:
             # If `transactions` isn't given, but this account is
             # represented in `group_transactions`, use that:
-            transactions = copy(group_transactions[self])
+            transactions = TransactionSeries(group_transactions[self])
         else:
-            # Otherwise, just start with a empty dict to fill later:
-            transactions = {}
+            # Otherwise, just start with a empty series to fill later:
+            transactions = TransactionSeries()
 
         # If this account isn't linked (for this type of inflow/outflow,
         # anyways), we're done:
@@ -250,11 +250,11 @@ class LinkedLimitAccount(Account):
         group = link.group - {self}
         for account in group:
             # Add the transactions already recorded against the account:
-            add_transactions(transactions, account.transactions)
+            transactions.add(account.transactions)
             # And add any additional transactions, if present in
             # `group_transactions`:
             if account in group_transactions:
-                add_transactions(transactions, group_transactions[account])
+                transactions.add(group_transactions[account])
         return transactions
 
     def max_inflows(
@@ -2,7 +2,7 @@
 
 import math
 from collections import namedtuple
-from forecaster.utility import when_conv
+from forecaster.utility import when_conv, identity
 
 
 FIELDS = ['min_inflow', 'max_inflow', 'min_outflow', 'max_outflow']
@@ -10,7 +10,7 @@ LimitTuple = namedtuple(
     'LimitTuple', FIELDS, defaults=(None,) * len(FIELDS))
 LimitTuple.__doc__ = (
     "A data container holding different values for min/max inflow/outfow")
-IDENTITY_FUNCTION = lambda x: x
+IDENTITY_FUNCTION = identity
 
 # Give an easy way for refactors to update references to LimitTuples:
 LIMIT_TUPLE_FIELDS = LimitTuple(*FIELDS)
@@ -150,6 +150,86 @@ def value_at_time(
         high_precision=high_precision)
 
 
+def growth_factor(t, rate, nper=1, *, high_precision=None, factors=None):
+    """ The accumulation function A(t), memoized in `factors`.
+
+    This is equivalent to `accumulation_function`, except that results
+    are stored in (and looked up from) `factors`, which is keyed by
+    `(rate, nper, t)`. Callers that repeatedly evaluate growth with
+    the same rate (e.g. an `Account` in a given year) can pass the
+    same dict to each call to avoid recomputing the exponent.
+
+    Args:
+        t (float, Decimal): Defines the period [0,t] over which the
+            accumulation will be calculated.
+        rate (float, Decimal): The rate of return (or interest).
+        nper (int): The number of compounding periods per year.
+        high_precision (Callable[[float], T]): A method that converts
+            `float` inputs to a high-precision type `T` (e.g. Decimal).
+            Optional.
+        factors (dict[tuple, float]): A table of previously-computed
+            growth factors. Updated in place. Optional.
+
+    Returns:
+        The accumulation A(t).
+    """
+    # pylint: disable=invalid-name
+    # `t` is the usual name for the input to A(t) in interest theory.
+    if factors is None:
+        return accumulation_function(
+            t, rate, nper, high_precision=high_precision)
+    key = (rate, nper, t)
+    try:
+        return factors[key]
+    except KeyError:
+        factor = accumulation_function(
+            t, rate, nper, high_precision=high_precision)
+        factors[key] = factor
+        return factor
+
+
+def future_value(
+        transactions, rate, time='end', nper=1, *,
+        high_precision=None, factors=None):
+    """ The total value at `time` of several transactions.
+
+    This is equivalent to summing `value_at_time(value, rate, when,
+    time)` over each `{when: value}` pair, except that `time` is
+    converted only once and growth factors can be shared between
+    calls via `factors` (see `growth_factor`).
+
+    Transactions that occur after `time` are ignored.
+
+    Args:
+        transactions (dict[float, float]): A mapping of
+            `{when: value}` pairs. Each `when` must already be a
+            numeric value (e.g. converted by `when_conv`).
+        rate (float, Decimal): The rate of growth.
+        time (float, Decimal, str): The time at which the total is to
+            be determined, expressed using `when_conv` syntax.
+        nper (int): The number of compounding periods per year.
+        high_precision (Callable[[float], T]): A method that converts
+            `float` inputs to a high-precision type `T` (e.g. Decimal).
+            Optional.
+        factors (dict[tuple, float]): A table of previously-computed
+            growth factors. Updated in place. Optional.
+
+    Returns:
+        The sum of the future values of `transactions` at `time`.
+    """
+    time = when_conv(time, high_precision=high_precision)
+    if high_precision is not None:
+        total = high_precision(0)
+    else:
+        total = 0
+    for when, value in transactions.items():
+        if when <= time:
+            total += value * growth_factor(
+                time - when, rate, nper,
+                high_precision=high_precision, factors=factors)
+    return total
+
+
 def time_to_value(rate, value_now, value_then, nper=1, *, high_precision=None):
     """ The time required to grow from one value to another.
 
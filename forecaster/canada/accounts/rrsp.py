@@ -2,7 +2,8 @@
 
 from forecaster.canada.accounts.registered_account import RegisteredAccount
 from forecaster.ledger import recorded_property
-from forecaster.utility import extend_inflation_adjusted, nearest_year
+from forecaster.utility import (
+    extend_inflation_adjusted, nearest_year, BracketTable)
 
 class RRSP(RegisteredAccount):
     """ A Registered Retirement Savings Plan (Canada). """
@@ -36,6 +37,8 @@ class RRSP(RegisteredAccount):
 
         self._rrif_conversion_year = None
         self.rrif_conversion_year = rrif_conversion_year
+        # Withholding tax rates for each year, compiled for fast lookup:
+        self._withholding_tables = {}
 
         # Convert RRSP_ACCRUAL_MAX values if operating in high-precision
         # mode.
@@ -157,14 +160,21 @@ class RRSP(RegisteredAccount):
             taxable_income
             * self.inflation_adjust(year, self.this_year)
         )
-        bracket = max(
-            (
-                bracket for bracket in tax_rates
-                if bracket < taxable_income_adjusted),
-            default=min(tax_rates.keys()))
-        tax_rate = self.precision_convert(tax_rates[bracket])
+        tax_rate = self.precision_convert(
+            self._withholding_table(year, tax_rates).lookup(
+                taxable_income_adjusted))
         return taxable_income * tax_rate
 
+    def _withholding_table(self, year, tax_rates):
+        """ Returns a `BracketTable` for `tax_rates`, reusing if able. """
+        # Rebuild the table if the constants have been replaced:
+        if (
+                year not in self._withholding_tables
+                or self._withholding_tables[year][0] is not tax_rates):
+            self._withholding_tables[year] = (
+                tax_rates, BracketTable(tax_rates))
+        return self._withholding_tables[year][1]
+
     @recorded_property
     def tax_deduction(self):
         """ The total sum of tax deductions available for the year.
@@ -1,5 +1,6 @@
 """ A module providing Canada-specific tax treatment. """
 
+import itertools
 from forecaster.tax import Tax, TaxMulti
 from forecaster.utility.precision import HighPrecisionOptional
 from forecaster.canada.accounts import RRSP
@@ -29,6 +30,7 @@ class TaxCanadaJurisdiction(Tax):
             inflation_adjust=inflation_adjustments,
             refund_timing=self.constants.TAX_REFUND_TIMING,
             payment_timing=self.constants.TAX_PAYMENT_TIMING,
+            high_precision=high_precision,
             **kwargs)
 
         self.jurisdiction = jurisdiction
@@ -73,19 +75,27 @@ class TaxCanadaJurisdiction(Tax):
         Returns:
             Money: The amount of the credit claimable by person in year.
         """
-        pension_income = abs(sum(
-            account.outflows() for account in person.accounts
-            if isinstance(account, RRSP)))
-            # NOTE: Other qualified pension income sources can be
-            # added here
         # Each jurisdiction has a maximum claimable amount for the
         # pension credit, so determine that (inflation-adjusted
         # amount) here:
-        deduction_max = extend_inflation_adjusted(
+        return min(
+            self._pension_income(person), self._pension_credit_max(year))
+
+    @staticmethod
+    def _pension_income(person):
+        """ The qualified pension income received by `person`. """
+        # NOTE: Other qualified pension income sources can be
+        # added here
+        return abs(sum(
+            account.outflows() for account in person.accounts
+            if isinstance(account, RRSP)))
+
+    def _pension_credit_max(self, year):
+        """ The maximum pension income credit claimable in `year`. """
+        return extend_inflation_adjusted(
             self.constants.TAX_PENSION_CREDIT[self.jurisdiction],
             self.inflation_adjust,
             year)
-        return min(pension_income, deduction_max)
 
     def _spousal_tax_credit(self, person, year):
         """ Determines the spousal tax credit amount claimable.
@@ -113,10 +123,7 @@ class TaxCanadaJurisdiction(Tax):
             return 0 # Money value
 
         # Determine the maximum claimable amount:
-        max_spousal_amount = extend_inflation_adjusted(
-            self.constants.TAX_SPOUSAL_AMOUNT[self.jurisdiction],
-            self.inflation_adjust,
-            year)
+        max_spousal_amount = self._spousal_amount_max(year)
 
         # We need to know the spouse's net income to assess the credit:
         # TODO: Pass in deductions for both spouses as args?
@@ -125,28 +132,107 @@ class TaxCanadaJurisdiction(Tax):
         spouse_net_income = (
             spouse.taxable_income - self.deduction(spouse, year))
 
-        # Figure out whether to assign the credit to this person or
-        # their spouse based on who has more income:
-
-        # If this is the lower-earner, use their spouse instead:
         person_net_income = (
             person.taxable_income - self.deduction(person, year))
-        if person_net_income < spouse_net_income:
+        return _spousal_credit(
+            person, person_net_income, spouse_net_income, max_spousal_amount)
+
+    def _spousal_amount_max(self, year):
+        """ The maximum spousal tax credit claimable in `year`. """
+        return extend_inflation_adjusted(
+            self.constants.TAX_SPOUSAL_AMOUNT[self.jurisdiction],
+            self.inflation_adjust,
+            year)
+
+    def credit_many(
+            self, person, year, net_incomes, pension_incomes=None,
+            **kwargs):
+        """ Finds the tax credits available to `person` in each scenario.
+
+        This applies the pension income credit and the spousal tax
+        credit, as `credit` does, but determines them from per-scenario
+        values. See `Tax.credit_many` for more.
+
+        Args:
+            person (Person): A person with some number of accounts
+                (or other tax sources).
+            year (int): The year in which money is expressed (used for
+                inflation adjustment)
+            net_incomes (dict[Person, list[Money]]): The taxable income
+                net of deductions of each person in each scenario. If
+                `person` has a spouse who isn't a key, the spouse's
+                actual net income is used for every scenario.
+            pension_incomes (dict[Person, Sequence[Money]]): The
+                qualified pension income (e.g. RRSP withdrawals) of
+                each person in each scenario. If `person` isn't a key,
+                their actual pension income is used for every scenario.
+                Optional.
+
+        Returns:
+            list[Money]: The tax credit available in this jurisdiction
+            for the person in each scenario.
+        """
+        # pylint: disable=arguments-differ
+        # Subclasses are expected to take additional keyword args.
+        credits_ = super().credit_many(person, year, net_incomes, **kwargs)
+        person_net_incomes = net_incomes[person]
+        num_scenarios = len(person_net_incomes)
+
+        # Apply the pension income tax credit for each scenario:
+        if pension_incomes is not None and person in pension_incomes:
+            person_pension_incomes = (
+                abs(income) for income in pension_incomes[person])
+        else:
+            person_pension_incomes = itertools.repeat(
+                self._pension_income(person), num_scenarios)
+        deduction_max = self._pension_credit_max(year)
+        credits_ = [
+            credit + min(pension_income, deduction_max)
+            for credit, pension_income
+            in zip(credits_, person_pension_incomes)]
+
+        # Apply the spousal tax credit if the person is married:
+        spouse = person.spouse
+        if spouse is None:
+            return credits_
+        if spouse in net_incomes:
+            spouse_net_incomes = net_incomes[spouse]
+        else:
+            spouse_net_incomes = itertools.repeat(
+                spouse.taxable_income - self.deduction(spouse, year),
+                num_scenarios)
+        max_spousal_amount = self._spousal_amount_max(year)
+        return [
+            credit + _spousal_credit(
+                person, person_net_income, spouse_net_income,
+                max_spousal_amount)
+            for credit, person_net_income, spouse_net_income
+            in zip(credits_, person_net_incomes, spouse_net_incomes)]
+
+
+def _spousal_credit(
+        person, person_net_income, spouse_net_income, max_spousal_amount):
+    """ The spousal tax credit claimable by `person` for given incomes.
+
+    The credit is assigned to the higher-earning partner. Where both
+    partners have the same income, it's assigned based on memory
+    location, so that exactly one partner claims it.
+    """
+    # If this is the lower-earner, use their spouse instead:
+    if person_net_income < spouse_net_income:
+        return 0 # Money value
+    # If their incomes are the same, use memory location to
+    # decide in a deterministic way:
+    if person_net_income == spouse_net_income:
+        if id(person) < id(person.spouse):
             return 0 # Money value
-        # If their incomes are the same, use memory location to
-        # decide in a deterministic way:
-        if person_net_income == spouse_net_income:
-            if id(person) < id(spouse):
-                return 0 # Money value
-
-        # The credit is determined by reducing the spousal amount
-        # by the spouse's (net) income, but in any event it's not
-        # negative.
-        credit = max(
-            max_spousal_amount - spouse_net_income,
-            0) # Money value
-
-        return credit
+
+    # The credit is determined by reducing the spousal amount
+    # by the spouse's (net) income, but in any event it's not
+    # negative.
+    return max(
+        max_spousal_amount - spouse_net_income,
+        0) # Money value
 
 
 class TaxCanada(TaxMulti, HighPrecisionOptional):
@@ -3,7 +3,8 @@
 # See forecaster.__init__.py for version, author, and licensing info.
 
 __all__ = [
-    'base', 'income', 'saving', 'withdrawal', 'tax']
+    'base', 'income', 'saving', 'withdrawal', 'tax', 'summary', 'vectorized',
+    'profiler']
 
 from forecaster.forecast.base import Forecast
 from forecaster.forecast.subforecast import SubForecast
@@ -12,3 +13,7 @@ from forecaster.forecast.living_expenses import LivingExpensesForecast
 from forecaster.forecast.saving import SavingForecast
 from forecaster.forecast.withdrawal import WithdrawalForecast
 from forecaster.forecast.tax import TaxForecast
+from forecaster.forecast.summary import ForecastSummary
+from forecaster.forecast.vectorized import VectorizedForecast, ForecastPath
+from forecaster.forecast.profiler import (
+    ForecastProfiler, ProfileRecord, ProfileEvent)
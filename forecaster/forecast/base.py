@@ -6,9 +6,11 @@ determine how account balances will grow or shrink year-over-year.
 """
 
 from collections import defaultdict
+from contextlib import nullcontext
 from forecaster.ledger import (
     Ledger, recorded_property, recorded_property_cached)
-from forecaster.utility import Timing, add_transactions
+from forecaster.utility import frozen_timing, add_transactions
+from forecaster.forecast.profiler import NEXT_YEAR
 
 class Forecast(Ledger):
     """ A financial forecast spanning multiple years.
@@ -113,7 +115,7 @@ class Forecast(Ledger):
     def __init__(
             self, income_forecast, living_expenses_forecast,
             saving_forecast, withdrawal_forecast,
-            tax_forecast, scenario, *, high_precision=None):
+            tax_forecast, scenario, *, profiler=None, high_precision=None):
         """ Constructs an instance of class Forecast.
 
         Args:
@@ -129,6 +131,9 @@ class Forecast(Ledger):
                 Determines taxes owed for the year.
             scenario (Scenario): Provides `initial_year` and `num_year`
                 properties.
+            profiler (ForecastProfiler): Records the time spent in each
+                `SubForecast` (and in `next_year`) for each year.
+                Optional.
         """
         # Recall that, as a Ledger object, we need to call the
         # superclass initializer and let it know what the first
@@ -145,6 +150,7 @@ class Forecast(Ledger):
         self.withdrawal_forecast = withdrawal_forecast
         self.tax_forecast = tax_forecast
         self.scenario = scenario
+        self.profiler = profiler
 
         # We'll keep track of cash flows over the course of the year, but
         # we don't save it as a recorded_property, so init it here:
@@ -186,10 +192,25 @@ class Forecast(Ledger):
     def call_subforecasts(self):
         """ Calls each SubForecast in order. """
         for forecast in self.forecasts:
-            forecast(self.available)
+            # If the subforecast has already been called this year, it
+            # will undo its transactions first. Profile that as an undo.
+            undone = forecast.call_invoked
+            with self._profile(type(forecast).__name__, undone=undone):
+                forecast(self.available)
+
+    def _profile(self, name, undone=False):
+        """ Profiles a step of the forecast, if there's a profiler. """
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.profile(self.this_year, name, undone=undone)
 
     def next_year(self):
         """ Adds a year to the forecast. """
+        with self._profile(NEXT_YEAR):
+            self._next_year()
+
+    def _next_year(self):
+        """ Adds a year to the forecast (without profiling). """
         # Store the values from this year that will be needed to
         # determine carryover amounts:
         available_previous = dict(self.available)
@@ -247,12 +268,12 @@ class Forecast(Ledger):
             if hasattr(self.tax_forecast, "tax_refund_timing"):
                 timing = self.tax_forecast.tax_refund_timing
             else:
-                timing = Timing(0, high_precision=self.high_precision)
+                timing = frozen_timing(0, high_precision=self.high_precision)
         elif tax_adjustment_previous < 0:  # payment owing
             if hasattr(self.tax_forecast, "tax_payment_timing"):
                 timing = self.tax_forecast.tax_payment_timing
             else:
-                timing = Timing(0, high_precision=self.high_precision)
+                timing = frozen_timing(0, high_precision=self.high_precision)
         else:  # no adjustment
             return  # No need to proceed on to add_transactions
         # Add the time-series of transactions to `available`:
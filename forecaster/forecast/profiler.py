@@ -0,0 +1,146 @@
+""" Provides opt-in instrumentation for `Forecast` objects. """
+
+import time
+from collections import defaultdict, namedtuple
+from contextlib import contextmanager
+
+# The name under which time spent in `Forecast.next_year` is recorded:
+NEXT_YEAR = 'next_year'
+
+# Passed to `ForecastProfiler.callback` each time a step is profiled:
+ProfileEvent = namedtuple('ProfileEvent', ['year', 'name', 'time', 'undone'])
+
+
+class ProfileRecord(object):
+    """ Aggregate measurements for one step of a forecast.
+
+    Attributes:
+        time (float): The total wall time spent in the step, in seconds.
+        calls (int): The number of times the step was run.
+        undos (int): The number of times the step had to undo its
+            previous transactions before running (i.e. the number of
+            re-runs within a single year).
+    """
+
+    def __init__(self, time=0.0, calls=0, undos=0):
+        """ Inits ProfileRecord. """
+        # pylint: disable=redefined-outer-name
+        # Using `time` as the name of an arg is clearer for callers.
+        self.time = time
+        self.calls = calls
+        self.undos = undos
+
+    def add(self, other):
+        """ Adds the measurements of `other` to this record. """
+        self.time += other.time
+        self.calls += other.calls
+        self.undos += other.undos
+
+    def as_dict(self):
+        """ Converts the record to a JSON-serializable dict. """
+        return {'time': self.time, 'calls': self.calls, 'undos': self.undos}
+
+    def __eq__(self, other):
+        if not isinstance(other, ProfileRecord):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
+    def __repr__(self):
+        return 'ProfileRecord(time={}, calls={}, undos={})'.format(
+            self.time, self.calls, self.undos)
+
+
+class ForecastProfiler(object):
+    """ Records how long each part of a `Forecast` takes to run.
+
+    Pass an instance to `Forecast` (or `Forecaster.run_forecast`) as
+    the `profiler` argument. Each call to a `SubForecast` (keyed by its
+    class name) and to `Forecast.next_year` (keyed by `NEXT_YEAR`) is
+    then timed and recorded against the year in which it ran.
+
+    Examples:
+        profiler = ForecastProfiler()
+        forecaster.run_forecast(people, accounts, debts, profiler=profiler)
+        profiler.totals()['SavingForecast'].time
+
+    Attributes:
+        callback (Callable[[ProfileEvent], None]): Called after each
+            step is profiled, e.g. to export measurements to another
+            system. Optional.
+        timer (Callable[[], float]): Returns the current time in
+            seconds. Defaults to `time.perf_counter`.
+        records (dict[int, dict[str, ProfileRecord]]): Measurements
+            for each step, keyed by year and then by step name.
+    """
+
+    def __init__(self, callback=None, timer=None):
+        """ Inits ForecastProfiler. """
+        if timer is None:
+            timer = time.perf_counter
+        self.callback = callback
+        self.timer = timer
+        self.records = defaultdict(dict)
+
+    @contextmanager
+    def profile(self, year, name, undone=False):
+        """ Times the body of a `with` statement.
+
+        Args:
+            year (int): The year in which the step runs.
+            name (str): The name of the step, e.g. `'IncomeForecast'`.
+            undone (bool): Whether running the step will undo its
+                previous transactions for `year`.
+        """
+        start = self.timer()
+        try:
+            yield
+        finally:
+            self.record(year, name, self.timer() - start, undone=undone)
+
+    def record(self, year, name, elapsed, undone=False):
+        """ Records a single run of a step that took `elapsed` seconds. """
+        year_records = self.records[year]
+        if name not in year_records:
+            year_records[name] = ProfileRecord()
+        year_records[name].add(
+            ProfileRecord(time=elapsed, calls=1, undos=int(undone)))
+        if self.callback is not None:
+            self.callback(ProfileEvent(year, name, elapsed, undone))
+
+    def totals(self):
+        """ Aggregates measurements across all years.
+
+        Returns:
+            dict[str, ProfileRecord]: Measurements for each step,
+            summed over all years.
+        """
+        totals = {}
+        for year_records in self.records.values():
+            for name, record in year_records.items():
+                if name not in totals:
+                    totals[name] = ProfileRecord()
+                totals[name].add(record)
+        return totals
+
+    def report(self):
+        """ Returns all measurements as JSON-serializable dicts.
+
+        Returns:
+            dict[str, dict]: A dict with a `'years'` key, which maps
+            each year to a dict of `ProfileRecord.as_dict` values keyed
+            by step name, and a `'totals'` key with the same structure
+            as each year (see `totals`).
+        """
+        return {
+            'years': {
+                year: {
+                    name: record.as_dict()
+                    for (name, record) in year_records.items()}
+                for (year, year_records) in sorted(self.records.items())},
+            'totals': {
+                name: record.as_dict()
+                for (name, record) in self.totals().items()}}
+
+    def clear(self):
+        """ Discards all measurements. """
+        self.records.clear()
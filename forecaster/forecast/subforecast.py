@@ -1,10 +1,13 @@
 """ A module providing a base class for SubForecast objects. """
 
+from bisect import bisect_left
 from collections import defaultdict
 from collections.abc import Hashable
 from forecaster.ledger import Ledger, recorded_property
 from forecaster.accounts import Account
-from forecaster.utility import Timing
+from forecaster.utility import (
+    Timing, TransactionSeries, frozen_timing, when_conv,
+    add_transactions, subtract_transactions)
 
 class TransactionDict(defaultdict):
     """ A defaultdict that accepts unhashable keys.
@@ -114,7 +117,7 @@ class SubForecast(Ledger):
 
     Attributes:
         transactions (TransactionDict[
-            Union[Account, dict]: defaultdict[float, float]):
+            Union[Account, dict]: TransactionSeries):
             A record of transactions to/from various accounts.
             An account does not have to be a formal `Account`
             object; it can be any `Mapping`, like a `dict`.
@@ -125,6 +128,9 @@ class SubForecast(Ledger):
             account and negative values are outflows.
 
             This dict includes transactions made to/from `available`.
+        call_invoked (bool): Whether this subforecast has been called
+            this year (and not since undone). If so, calling it again
+            will first undo its earlier transactions.
     """
 
     def __init__(
@@ -136,7 +142,7 @@ class SubForecast(Ledger):
         # Use default Timing (i.e. lump sum contributions at the
         # midpoint of the year) if none is explicitly provided:
         if default_timing is None:
-            self.default_timing = Timing(high_precision=high_precision)
+            self.default_timing = frozen_timing(high_precision=high_precision)
         else:
             self.default_timing = default_timing
         # We store transactions to/from each account so that we can
@@ -146,7 +152,7 @@ class SubForecast(Ledger):
         # we use a custom subclass of defaultdict that allows
         # non-hashable keys.
         self._transactions = TransactionDict(
-            lambda: defaultdict(lambda: 0)) # Money value
+            TransactionSeries) # Money value
         # If the subforecast is called more than once, we
         # may want to do some unwinding. Use this to track
         # whether this subforecast has been called before:
@@ -158,6 +164,11 @@ class SubForecast(Ledger):
         """ `TransactionDict` tracking transactions to/from accounts. """
         return self._transactions
 
+    @property
+    def call_invoked(self):
+        """ Whether this subforecast has been called this year. """
+        return self._call_invoked
+
     def next_year(self):
         """ Adds a year to the forecast.
 
@@ -226,6 +237,14 @@ class SubForecast(Ledger):
         `from_account` to `to_account` using the same semantics as
         `add_transaction`.
 
+        Transactions are recorded in bulk when they all flow the same
+        way and their timings don't depend on an `Account`'s balance
+        (i.e. if `strict_timing` is True or the account they're drawn
+        from is a plain mapping). Transactions drawn from an `Account`
+        with flexible timing are not batched; they're added one at a
+        time, since each withdrawal can change the account's growth and
+        withdrawal limits (and so its `max_outflow`) at later times.
+
         Args:
             transactions (dict[float, float]): The timings and values
                 of the transactions. Positive for inflows, negative for
@@ -240,12 +259,66 @@ class SubForecast(Ledger):
                 later than `when` if this avoids putting accounts in
                 a negative balance. If True, `when` is always used.
         """
+        # When every transaction flows the same way, and the account
+        # they're drawn from is a plain mapping (or timings aren't
+        # shifted), all of the shifts can be found in one pass and the
+        # results recorded in one step:
+        if self._add_transactions_batch(
+                transactions, from_account, to_account, strict_timing):
+            return
         for when, value in transactions.items():
             self.add_transaction(
                 value=value, timing=when,
                 from_account=from_account, to_account=to_account,
                 strict_timing=strict_timing)
 
+    def _add_transactions_batch(
+            self, transactions, from_account, to_account, strict_timing):
+        """ Bulk path for `add_transactions`.
+
+        Returns:
+            bool: True if the transactions were recorded, False if they
+            need to be added one at a time instead. That's the case if
+            they have mixed signs (so that money flows both ways) or if
+            their timings would be shifted based on an `Account`.
+
+        `Account` sources aren't batched: growth and withdrawal limits
+        mean that a withdrawal can change an `Account`'s `max_outflow`
+        at later times by more than its value, so each shift depends
+        on the account being updated with every previous transaction.
+        """
+        if all(value >= 0 for value in transactions.values()):
+            withdrawals = transactions
+        elif all(value <= 0 for value in transactions.values()):
+            # Money flows the other way, so swap accounts:
+            from_account, to_account = to_account, from_account
+            withdrawals = {
+                when: -value for when, value in transactions.items()}
+        else:
+            return False
+        # Convert `when` inputs as `add_transaction` would:
+        withdrawals = {
+            when_conv(when, high_precision=self.high_precision): value
+            for when, value in withdrawals.items()}
+        if from_account is None or strict_timing:
+            shifted = withdrawals.items()
+        elif isinstance(from_account, Account):
+            return False
+        else:
+            shifted = self._shift_whens(withdrawals, from_account)
+        # Combine transactions shifted to the same time, then record
+        # them all against each account at once:
+        series = TransactionSeries()
+        for when, value in shifted:
+            series[when] += value
+        if from_account is not None:
+            subtract_transactions(from_account, series)
+        subtract_transactions(self.transactions[from_account], series)
+        if to_account is not None:
+            add_transactions(to_account, series)
+        add_transactions(self.transactions[to_account], series)
+        return True
+
     def add_transaction(
             self, value, timing=None,
             from_account=None, to_account=None,
@@ -312,12 +385,12 @@ class SubForecast(Ledger):
             value = -value
 
         # (Normalize weights just in case client code was naughty and
-        # didn't do that for us...)
-        total_weight = sum(timing.values())
+        # didn't do that for us. `FrozenTiming` objects have their
+        # normalized weights precomputed, so this is cheap for them.)
         # Add a transaction at each timing, with a transaction value
         # proportionate to the (normalized) weight for its timing:
-        for when, weight in timing.items():
-            weighted_value = value * (weight / total_weight)
+        for when, weight in timing.normalized_items():
+            weighted_value = value * weight
             self._add_transaction(
                 value=weighted_value, when=when,
                 from_account=from_account, to_account=to_account,
@@ -383,26 +456,64 @@ class SubForecast(Ledger):
             # For non-Accounts, use generic dict interface to add up
             # transactions, assuming no growth rate or other
             # Account-specific features.
-            keys = account.keys() | {when}  # Always include `when`
-            accum = {
-                t: sum(
-                    # For each point in time `t`, find the sum of all
-                    # transactions up to this point:
-                    account[r] for r in account if r <= t)
-                   # Exclude times before `when`:
-                for t in keys if t >= when}
-
-        # Find the points in time where subtracting `value`
-        # would not put any future point in time into negative
-        # balance.
-        eligible_times = (
-            t for t in accum if all(
-                accum[r] >= value for r in accum if r >= t))
-
-        # Find the earliest valid time (or, if none exists,
-        # use `when`)
-        min_time = min(eligible_times, default=when)
-        return min_time
+            accum = _accum_mapping(account, when)
+        # Find the earliest valid time (or, if none exists, use `when`)
+        return _earliest_eligible(accum, value, default=when)
+
+    @staticmethod
+    def _shift_whens(transactions, account):
+        """ Shifts the timings of several withdrawals at once.
+
+        This is equivalent to calling `_shift_when` for each
+        transaction in turn and recording each withdrawal against
+        `account` before shifting the next one, except that `account`
+        isn't mutated and its balances are accumulated only once.
+
+        This only supports non-`Account` mappings (e.g. `available`).
+        For `Account` objects, growth and withdrawal limits mean that
+        a withdrawal can change `max_outflow` by more than its value,
+        so use `_shift_when` after recording each transaction instead.
+
+        Args:
+            transactions (dict[float, float]): Withdrawals (as positive
+                values) from `account`, as `{when: value}` pairs.
+            account (dict[float, float]): The time-series of
+                transactions that `transactions` are withdrawn from.
+
+        Returns:
+            list[tuple[float, float]]: `(when, value)` pairs for each
+            transaction, in the order of `transactions`, with `when`
+            shifted as `_shift_when` would.
+        """
+        # Every input timing is a candidate, so include them all (and
+        # the balance up to each) in a single sorted pass:
+        times = sorted(account.keys() | transactions.keys())
+        balances = []
+        total = 0
+        for time in times:
+            if time in account:
+                total += account[time]
+            balances.append(total)
+        # Track the suffix minima of `balances` (which change as each
+        # withdrawal is recorded) so that each shift takes log time:
+        suffix_mins = _SuffixMins(balances)
+        result = []
+        for when, value in transactions.items():
+            start = bisect_left(times, when)
+            # The earliest eligible time follows the last time with a
+            # balance less than `value`. If that's the last time, no
+            # time is eligible, so `when` is used:
+            below = suffix_mins.last_below(value, start)
+            if below is None:
+                index = start
+            elif below + 1 < len(times):
+                index = below + 1
+            else:
+                index = start
+            # Record the withdrawal so later transactions see it:
+            suffix_mins.subtract(value, index)
+            result.append((times[index], value))
+        return result
 
     @staticmethod
     def _accum_account(account, when, target_value=None):
@@ -427,11 +538,12 @@ class SubForecast(Ledger):
         """
         keys = account.keys() | {when}  # Always include `when`
         # Use Account logic to determine how much is available at the
-        # time of each existing transaction and also at `when`:
+        # time of each existing transaction and also at `when`.
+        # (This walks the account's transactions just once.)
         accum = {
-            t: -account.max_outflow(t)
-               # Exclude times before `when`:
-            for t in keys if t >= when
+            t: -outflow for t, outflow in account.max_outflow_curve(
+                # Exclude times before `when`:
+                t for t in keys if t >= when).items()
         }
         # Try to interpolate times where we achieve the desired
         # value, if that value is known:
@@ -472,3 +584,129 @@ class SubForecast(Ledger):
                     if time > earlier and time < later:
                         accum[time] = -sum(account.max_outflows(time).values())
         return accum
+
+def _accum_mapping(account, when):
+    """ Sums `account`'s transactions up to each time at/after `when`.
+
+    Returns:
+        dict[float, float]: The cumulative sum of all transactions in
+        `account` at or before each time, for each time in `account`
+        at or after `when`, plus `when` itself. Ordered by time.
+    """
+    accum = {}
+    total = 0
+    for time in sorted(account.keys() | {when}):  # Always include `when`
+        # Don't look up `when` if it's missing; `account` may be a
+        # defaultdict-like mapping that would insert it:
+        if time in account:
+            total += account[time]
+        # Exclude times before `when`:
+        if time >= when:
+            accum[time] = total
+    return accum
+
+def _earliest_eligible(accum, value, default=None):
+    """ The earliest time from which `value` can be withdrawn.
+
+    A time is eligible if withdrawing `value` then wouldn't put any
+    time at or after it into a negative balance, i.e. if the minimum of
+    `accum` over all later times is at least `value`. That minimum only
+    grows as time advances, so the eligible times are all of the times
+    after some cutoff, which one backwards pass can find.
+
+    Args:
+        accum (dict[float, float]): The amount available at each time.
+        value (float): The amount to be withdrawn.
+        default (float): The value to return if no time is eligible.
+
+    Returns:
+        float: The earliest eligible time in `accum`, or `default`.
+    """
+    earliest = default
+    suffix_min = None
+    for time in sorted(accum, reverse=True):
+        if suffix_min is None or accum[time] < suffix_min:
+            suffix_min = accum[time]
+        if suffix_min < value:
+            break
+        earliest = time
+    return earliest
+
+
+class _SuffixMins:
+    """ Finds low balances in a time-series that withdrawals can reduce.
+
+    This is a segment tree over `balances` which stores the minimum of
+    each node's range of balances. A withdrawal reduces every balance
+    from some index onward, which only changes the nodes that span
+    that index, so both operations take `O(log n)` time.
+
+    Args:
+        balances (list[float]): Balances at a sequence of times.
+    """
+
+    def __init__(self, balances):
+        self.size = len(balances)
+        # `mins[node]` is the lowest balance in that node's range, net
+        # of amounts subtracted from the whole range of any ancestor
+        # (which are stored in the ancestor's `deltas` entry instead):
+        self.mins = [0] * (4 * self.size)
+        self.deltas = [0] * (4 * self.size)
+        if balances:
+            self._build(balances, 1, 0, self.size - 1)
+
+    def _build(self, balances, node, low, high):
+        """ Fills in `mins` for `node`, spanning `low` to `high`. """
+        if low == high:
+            self.mins[node] = balances[low]
+            return
+        mid = (low + high) // 2
+        self._build(balances, 2 * node, low, mid)
+        self._build(balances, 2 * node + 1, mid + 1, high)
+        self.mins[node] = min(self.mins[2 * node], self.mins[2 * node + 1])
+
+    def subtract(self, value, start):
+        """ Subtracts `value` from each balance at or after `start`. """
+        self._subtract(value, start, 1, 0, self.size - 1)
+
+    def _subtract(self, value, start, node, low, high):
+        """ Recursive helper for `subtract`. """
+        if high < start:
+            return
+        if low >= start:
+            self.mins[node] -= value
+            self.deltas[node] -= value
+            return
+        mid = (low + high) // 2
+        self._subtract(value, start, 2 * node, low, mid)
+        self._subtract(value, start, 2 * node + 1, mid + 1, high)
+        self.mins[node] = (
+            min(self.mins[2 * node], self.mins[2 * node + 1])
+            + self.deltas[node])
+
+    def last_below(self, value, start):
+        """ The last index at/after `start` with a balance below `value`.
+
+        Returns:
+            int: The index, or `None` if there's no such index.
+        """
+        return self._last_below(value, start, 1, 0, self.size - 1, 0)
+
+    def _last_below(self, value, start, node, low, high, delta):
+        """ Recursive helper for `last_below`.
+
+        `delta` is the sum of `deltas` for the ancestors of `node`.
+        """
+        if high < start or self.mins[node] + delta >= value:
+            return None
+        if low == high:
+            return low
+        delta += self.deltas[node]
+        mid = (low + high) // 2
+        # Search the later half first, since we want the last index:
+        index = self._last_below(
+            value, start, 2 * node + 1, mid + 1, high, delta)
+        if index is None:
+            index = self._last_below(
+                value, start, 2 * node, low, mid, delta)
+        return index
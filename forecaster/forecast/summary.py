@@ -0,0 +1,190 @@
+""" Provides a ForecastSummary class for aggregating many forecasts.
+
+`ForecastSummary` is intended for Monte Carlo-style analysis, where
+many `Forecast` objects are generated (e.g. one per sampled
+`Scenario`) and only the distribution of their results is of interest.
+"""
+
+from collections import defaultdict
+from math import floor
+from forecaster.utility.precision import HighPrecisionOptional
+
+# The `Forecast` recorded properties summarized by default:
+SUMMARY_FIELDS = ('principal', 'withdrawals', 'tax')
+# The percentiles reported by default:
+SUMMARY_PERCENTILES = (5, 25, 50, 75, 95)
+
+class ForecastSummary(HighPrecisionOptional):
+    """ Aggregated per-year results of many `Forecast` objects.
+
+    `Forecast` objects are added to the summary via `add`. Only the
+    per-year values of the summarized fields are retained; the
+    `Forecast` objects themselves are not, so client code can discard
+    each `Forecast` once it has been added.
+
+    A forecast is considered to be *depleted* in the first year in
+    which its principal is zero or negative after having been positive
+    in some earlier year (i.e. the plannees have run out of savings).
+
+    Examples:
+        ```
+        summary = ForecastSummary()
+        for scenario in scenarios:
+            summary.add(forecaster.run_forecast(people, accounts, debts))
+        summary.percentiles('principal')  # {5: {2000: ...}, ...}
+        summary.depletion_probability()  # {2000: 0.0, ...}
+        ```
+
+    Arguments:
+        fields (Iterable[str]): The names of the `Forecast` recorded
+            properties to summarize (e.g. `'principal'`). Optional.
+            Defaults to `SUMMARY_FIELDS`.
+
+    Attributes:
+        fields (tuple[str]): The names of the summarized `Forecast`
+            recorded properties.
+        num_forecasts (int): The number of forecasts summarized.
+        values (dict[str, dict[int, list[Number]]]): The values of each
+            field for each year, for all summarized forecasts.
+        depletion_years (dict[int, int]): The number of summarized
+            forecasts that became depleted in each year.
+    """
+
+    def __init__(self, fields=None, *, high_precision=None):
+        """ Initializes an instance of ForecastSummary. """
+        super().__init__(high_precision=high_precision)
+        if fields is None:
+            fields = SUMMARY_FIELDS
+        self.fields = tuple(fields)
+        self.num_forecasts = 0
+        self.values = {field: defaultdict(list) for field in self.fields}
+        self.depletion_years = defaultdict(int)
+
+    @property
+    def years(self):
+        """ The years for which values have been recorded. """
+        return sorted(set().union(
+            *(values.keys() for values in self.values.values())))
+
+    def add(self, forecast):
+        """ Adds the results of a `Forecast` to the summary.
+
+        Arguments:
+            forecast (Forecast): A forecast with `*_history` attributes
+                for each of the summarized fields.
+        """
+        for field in self.fields:
+            history = getattr(forecast, field + '_history')
+            for year, value in history.items():
+                self.values[field][year].append(value)
+        depletion_year = self._depletion_year(forecast.principal_history)
+        if depletion_year is not None:
+            self.depletion_years[depletion_year] += 1
+        self.num_forecasts += 1
+
+    def merge(self, other):
+        """ Adds the results recorded by another summary to this one.
+
+        Arguments:
+            other (ForecastSummary): A summary of the same fields.
+
+        Raises:
+            ValueError: `other` summarizes different fields.
+        """
+        if other.fields != self.fields:
+            raise ValueError(
+                'ForecastSummary: cannot merge summaries of different fields.')
+        for field in self.fields:
+            for year, values in other.values[field].items():
+                self.values[field][year].extend(values)
+        for year, count in other.depletion_years.items():
+            self.depletion_years[year] += count
+        self.num_forecasts += other.num_forecasts
+
+    def percentile(self, field, percent):
+        """ The given percentile of a field for each year.
+
+        Percentiles are linearly interpolated between the two nearest
+        values, as with the "linear" method of most statistics packages.
+
+        Arguments:
+            field (str): The name of a summarized field.
+            percent (Number): A percentile in the range [0, 100].
+
+        Returns:
+            dict[int, Number]: The value of the percentile for each year.
+
+        Raises:
+            ValueError: `percent` is not in the range [0, 100].
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError(
+                'ForecastSummary: percent must be in the range [0, 100].')
+        return {
+            year: self._interpolate(sorted(values), percent)
+            for year, values in sorted(self.values[field].items())}
+
+    def percentiles(self, field, percents=None):
+        """ Several percentiles of a field for each year.
+
+        Arguments:
+            field (str): The name of a summarized field.
+            percents (Iterable[Number]): Percentiles in the range
+                [0, 100]. Optional. Defaults to `SUMMARY_PERCENTILES`.
+
+        Returns:
+            dict[Number, dict[int, Number]]: A mapping of each of
+            `percents` to the value of that percentile for each year.
+        """
+        if percents is None:
+            percents = SUMMARY_PERCENTILES
+        # Sort each year's values once, not once per percentile:
+        sorted_values = {
+            year: sorted(values)
+            for year, values in sorted(self.values[field].items())}
+        for percent in percents:
+            if not 0 <= percent <= 100:
+                raise ValueError(
+                    'ForecastSummary: percent must be in the range [0, 100].')
+        return {
+            percent: {
+                year: self._interpolate(values, percent)
+                for year, values in sorted_values.items()}
+            for percent in percents}
+
+    def depletion_probability(self):
+        """ The probability of depletion by each year.
+
+        Returns:
+            dict[int, float]: A mapping of each year to the proportion
+            of summarized forecasts that were depleted in or before
+            that year.
+        """
+        probabilities = {}
+        depleted = 0
+        for year in self.years:
+            depleted += self.depletion_years.get(year, 0)
+            probabilities[year] = depleted / self.num_forecasts
+        return probabilities
+
+    def _interpolate(self, values, percent):
+        """ Linearly interpolates `percent` over sorted `values`. """
+        rank = (len(values) - 1) * percent / 100
+        lower = floor(rank)
+        fraction = rank - lower
+        if fraction == 0:
+            return values[lower]
+        return values[lower] + (
+            (values[lower + 1] - values[lower])
+            * self.precision_convert(fraction))
+
+    @staticmethod
+    def _depletion_year(principal_history):
+        """ The first year principal runs out, or None if it doesn't. """
+        funded = False
+        for year, principal in sorted(principal_history.items()):
+            if principal > 0:
+                funded = True
+            elif funded:
+                return year
+        return None
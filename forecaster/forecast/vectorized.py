@@ -0,0 +1,538 @@
+""" Provides a VectorizedForecast class for forecasting many scenarios.
+
+`Forecast` builds (and mutates) a full graph of `Ledger` objects for
+each scenario, and allocates transactions to accounts by solving a
+flow problem for each subforecast in each year. That's flexible, but
+it's far too slow for Monte Carlo analysis over many thousands of
+sampled scenarios.
+
+`VectorizedForecast` advances all scenarios at once, year by year, for
+a restricted set of simple portfolios. Values that don't depend on the
+scenario (like the plannees' income) are calculated just once. Values
+that do (like account balances) are stored in columns of floats, with
+one element per scenario.
+"""
+
+from array import array
+from itertools import compress
+from math import inf
+from operator import add, lt, sub
+from forecaster.accounts import Account
+from forecaster.accounts.util import accumulation_function
+from forecaster.forecast.summary import ForecastSummary
+from forecaster.ledger import fork
+from forecaster.tax import Tax
+from forecaster.utility.timing import Timing
+
+# Flows smaller than this are ignored (as with `TransactionTraversal`):
+EPSILON = 1e-5
+
+# The recorded properties of `Forecast` that `VectorizedForecast` also
+# provides (as `*_history` dicts of columns):
+VECTORIZED_FIELDS = (
+    'income', 'living_expenses', 'savings', 'principal', 'withdrawals',
+    'tax')
+
+# Living expenses strategies that depend on account balances (which
+# differ between scenarios) and so can't be vectorized:
+UNSUPPORTED_STRATEGIES = frozenset(('Percentage of principal at retirement',))
+
+class ForecastPath(object):
+    """ The results of a `VectorizedForecast` for a single scenario.
+
+    This provides the same `*_history` attributes as a `Forecast` (for
+    each of `VECTORIZED_FIELDS`), so it can be passed to code like
+    `ForecastSummary.add` which expects a `Forecast`.
+    """
+
+    # This is a simple record type.
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, forecast, index):
+        """ Inits ForecastPath from column `index` of `forecast`. """
+        for field in VECTORIZED_FIELDS:
+            columns = getattr(forecast, field + '_history')
+            setattr(
+                self, field + '_history',
+                {year: column[index] for year, column in columns.items()})
+
+class VectorizedForecast(object):
+    """ A financial forecast of many scenarios, advanced in lockstep.
+
+    This models the same annual cashflows as `Forecast`, but only for
+    simple portfolios:
+
+    * A single plain `Account` (not a subclass), no other accounts
+      owned by the plannees, and no debts.
+    * A plain `Tax` (not a subclass) tax treatment.
+    * A living expenses strategy that doesn't depend on the balance of
+      any account (see `UNSUPPORTED_STRATEGIES`).
+
+    Within these limits, results match those of `Forecast` (up to the
+    precision of `TransactionTraversal`, which `Forecast` uses to
+    allocate transactions) for as long as the account can fund any
+    withdrawals. The saving and withdrawal strategies aren't needed;
+    all surplus cash is contributed to the account and all shortfalls
+    are withdrawn from it.
+
+    With several plannees, `Forecast` may defer some payments (e.g. of
+    living expenses) depending on the (arbitrary) order in which the
+    plannees are iterated over. This can lead to small differences in
+    account growth if a plannee's cashflows go negative mid-year.
+
+    Values are calculated as floats, even if the inputs are
+    high-precision types.
+
+    Each of `VECTORIZED_FIELDS` has a `*_history` attribute (as with
+    `Forecast`), but each value is an `array` of floats with one
+    element per scenario (in the order of `living_expenses_strategies`)
+    rather than a scalar.
+
+    Examples:
+        ```
+        forecast = VectorizedForecast(
+            people, accounts, debts, scenarios,
+            living_expenses_strategies, tax_treatments)
+        forecast.principal_history[2000][0]  # principal for scenario 0
+        forecast.summary().percentile('principal', 50)
+        ```
+
+    Args:
+        people (set[Person]): The plannees. These are copied, not
+            mutated.
+        accounts (set[Account]): The plannees' accounts. These are
+            copied, not mutated.
+        debts (set[Debt]): The plannees' debts. Must be empty.
+        scenarios (Sequence[Scenario]): The scenario for each forecast.
+            All must span the same years.
+        living_expenses_strategies (Sequence[LivingExpensesStrategy]):
+            The living expenses strategy for each scenario.
+        tax_treatments (Sequence[Tax]): The tax treatment for each
+            scenario.
+
+    Attributes:
+        num_scenarios (int): The number of scenarios forecast.
+        years (range): The years of the forecast.
+
+    Raises:
+        ValueError: The inputs describe a portfolio that isn't
+            supported, or the scenarios span different years.
+    """
+
+    # pylint: disable=too-many-arguments
+    # All of these args are required to describe each scenario.
+    def __init__(
+            self, people, accounts, debts, scenarios,
+            living_expenses_strategies, tax_treatments):
+        """ Inits VectorizedForecast and runs the forecast. """
+        # pylint: enable=too-many-arguments
+        self._check_supported(
+            people, accounts, debts, living_expenses_strategies,
+            tax_treatments)
+        if len({
+                (scenario.initial_year, scenario.num_years)
+                for scenario in scenarios}) != 1:
+            raise ValueError(
+                'VectorizedForecast: scenarios must span the same years.')
+        if not (
+                len(scenarios) == len(living_expenses_strategies)
+                == len(tax_treatments)):
+            raise ValueError(
+                'VectorizedForecast: each scenario requires a living '
+                + 'expenses strategy and tax treatment.')
+
+        # Copy `people` and `accounts` together to preserve ownership:
+        copy_memo = {}
+        self.people = fork(people, memo=copy_memo)
+        self.account = next(iter(fork(accounts, memo=copy_memo)))
+        self.living_expenses_strategies = living_expenses_strategies
+        self.tax_treatments = tax_treatments
+        self.num_scenarios = len(scenarios)
+        self.years = range(
+            scenarios[0].initial_year, max(scenarios[0]) + 1)
+        # Scenarios that share a tax treatment are taxed together:
+        self._taxes = {}
+        for index, tax in enumerate(tax_treatments):
+            self._taxes.setdefault(tax, []).append(index)
+
+        for field in VECTORIZED_FIELDS:
+            setattr(self, field + '_history', {})
+
+        self._run()
+
+    @staticmethod
+    def _check_supported(
+            people, accounts, debts, living_expenses_strategies,
+            tax_treatments):
+        """ Raises ValueError if the inputs can't be vectorized. """
+        # pylint: disable=unidiomatic-typecheck
+        # Subclasses of `Account` and `Tax` aren't supported, so we
+        # need to check the exact types here.
+        if len(accounts) != 1 or type(next(iter(accounts))) is not Account:
+            raise ValueError(
+                'VectorizedForecast: exactly one plain Account is required.')
+        if any(person.accounts - set(accounts) for person in people):
+            raise ValueError(
+                'VectorizedForecast: people must not own other accounts.')
+        if debts:
+            raise ValueError('VectorizedForecast: debts are not supported.')
+        if any(type(tax) is not Tax for tax in tax_treatments):
+            raise ValueError(
+                'VectorizedForecast: only plain Tax treatments are supported.')
+        if any(
+                strategy.strategy in UNSUPPORTED_STRATEGIES
+                for strategy in living_expenses_strategies):
+            raise ValueError(
+                'VectorizedForecast: living expenses strategy not supported.')
+
+    def _run(self):
+        """ Forecasts each year for all scenarios. """
+        num = self.num_scenarios
+        # Per-scenario state carried over between years:
+        balance = array('d', [float(self.account.balance)]) * num
+        carryover = array('d', [0.0]) * num
+        adjustment = array('d', [0.0]) * num
+        retirement_year = min(
+            person.retirement_date.year for person in self.people)
+
+        for year in self.years:
+            # Advance the (shared) people to this year:
+            for person in self.people:
+                while person.this_year < year:
+                    person.next_year()
+            # Income doesn't depend on the scenario:
+            net_income = {
+                person: float(person.net_income) for person in self.people}
+            gross_income = {
+                person: float(person.gross_income) for person in self.people}
+            total_income = sum(net_income.values())
+            withheld = sum(
+                float(person.tax_withheld) for person in self.people)
+            # Living expenses are incurred as income is received, in
+            # proportion to each person's share of net income:
+            income_weights = {
+                person: (
+                    net_income[person] / total_income if total_income
+                    else 1 / len(self.people))
+                for person in self.people}
+            living_expenses = array('d', (
+                float(strategy(
+                    year=year, people=self.people,
+                    retirement_year=retirement_year))
+                for strategy in self.living_expenses_strategies))
+
+            times, available = self._available(
+                carryover, adjustment, net_income, income_weights,
+                living_expenses)
+            # Growth from each timing to year-end is the same for
+            # every scenario, so find it just once:
+            rate = self.account.rate_callable(year)
+            nper = self.account.nper
+            growth = {
+                when: accumulation_function(1 - when, rate, nper)
+                for when in times}
+            end_balance, returns, shortfall = self._transactions(
+                times, available, balance, growth,
+                accumulation_function(1, rate, nper))
+            tax = self._tax_owing(year, gross_income, returns)
+
+            columns = {
+                'income': array('d', [total_income]) * num,
+                'living_expenses': living_expenses,
+                'savings': array('d', (
+                    max(total_income - value, 0)
+                    for value in living_expenses)),
+                'principal': balance,
+                'withdrawals': array('d', (-value for value in shortfall)),
+                'tax': tax}
+            for field, column in columns.items():
+                getattr(self, field + '_history')[year] = column
+
+            balance = end_balance
+            carryover = shortfall
+            adjustment = array('d', (withheld - value for value in tax))
+
+    # pylint: disable=too-many-arguments
+    # These are all of the cashflows that make up `available`.
+    def _available(
+            self, carryover, adjustment, net_income, income_weights,
+            living_expenses):
+        """ Builds the cashflows available for saving in a year.
+
+        Cashflows occur at the same timings in every scenario (or are
+        $0, which doesn't affect any results), so these timings are
+        found once. The amounts at each timing are stored in a column
+        with one element per scenario.
+
+        Returns:
+            tuple[list[float], list[array]]: The timings of the
+            cashflows, in ascending order, and a column of amounts for
+            each timing.
+        """
+        # pylint: enable=too-many-arguments
+        num = self.num_scenarios
+        times = {0}
+        for person in self.people:
+            times.update(person.payment_timing)
+        tax_times = set()
+        for tax in self._taxes:
+            tax_times.update(tax.refund_timing)
+            tax_times.update(tax.payment_timing)
+        times = sorted(times | tax_times)
+        index = {when: i for i, when in enumerate(times)}
+        columns = [array('d', [0.0]) * num for _ in times]
+
+        # Money left over from last year arrives at the start of the
+        # year (as in `Forecast`):
+        columns[index[0]] = array('d', carryover)
+        # Tax refunds/payments for last year's taxes. (Tax timings are
+        # `FrozenTiming` objects, so equal timings share weights.)
+        weights = {}
+        for tax in self._taxes:
+            for timing in (tax.refund_timing, tax.payment_timing):
+                if timing not in weights:
+                    normalized = dict(timing.normalized_items())
+                    weights[timing] = [
+                        float(normalized.get(when, 0)) for when in times]
+        scenario_weights = [
+            weights[tax.refund_timing if value > 0 else tax.payment_timing]
+            for tax, value in zip(self.tax_treatments, adjustment)]
+        for k in sorted({index[when] for when in tax_times}):
+            columns[k] = array('d', (
+                value + adjust * weight[k] for value, adjust, weight in zip(
+                    columns[k], adjustment, scenario_weights)))
+
+        cashflows = _Cashflows(columns)
+        # Add net income as each person is paid:
+        for person in self.people:
+            for when, weight in person.payment_timing.normalized_items():
+                cashflows.withdraw(
+                    index[when],
+                    array('d', [-net_income[person] * float(weight)]) * num)
+        # Then pay for living expenses out of that income. As in
+        # `LivingExpensesForecast`, payments may be deferred to avoid
+        # running a negative balance at any point in the year.
+        for person in self.people:
+            share = array('d', (
+                value * income_weights[person] for value in living_expenses))
+            for when, weight in person.payment_timing.normalized_items():
+                weight = float(weight)
+                cashflows.withdraw(index[when], array('d', (
+                    value * weight for value in share)))
+        return times, cashflows.columns
+
+    @staticmethod
+    def _transactions(times, available, balance, growth, year_growth):
+        """ Contributes (withdraws) the surplus (shortfall) of a year.
+
+        Transactions are timed as `TransactionTraversal` times them for
+        an `Account`, i.e. in proportion to `Timing(available)`.
+        Withdrawals are limited to what the account can provide.
+
+        Opening balances are grown for all scenarios at once. The
+        timing of each scenario's transactions depends on the shape of
+        its cashflows, so those are found for one scenario at a time.
+
+        Args:
+            times (list[float]): The timings of `available`.
+            available (list[array]): The cashflows at each of `times`,
+                with one element per scenario.
+            balance (array): The opening balance of each scenario.
+            growth (dict[float, float]): The growth of a transaction
+                at each of `times` through to year-end.
+            year_growth (float): The growth of the opening balance.
+
+        Returns:
+            tuple[array, array, array]: The year-end balance, returns
+            and shortfall of available cashflows for each scenario.
+        """
+        end_balance = array('d', (value * year_growth for value in balance))
+        returns = array('d', (value * (year_growth - 1) for value in balance))
+        shortfall = array('d', [0.0]) * len(balance)
+        for i, opening_balance in enumerate(balance):
+            # Cashflows of $0 don't affect timings, so leave them out:
+            cashflows = {
+                when: column[i] for when, column in zip(times, available)
+                if column[i]}
+            total = sum(cashflows.values())
+            shortfall[i] = total
+            if abs(total) <= EPSILON:
+                continue
+            timing = Timing(cashflows).normalized()
+            if total < 0:
+                # Find the largest withdrawal (with this timing) that
+                # leaves a non-negative balance at year-end:
+                weighted_accum = sum(
+                    weight * growth[when] for when, weight in timing.items())
+                max_outflow = max(
+                    opening_balance * year_growth / weighted_accum, 0)
+                total = max(total, -max_outflow)
+            # Grow each transaction:
+            for when, weight in timing.items():
+                value = total * weight
+                end_balance[i] += value * growth[when]
+                returns[i] += value * (growth[when] - 1)
+                shortfall[i] -= value
+        return end_balance, returns, shortfall
+
+    def _tax_owing(self, year, gross_income, returns):
+        """ Total tax owing for a year for all plannees. """
+        owing = array('d', [0.0]) * self.num_scenarios
+        for person in self.people:
+            # Only positive returns are taxable (as with `Account`):
+            if self.account in person.accounts:
+                incomes = [
+                    gross_income[person] + max(value, 0) for value in returns]
+            else:
+                incomes = [gross_income[person]] * self.num_scenarios
+            # Tax all scenarios that share a tax treatment at once:
+            for tax, indexes in self._taxes.items():
+                deduction = float(tax.personal_deduction(year))
+                taxes = tax.tax_money_many(
+                    [incomes[i] for i in indexes], year, deduction)
+                for i, value in zip(indexes, taxes):
+                    owing[i] += float(value)
+        return owing
+
+    def paths(self):
+        """ Yields the results for each scenario, in order.
+
+        Yields:
+            ForecastPath: An object with `*_history` attributes with
+            the same form as those of `Forecast`.
+        """
+        for index in range(self.num_scenarios):
+            yield ForecastPath(self, index)
+
+    def summary(self, fields=None):
+        """ Summarizes the results of all scenarios.
+
+        Arguments:
+            fields (Iterable[str]): The names of the fields to
+                summarize. Must be in `VECTORIZED_FIELDS`. Optional.
+
+        Returns:
+            ForecastSummary: Per-year distributions of the results.
+        """
+        summary = ForecastSummary(fields=fields)
+        for path in self.paths():
+            summary.add(path)
+        return summary
+
+class _Cashflows(object):
+    """ The cashflows of many scenarios, at a shared set of timings.
+
+    Withdrawals have the same semantics as `SubForecast.add_transaction`
+    with `from_account` set to each scenario's cashflows, but are made
+    for all scenarios at once.
+
+    A withdrawal reduces the balance at every later timing. Rather than
+    updating each of those balances, withdrawals made at their own
+    timings are tracked as a running total (for each scenario) until
+    a withdrawal at an earlier timing needs up-to-date balances. The
+    (suffix) minimum balance from each timing on is also tracked, so
+    that scenarios that can afford a withdrawal are found in one pass.
+
+    Args:
+        columns (list[array]): The cashflows at each timing, with one
+            element per scenario.
+
+    Attributes:
+        columns (list[array]): The cashflows at each timing, with one
+            element per scenario.
+    """
+
+    # This is a private helper with one job.
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, columns):
+        """ Inits _Cashflows. """
+        self.columns = columns
+        # The running total of `columns`, excluding `_pending`:
+        self._balances = []
+        total = None
+        for column in columns:
+            if total is None:
+                total = array('d', column)
+            else:
+                total = array('d', map(add, total, column))
+            self._balances.append(total)
+        self._minimums = None
+        self._update_minimums()
+        # Withdrawals not yet reflected in `_balances`, as
+        # `(index, amounts)` pairs in ascending order of index, and
+        # their total for each scenario:
+        self._pending = []
+        self._withdrawn = array('d', [0.0]) * len(columns[0])
+
+    def withdraw(self, start, amounts):
+        """ Withdraws `amounts` at or after timing `start`.
+
+        Each withdrawal is deferred to the earliest timing that doesn't
+        put any later balance below $0. If there is no such timing,
+        it's made at `start`. Negative amounts are deposited at `start`.
+
+        Args:
+            start (int): The index of the timing of the withdrawal.
+            amounts (array): The amount withdrawn in each scenario.
+        """
+        if self._pending and start < self._pending[-1][0]:
+            self._update_balances()
+        last = len(self.columns) - 1
+        withdrawn = self._withdrawn
+        # Only positive withdrawals can be deferred:
+        thresholds = array('d', (
+            amount if amount > 0 else -inf for amount in amounts))
+        # Find scenarios with a balance that doesn't cover the
+        # withdrawal at some timing. The withdrawal is deferred to just
+        # after the last such timing (unless that's the last timing):
+        deferred = {}
+        for i in compress(range(len(amounts)), map(
+                lt, map(sub, self._minimums[start], withdrawn), thresholds)):
+            index = last
+            while self._balances[index][i] - withdrawn[i] >= amounts[i]:
+                index -= 1
+            if index < last:
+                deferred[i] = index + 1
+        on_time = array('d', amounts)
+        for i, index in deferred.items():
+            on_time[i] = 0.0
+            self.columns[index][i] -= amounts[i]
+            for k in range(index, last + 1):
+                self._balances[k][i] -= amounts[i]
+            minimum = inf
+            for k in range(last, start - 1, -1):
+                minimum = min(minimum, self._balances[k][i])
+                self._minimums[k][i] = minimum
+        self.columns[start] = array('d', map(
+            sub, self.columns[start], on_time))
+        self._pending.append((start, on_time))
+        self._withdrawn = array('d', map(add, withdrawn, on_time))
+
+    def _update_balances(self):
+        """ Brings `_balances` up to date with pending withdrawals. """
+        withdrawn = array('d', [0.0]) * len(self._withdrawn)
+        pending = iter(self._pending)
+        index, amounts = next(pending)
+        for k in range(index, len(self._balances)):
+            while index == k:
+                withdrawn = array('d', map(add, withdrawn, amounts))
+                index, amounts = next(pending, (None, None))
+            self._balances[k] = array('d', map(
+                sub, self._balances[k], withdrawn))
+        self._pending = []
+        self._withdrawn = array('d', [0.0]) * len(self._withdrawn)
+        self._update_minimums()
+
+    def _update_minimums(self):
+        """ Finds the minimum balance at or after each timing. """
+        minimums = []
+        minimum = None
+        for balance in reversed(self._balances):
+            if minimum is None:
+                minimum = array('d', balance)
+            else:
+                minimum = array('d', map(min, balance, minimum))
+            minimums.append(minimum)
+        minimums.reverse()
+        self._minimums = minimums
@@ -1,14 +1,20 @@
 ''' This module provides classes for creating and managing Forecasts. '''
 
-from copy import copy, deepcopy
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
 from functools import reduce
+from itertools import islice
 from enum import Enum
 from forecaster.forecast import (
     Forecast, IncomeForecast, LivingExpensesForecast,
-    SavingForecast, WithdrawalForecast, TaxForecast)
+    SavingForecast, WithdrawalForecast, TaxForecast, ForecastSummary,
+    VectorizedForecast)
 from forecaster.tax import Tax
 from forecaster.strategy import (
     LivingExpensesStrategy, TransactionStrategy, AllocationStrategy)
+from forecaster.ledger import fork
 from forecaster.scenario import Scenario
 from forecaster.settings import Settings
 from forecaster.utility.precision import HighPrecisionOptional
@@ -93,6 +99,10 @@ DEFAULTBUILDERS = {
     # str(Parameter.TAX_TREATMENT): "build_tax_treatment"
 }
 
+# The default number of samples sent to a worker process at a time by
+# `Forecaster.run_many_parallel`:
+DEFAULT_CHUNK_SIZE = 16
+
 # Types that can receive the callable argument `high_precision` at init:
 HIGHPRECISIONTYPES = frozenset((
     # Scenario,
@@ -187,9 +197,13 @@ class Forecaster(HighPrecisionOptional):
         # The first name has special treatment, since it might need to
         # be dynamically built:
         top_attr_name = name_list[0]
-        # NOTE: This raises AttributeError if the attribute doesn't
-        # exist. (Optional attributes should exist and be None-valued)
-        attr = getattr(self, top_attr_name)
+        # Use an already-built parameter if one has been memoized:
+        if memo is not None and top_attr_name in memo:
+            attr = memo[top_attr_name]
+        else:
+            # NOTE: This raises AttributeError if the attribute doesn't
+            # exist. (Optional attributes should exist and be None-valued)
+            attr = getattr(self, top_attr_name)
         # If this is an optional attribute and it hasn't been explicitly
         # provided, build it dynamically:
         if attr is None and top_attr_name in self.default_values:
@@ -201,7 +215,7 @@ class Forecaster(HighPrecisionOptional):
         else:
             return reduce(getattr, name_list[1:], attr)
 
-    def run_forecast(self, people, accounts, debts):
+    def run_forecast(self, people, accounts, debts, *, profiler=None):
         """ Generates a `Forecast` object.
 
         This method builds a `Forecast` based on any explicitly-provided
@@ -213,26 +227,265 @@ class Forecaster(HighPrecisionOptional):
         the objects passed as arguments are not so that they an be
         re-used (and because mutating arguments is considered rude).
         Relationships between arguments and their members are preserved
-        via `deepcopy`.
+        via `fork` (which behaves like `deepcopy`).
+
+        Arguments:
+            people (set[Person]): One or more people for whom a forecast
+                is being generated.
+            accounts (set[Account]): Accounts belonging to the plannees.
+            debts (set[Debt]): Debts owed by the plannees.
+            profiler (ForecastProfiler): Records the time spent in each
+                part of the forecast. Optional.
+
+        Returns:
+            Forecast: A forecast of the plannees income, savings,
+            and withdrawals over the years.
+        """
+        return self._run_forecast(
+            people, accounts, debts, profiler=profiler)
+
+    def run_many(
+            self, samples, people, accounts, debts, fields=None,
+            workers=None, chunk_size=None):
+        """ Generates a summary of many `Forecast` objects.
+
+        One `Forecast` is generated for each of `samples`, each of which
+        provides the `Scenario` for that forecast (e.g. a set of sampled
+        returns and inflation rates). Only the results of each forecast
+        are retained (in a `ForecastSummary`); the `Forecast` objects
+        themselves are discarded once summarized.
+
+        Parameters that don't depend on `Scenario` (i.e. the saving and
+        withdrawal strategies) are built once and reused for each
+        forecast. Parameters that are built from the `Scenario` (e.g.
+        the default `living_expenses_strategy` and `tax_treatment`) are
+        rebuilt for each sample, unless they have been explicitly
+        provided, in which case they are used as-is.
+
+        As with `run_forecast`, arguments are copied and not mutated.
+
+        Arguments:
+            samples (Iterable[Scenario, dict[str, Any]]): The scenarios
+                to be forecast. Each sample may be a `Scenario` or a
+                dict of keyword arguments (e.g. `inflation`, which may
+                be a list of per-year values) used to build one, in
+                which case any missing arguments are provided by
+                `settings` (as with `build_param`).
+            people (set[Person]): One or more people for whom a forecast
+                is being generated.
+            accounts (set[Account]): Accounts belonging to the plannees.
+            debts (set[Debt]): Debts owed by the plannees.
+            fields (Iterable[str]): The names of the `Forecast`
+                recorded properties to summarize. Optional. Defaults to
+                principal, withdrawals, and tax.
+            workers (int): The number of worker processes to use. If
+                provided, forecasts are run in parallel via
+                `run_many_parallel`. Optional. If not provided, all
+                forecasts are run in this process.
+            chunk_size (int): The number of samples sent to a worker
+                process at a time. Only used if `workers` is provided.
+                Optional.
+
+        Returns:
+            ForecastSummary: Per-year distributions of the results of
+            the forecasts.
+        """
+        if workers is None:
+            return self._summarize(
+                samples, people, accounts, debts, fields=fields)
+        summary = ForecastSummary(
+            fields=fields, high_precision=self.high_precision)
+        for chunk_summary in self.run_many_parallel(
+                samples, people, accounts, debts, fields=fields,
+                workers=workers, chunk_size=chunk_size):
+            summary.merge(chunk_summary)
+        return summary
+
+    def run_many_parallel(
+            self, samples, people, accounts, debts, fields=None,
+            workers=None, chunk_size=None):
+        """ Generates summaries of `Forecast` objects in parallel.
+
+        `samples` are split into chunks of `chunk_size` samples, each of
+        which is forecast in a worker process. This `Forecaster` and the
+        `Ledger` arguments are pickled and sent to each worker process
+        just once, when the process starts.
+
+        Summaries are yielded in the order of their chunks in `samples`
+        (i.e. as each chunk finishes, unless an earlier chunk is still
+        running), so results are deterministic and, once merged, match
+        those of `run_many` for the same `samples`. (Values that depend
+        on sums over several accounts can differ by rounding errors,
+        since worker processes may add them up in a different order.)
+
+        Arguments:
+            samples (Iterable[Scenario, dict[str, Any]]): The scenarios
+                to be forecast. See `run_many` for more information.
+                These must be picklable.
+            people (set[Person]): One or more people for whom a forecast
+                is being generated.
+            accounts (set[Account]): Accounts belonging to the plannees.
+            debts (set[Debt]): Debts owed by the plannees.
+            fields (Iterable[str]): The names of the `Forecast`
+                recorded properties to summarize. Optional.
+            workers (int): The number of worker processes to use.
+                Optional. Defaults to the number of processors.
+            chunk_size (int): The number of samples sent to a worker
+                process at a time. Optional.
+
+        Yields:
+            ForecastSummary: A summary of the forecasts for each chunk
+            of `samples`.
+        """
+        if chunk_size is None:
+            chunk_size = DEFAULT_CHUNK_SIZE
+        if workers is None:
+            workers = os.cpu_count() or 1
+        with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker,
+                initargs=(self, people, accounts, debts, fields)
+        ) as executor:
+            # Keep a bounded number of chunks in flight so that `samples`
+            # can be a long (or lazily-generated) sequence:
+            pending = deque()
+            for chunk in _chunks(samples, chunk_size):
+                pending.append(executor.submit(_run_chunk, chunk))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def run_vectorized(self, samples, people, accounts, debts):
+        """ Generates a `VectorizedForecast` of many scenarios at once.
+
+        This is much faster than `run_many`, but only supports simple
+        portfolios. See `VectorizedForecast` for details.
+
+        As with `run_many`, the living expenses strategy and tax
+        treatment are rebuilt for each sample unless they have been
+        explicitly provided. Arguments are copied and not mutated.
+
+        Arguments:
+            samples (Iterable[Scenario, dict[str, Any]]): The scenarios
+                to be forecast. See `run_many` for more information.
+            people (set[Person]): One or more people for whom a forecast
+                is being generated.
+            accounts (set[Account]): Accounts belonging to the plannees.
+            debts (set[Debt]): Debts owed by the plannees.
+
+        Returns:
+            VectorizedForecast: A forecast of each scenario. Call its
+            `summary` method to get a `ForecastSummary`.
+
+        Raises:
+            ValueError: The portfolio isn't supported by
+                `VectorizedForecast`.
+        """
+        scenarios = []
+        living_expenses_strategies = []
+        tax_treatments = []
+        for sample in samples:
+            memo = self._sample_memo(sample, {})
+            scenarios.append(memo[str(Parameter.SCENARIO)])
+            living_expenses_strategies.append(self.get_param(
+                Parameter.LIVING_EXPENSES_STRATEGY, memo=memo))
+            tax_treatments.append(self.get_param(
+                Parameter.TAX_TREATMENT, memo=memo))
+        return VectorizedForecast(
+            people, accounts, debts, scenarios,
+            living_expenses_strategies, tax_treatments)
+
+    def _shared_params(self):
+        """ Builds parameters that don't depend on `Scenario`.
+
+        Returns:
+            dict[str, Any]: A memo of parameters that can be reused
+            for forecasts of different scenarios.
+        """
+        shared = {}
+        self.get_param(Parameter.SAVING_STRATEGY, memo=shared)
+        self.get_param(Parameter.WITHDRAWAL_STRATEGY, memo=shared)
+        return shared
+
+    def _summarize(
+            self, samples, people, accounts, debts, fields=None,
+            shared=None):
+        """ Summarizes forecasts of `samples` run in this process.
+
+        See `run_many` for more information on arguments.
+
+        Arguments:
+            shared (dict[str, Any]): Parameters to be reused for each
+                forecast. Optional. Built via `_shared_params` if not
+                provided.
+
+        Returns:
+            ForecastSummary: Per-year distributions of the results of
+            the forecasts.
+        """
+        summary = ForecastSummary(
+            fields=fields, high_precision=self.high_precision)
+        # Build the scenario-independent parameters just once:
+        if shared is None:
+            shared = self._shared_params()
+        for sample in samples:
+            summary.add(self._run_forecast(
+                people, accounts, debts,
+                memo=self._sample_memo(sample, shared)))
+        return summary
+
+    def _sample_memo(self, sample, shared):
+        """ Builds a parameter memo for `sample`, based on `shared`.
+
+        Arguments:
+            sample (Scenario, dict[str, Any]): A `Scenario` or a dict
+                of keyword arguments for building one.
+            shared (dict[str, Any]): Parameters to be reused.
+
+        Returns:
+            dict[str, Any]: A memo containing each of `shared` and a
+            `Scenario` for `sample`.
+        """
+        memo = dict(shared)
+        if not isinstance(sample, Scenario):
+            # Don't reuse any memoized parameters while building the
+            # scenario; the scenario is what we're varying!
+            sample = self.build_param(Parameter.SCENARIO, **sample)
+        memo[str(Parameter.SCENARIO)] = sample
+        return memo
+
+    def _run_forecast(
+            self, people, accounts, debts, memo=None, profiler=None):
+        """ Generates a `Forecast` object from copies of the args.
+
+        See `run_forecast` for more information.
 
         Arguments:
             people (set[Person]): One or more people for whom a forecast
                 is being generated.
             accounts (set[Account]): Accounts belonging to the plannees.
             debts (set[Debt]): Debts owed by the plannees.
+            memo (dict[str, Any]): A mapping from parameter names to
+                already-built parameters, which are used in place of
+                building those parameters. Optional.
+            profiler (ForecastProfiler): Records the time spent in each
+                part of the forecast. Optional.
 
         Returns:
             Forecast: A forecast of the plannees income, savings,
             and withdrawals over the years.
         """
-        # We don't want to mutate the inputs, so create copies:
-        memo = {}
-        people = deepcopy(people, memo=memo)
-        accounts = deepcopy(accounts, memo=memo)
-        debts = deepcopy(debts, memo=memo)
+        # We don't want to mutate the inputs, so create copies.
+        # (Forking is cheaper than `deepcopy` and shares past values
+        # between copies, which matters when running many forecasts.)
+        copy_memo = {}
+        people = fork(people, memo=copy_memo)
+        accounts = fork(accounts, memo=copy_memo)
+        debts = fork(debts, memo=copy_memo)
 
         # Build Scenario first so that we have access to initial_year:
-        memo = {}
+        if memo is None:
+            memo = {}
         scenario = self.get_param(Parameter.SCENARIO, memo=memo)
         initial_year = scenario.initial_year  # extract for convenience
 
@@ -282,6 +535,7 @@ class Forecaster(HighPrecisionOptional):
             withdrawal_forecast=withdrawal_forecast,
             tax_forecast=tax_forecast,
             scenario=scenario,
+            profiler=profiler,
             high_precision=self.high_precision)
 
         # Forecasts run automatically on init, so we're done!
@@ -386,7 +640,9 @@ class Forecaster(HighPrecisionOptional):
                 objects. This is not generally needed by client code;
                 in cases where `build_param` needs to build other
                 parameters to build the requested parameter, this dict
-                is mutated to record already-built parameters. Optional.
+                is mutated to record already-built parameters. If
+                `param_name` is in `memo`, the memoized object is
+                returned. Optional.
 
         Returns:
             The value of the attribute with name `param_name` or, if
@@ -397,6 +653,9 @@ class Forecaster(HighPrecisionOptional):
         # (This is needed because Parameter members are Enum objects,
         # which can't be used in place of string-valued indexes)
         param_name = str(param_name)
+        # Use an already-built parameter if one has been memoized:
+        if memo is not None and param_name in memo:
+            return memo[param_name]
         explicit_attr = getattr(self, param_name)
         # If the attribute isn't provided, try to build one:
         if explicit_attr is None:
@@ -493,3 +752,36 @@ class Forecaster(HighPrecisionOptional):
         return self.build_param(
             Parameter.ALLOCATION_STRATEGY, AllocationStrategy, *args,
             _special_builder=False, **kwargs)
+
+
+# Worker processes used by `Forecaster.run_many_parallel` receive their
+# `Forecaster` and `Ledger` objects once, when the process starts, and
+# store them here for use by each chunk of samples:
+_WORKER_STATE = {}
+
+def _init_worker(forecaster, people, accounts, debts, fields):
+    """ Stores the arguments common to all chunks in a worker process. """
+    _WORKER_STATE.update(
+        forecaster=forecaster, people=people, accounts=accounts,
+        debts=debts, fields=fields,
+        # pylint: disable=protected-access
+        # This is module-private logic for `Forecaster`.
+        shared=forecaster._shared_params())
+
+def _run_chunk(samples):
+    """ Summarizes forecasts of `samples` in a worker process. """
+    forecaster = _WORKER_STATE['forecaster']
+    # pylint: disable=protected-access
+    # This is module-private logic for `Forecaster`.
+    return forecaster._summarize(
+        samples, _WORKER_STATE['people'], _WORKER_STATE['accounts'],
+        _WORKER_STATE['debts'], fields=_WORKER_STATE['fields'],
+        shared=_WORKER_STATE['shared'])
+
+def _chunks(iterable, size):
+    """ Yields lists of up to `size` consecutive items of `iterable`. """
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
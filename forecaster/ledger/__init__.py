@@ -3,12 +3,13 @@
 # See forecaster.__init__.py for version, author, and licensing info.
 
 __all__ = [
-    'base', 'recorded_property'
+    'base', 'recorded_property', 'history'
 ]
 
 from forecaster.ledger.base import (
-    Ledger, LedgerType, TaxSource
+    Ledger, LedgerType, TaxSource, fork
 )
 from forecaster.ledger.recorded_property import (
     recorded_property, recorded_property_cached
 )
+from forecaster.ledger.history import ColumnarHistory
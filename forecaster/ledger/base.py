@@ -1,11 +1,41 @@
 """ Module providing the Ledger base type and associated classes. """
 
 import inspect
+from copy import copy, deepcopy
 from forecaster.ledger.recorded_property import (
     recorded_property, recorded_property_cached
 )
+from forecaster.ledger.history import ColumnarHistory
 from forecaster.utility.precision import HighPrecisionOptional
 
+# A key added to a `deepcopy` memo dict to tell `Ledger` objects to fork
+# themselves (see `fork`). Memo keys are otherwise all `int` ids, so
+# this can't collide with any of them.
+FORK_MEMO_KEY = 'fork'
+
+def fork(value, memo=None):
+    """ Copies `value`, forking any `Ledger` objects it contains.
+
+    This behaves like `deepcopy`, except that each `Ledger` is copied
+    via `Ledger.fork`. Relationships between objects (e.g. between an
+    account and its owner) are preserved in the copies, as with
+    `deepcopy`.
+
+    Args:
+        value (Any): The object to copy (e.g. a `Ledger` or a
+            collection of `Ledger` objects).
+        memo (dict[int, Any]): A `deepcopy` memo dict. Pass the same
+            dict to several calls to preserve relationships between
+            the values copied by each. Optional.
+
+    Returns:
+        Any: A copy of `value`.
+    """
+    if memo is None:
+        memo = {}
+    memo[FORK_MEMO_KEY] = True
+    return deepcopy(value, memo)
+
 class LedgerType(type):
     """ A metaclass for Ledger classes.
 
@@ -49,6 +79,12 @@ class Ledger(HighPrecisionOptional, metaclass=LedgerType):
         initial_year (int): The initial year for the object.
         this_year (int): The current year for the object. Incremented
             with each call to next_year()
+        columnar_history (bool): If True, `*_history` values are stored
+            in `ColumnarHistory` objects instead of dicts. This uses
+            much less memory for long forecasts. This is a class
+            attribute; set it on `Ledger` to affect all `Ledger`
+            objects (or on a subclass to affect just that subclass)
+            built afterward.
     """
 
     # This class is intended for subclassing. It implements only magic
@@ -57,6 +93,8 @@ class Ledger(HighPrecisionOptional, metaclass=LedgerType):
     # clearly behaviour that requires a class (not just a container).
     # pylint: disable=too-few-public-methods
 
+    columnar_history = False
+
     def __init__(self, initial_year, inputs=None, **kwargs):
         """ Inits IncrementableByYear.
 
@@ -85,11 +123,81 @@ class Ledger(HighPrecisionOptional, metaclass=LedgerType):
             # Use input values if available for this property:
             if prop.__name__ in self.inputs:
                 setattr(self, prop.history_dict_name,
-                        dict(self.inputs[prop.__name__]))
+                        self._build_history(self.inputs[prop.__name__]))
             # Otherwise, use an empty dict and leave it to __init__ and
             # next_year to fill it programmatically.
             else:
-                setattr(self, prop.history_dict_name, {})
+                setattr(self, prop.history_dict_name, self._build_history())
+
+    def _build_history(self, values=None):
+        """ Builds a `{year: value}` mapping for a recorded property.
+
+        Args:
+            values (dict[int, Any]): Initial values. Optional.
+
+        Returns:
+            dict[int, Any], ColumnarHistory: A `ColumnarHistory` if
+            `columnar_history` is True, otherwise a `dict`.
+        """
+        if self.columnar_history:
+            return ColumnarHistory(self.initial_year, values)
+        if values is None:
+            return {}
+        return dict(values)
+
+    def fork(self, memo=None):
+        """ Returns a copy that can be advanced independently of this one.
+
+        This is a cheaper alternative to `deepcopy` for starting many
+        forecasts from the same objects. Values recorded for past years
+        are never modified, so they're shared with the copy rather than
+        copied, as is `inputs` (which is treated as read-only). All
+        other attributes, including values for the current year, are
+        deep-copied.
+
+        Args:
+            memo (dict[int, Any]): A `deepcopy` memo dict. See `fork`.
+                Optional.
+
+        Returns:
+            Ledger: A copy of this object.
+        """
+        return fork(self, memo)
+
+    def __deepcopy__(self, memo):
+        """ Deep-copies (or forks) this object.
+
+        This copies the object the same way as the default `deepcopy`
+        behaviour, unless called via `fork`, in which case histories
+        and inputs are copied as described in `Ledger.fork`.
+        """
+        clone = type(self).__new__(type(self))
+        memo[id(self)] = clone
+        if memo.get(FORK_MEMO_KEY, False):
+            # pylint: disable=no-member
+            # Pylint gets confused by attributes added by metaclass.
+            history_names = {
+                prop.history_dict_name for prop in self._recorded_properties}
+        else:
+            history_names = ()
+        for name, value in self.__dict__.items():
+            if name in history_names:
+                value = self._fork_history(value, memo)
+            elif history_names and name == 'inputs':
+                pass  # Shared (read-only)
+            else:
+                value = deepcopy(value, memo)
+            clone.__dict__[name] = value
+        return clone
+
+    def _fork_history(self, history, memo):
+        """ Copies a history, sharing values for past years. """
+        result = copy(history)
+        # Values for this year (or later) might yet be mutated:
+        for year in history:
+            if year >= self.this_year:
+                result[year] = deepcopy(history[year], memo)
+        return result
 
     def next_year(self):
         """ Advances to the next year. """
@@ -0,0 +1,161 @@
+""" Module providing a compact mapping for recorded property histories.
+
+Each `recorded_property` of a `Ledger` stores its values in a
+`{year: value}` mapping. By default that's a `dict`, which stores a
+boxed value and a hash table entry for each year. `ColumnarHistory`
+stores `float` values in a single array instead, indexed by
+`year - initial_year`, which is several times smaller for long
+histories and can be exported without iterating over each year.
+"""
+
+from array import array
+from collections.abc import MutableMapping
+
+# The value used to indicate a year with no value when exporting a
+# column via `ColumnarHistory.as_array`:
+MISSING = float('nan')
+
+class ColumnarHistory(MutableMapping):
+    """ A `{year: value}` mapping that stores floats in a column.
+
+    `float` values for years at or after `initial_year` are stored in
+    an `array('d')`. Any other values (e.g. `Decimal` values or dicts
+    of transactions) and any earlier years are stored in an ordinary
+    dict, so any value that can be stored in a `*_history` dict can be
+    stored here.
+
+    Unlike a `dict`, iteration is in ascending order of year, not in
+    insertion order.
+
+    Examples:
+        ```
+        history = ColumnarHistory(2000, {2000: 1.0})
+        history[2001] = 2.0
+        history[2002] = {0.5: 100}  # Stored outside of the column
+        history.as_array()  # array('d', [1.0, 2.0, nan])
+        ```
+
+    Args:
+        initial_year (int): The year stored at index 0 of the column.
+        values (Mapping[int, Any]): Initial `{year: value}` pairs.
+            Optional.
+        capacity (int): The number of years to allocate space for.
+            The column grows as needed, so this is just an
+            optimization. Optional.
+
+    Attributes:
+        initial_year (int): The year stored at index 0 of the column.
+    """
+
+    __slots__ = ('initial_year', '_column', '_present', '_count', '_other')
+
+    def __init__(self, initial_year, values=None, capacity=0):
+        """ Inits ColumnarHistory. """
+        self.initial_year = initial_year
+        # Values are stored in `_column`. Because any float is a valid
+        # value, we separately track which years have values:
+        self._column = array('d', bytes(8 * capacity))
+        self._present = bytearray(capacity)
+        self._count = 0
+        # Any values that don't fit in the column go here:
+        self._other = {}
+        if values is not None:
+            self.update(values)
+
+    def _index(self, year):
+        """ The index of `year` in the column, or None if not indexable. """
+        if isinstance(year, int):
+            index = year - self.initial_year
+            if index >= 0:
+                return index
+        return None
+
+    def _in_column(self, index):
+        """ Whether a value is stored in the column at `index`. """
+        return (
+            index is not None and index < len(self._present)
+            and self._present[index])
+
+    def _reserve(self, size):
+        """ Grows the column to hold at least `size` years. """
+        if size > len(self._column):
+            # Grow geometrically so that appending is amortized O(1):
+            growth = max(size, 2 * len(self._column)) - len(self._column)
+            self._column.frombytes(bytes(8 * growth))
+            self._present.extend(bytes(growth))
+
+    def __getitem__(self, year):
+        index = self._index(year)
+        if self._in_column(index):
+            return self._column[index]
+        return self._other[year]
+
+    def __setitem__(self, year, value):
+        index = self._index(year)
+        # Only store exact floats in the column, so that values
+        # round-trip with their original types:
+        if index is not None and type(value) is float:
+            self._reserve(index + 1)
+            self._other.pop(year, None)
+            if not self._present[index]:
+                self._present[index] = 1
+                self._count += 1
+            self._column[index] = value
+        else:
+            if self._in_column(index):
+                self._present[index] = 0
+                self._count -= 1
+            self._other[year] = value
+
+    def __delitem__(self, year):
+        index = self._index(year)
+        if self._in_column(index):
+            self._present[index] = 0
+            self._count -= 1
+        else:
+            del self._other[year]
+
+    def __contains__(self, year):
+        return self._in_column(self._index(year)) or year in self._other
+
+    def __len__(self):
+        return self._count + len(self._other)
+
+    def __iter__(self):
+        column_years = (
+            self.initial_year + index
+            for index, present in enumerate(self._present) if present)
+        if not self._other:
+            return column_years
+        return iter(sorted(set(column_years).union(self._other)))
+
+    def __repr__(self):
+        return type(self).__name__ + '(' + repr(dict(self.items())) + ')'
+
+    def __reduce__(self):
+        """ Supports pickling and copying, which `__slots__` prevents. """
+        return (type(self), (self.initial_year, dict(self.items())))
+
+    def as_array(self):
+        """ The values for each year from `initial_year`, as floats.
+
+        This is much faster than iterating over each year, since the
+        column can be copied directly.
+
+        Returns:
+            array: An `array('d')` with one value for each year from
+            `initial_year` to the latest year with a `float` value.
+            Years with no value (or a value stored outside of the
+            column, e.g. a `Decimal`) are given as `MISSING` (i.e. NaN).
+        """
+        size = len(self._present)
+        # Trim any unused (preallocated) years at the end:
+        while size > 0 and not self._present[size - 1]:
+            size -= 1
+        values = self._column[:size]
+        # Years without a float value shouldn't expose stale values:
+        if self._count < size:
+            for index in range(size):
+                if not self._present[index]:
+                    values[index] = MISSING
+        return values
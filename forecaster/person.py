@@ -5,7 +5,7 @@ from dateutil.parser import parse
 from dateutil.relativedelta import relativedelta
 from forecaster.ledger import (
     TaxSource, recorded_property, recorded_property_cached)
-from forecaster.utility import Timing
+from forecaster.utility import WHEN_DEFAULT, frozen_timing, Constant
 
 
 class Person(TaxSource):
@@ -126,12 +126,11 @@ class Person(TaxSource):
         # For simple, non-property-wrapped attributes, assign directly:
         self.name = name
         if payment_timing is None:
-            # Timing is technically mutable, so init it here rather than
-            # using "Timing()" as a default value.
-            self.payment_timing = Timing(high_precision=self.high_precision)
-        else:
-            self.payment_timing = Timing(
-                payment_timing, high_precision=self.high_precision)
+            payment_timing = WHEN_DEFAULT
+        # Use a shared, immutable timing so that people with the same
+        # payment schedule don't each build (and normalize) their own:
+        self.payment_timing = frozen_timing(
+            payment_timing, high_precision=self.high_precision)
 
         # For attributes wrapped by ordinary properties, create hidden
         # attributes and assign to them using the properties:
@@ -256,19 +255,15 @@ class Person(TaxSource):
         if val is None:
             self.raise_rate_callable = 0
         # Is raise_rate isn't callable, convert it to a suitable method:
+        # (These are picklable, unlike lambdas or nested functions.)
         if not callable(val):  # Make callable if dict or scalar
             if isinstance(val, dict):
                 # assume dict of {year: raise} pairs
-                def func(year):
-                    """ Wraps dict in a function """
-                    return val[year]
+                func = val.__getitem__
             else:
                 # Return a constant rate
                 # First, convert to high-precision if appropriate:
-                val = self.precision_convert(val)
-                def func(_=None):
-                    """ Wraps value in a function with an optional arg. """
-                    return val
+                func = Constant(self.precision_convert(val))
             self._raise_rate_callable = func
         else:
             # If the input is callable, use it without modification.
@@ -1,6 +1,84 @@
 """ Basic economic classes, such as `Scenario` and `Money`. """
 
 import collections
+from forecaster.utility.functions import Constant
+
+
+class _VersionedDictMixin(object):
+    """ Tracks the number of times a dict has been mutated.
+
+    Objects that cache values computed from a dict's contents can store
+    the dict's `version` and compare it later to check whether the dict
+    has been mutated in the meantime (and so whether the cache is
+    stale).
+    """
+
+    # Classes that pickle their items but not their attributes (e.g.
+    # `defaultdict`) fall back to this when unpickled:
+    version = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+
+    def __ior__(self, other):
+        self.version += 1
+        return super().__ior__(other)
+
+    def clear(self):
+        """ Removes all items. """
+        super().clear()
+        self.version += 1
+
+    def pop(self, *args):
+        """ Removes a key and returns its value. """
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        """ Removes and returns a `(key, value)` pair. """
+        self.version += 1
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        """ Returns the value for `key`, inserting `default` if absent. """
+        self.version += 1
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        """ Updates the dict from another mapping or iterable. """
+        super().update(*args, **kwargs)
+        self.version += 1
+
+
+class _VersionedDict(_VersionedDictMixin, dict):
+    """ A `dict` that tracks how many times it has been mutated. """
+
+
+class _VersionedDefaultDict(_VersionedDictMixin, collections.defaultdict):
+    """ A `defaultdict` that tracks how many times it has been mutated. """
+
+    def __missing__(self, key):
+        # Filling in a default value for a new key doesn't change the
+        # values for any existing keys, so don't count it as a mutation.
+        if self.default_factory is None:
+            raise KeyError(key)
+        value = self.default_factory()
+        dict.__setitem__(self, key, value)
+        return value
+
+
+def _versioned(val):
+    """ Copies a dict (or defaultdict) as a versioned dict. """
+    if isinstance(val, _VersionedDictMixin):
+        return val
+    if isinstance(val, collections.defaultdict):
+        return _VersionedDefaultDict(val.default_factory, val)
+    return _VersionedDict(val)
 
 
 class Scenario(object):
@@ -30,6 +108,9 @@ class Scenario(object):
             where `fees` is the rate at which management fees are
             charged in invested assets in the given year. Optional.
     """
+    # NOTE: `inflation` is stored as a copy of the input, so that
+    # mutations can be detected and cached inflation adjustments
+    # refreshed. Mutate `scenario.inflation`, not the input dict.
 
     def __init__(
             self, initial_year, num_years,
@@ -119,16 +200,10 @@ class Scenario(object):
             return Scenario._build_dict(default, initial_year)
 
         # Convert a non-callable `default` to a default factory:
+        # (`Constant` is used instead of a lambda so that the resulting
+        # defaultdict can be pickled.)
         if default is not None and not callable(default):
-            # Raname this value so that we can use it in the closure.
-            _default = default
-
-            # pylint: disable=function-redefined
-            # This function redefinition is intentional; it's equivalent
-            # to default = lambda: _default
-            def default():
-                """ Wraps default value in a default factory. """
-                return _default
+            default = Constant(default)
 
         # If it's a dict (incl. a defaultdict), it's easy:
         if isinstance(in_val, dict):
@@ -167,7 +242,64 @@ class Scenario(object):
 
         # Otherwise, turn a scalar value into a defaultdict:
         # NOTE: default is ignored in this case
-        return collections.defaultdict(lambda: in_val)
+        return collections.defaultdict(Constant(in_val))
+
+    @property
+    def inflation(self):
+        """ `{year: inflation}` pairs (dict[int, float]). """
+        return self._inflation
+
+    @inflation.setter
+    def inflation(self, val):
+        """ Sets `inflation` and discards any cached adjustments. """
+        self._inflation = _versioned(val)
+        # Cumulative inflation is built lazily by `_inflation_index`:
+        self._index = [1]
+        self._index_year = None
+        self._index_version = None
+
+    def __getstate__(self):
+        """ Omits cached inflation adjustments when pickling or copying. """
+        # A copy of `inflation` needn't have the same `version`, so the
+        # cache can't be validated against it. It's cheap to rebuild:
+        state = self.__dict__.copy()
+        state.update(_index=[1], _index_year=None, _index_version=None)
+        return state
+
+    def _inflation_index(self, year1, year2):
+        """ Cumulative inflation for each year in [year1, year2].
+
+        Builds (or extends) a list of prefix products, where index `i`
+        is the cumulative inflation from `_index_year` to
+        `_index_year + i`. With this, cumulative inflation between any
+        two years can be found with at most one division.
+
+        The index is rebuilt if `inflation` has been mutated since it
+        was built.
+
+        Returns:
+            list[float]: The index, which covers at least the years
+            in [year1, year2]. Year `year` is at `year - _index_year`.
+        """
+        if (
+                self._index_version != self._inflation.version
+                or self._index_year is None or year1 < self._index_year):
+            # Start over. (Prefer to start at `initial_year` so that
+            # the usual adjustments from `initial_year` are found
+            # without any division.)
+            if self._index_year is None:
+                self._index_year = min(year1, self.initial_year)
+            else:
+                self._index_year = min(year1, self._index_year)
+            self._index = [1]
+        # Extend the index up to `year2`:
+        index = self._index
+        for year in range(self._index_year + len(index) - 1, year2):
+            index.append(index[-1] * (1 + self.discount_rate(year)))
+        # Record the version _after_ reading `inflation`, in case the
+        # reads inserted default values:
+        self._index_version = self._inflation.version
+        return index
 
     def discount_rate(self, year):
         """ Returns the discount rate for `year`.
@@ -181,15 +313,18 @@ class Scenario(object):
 
         If year2 precedes year1 then the discount rate is inverted.
         """
-        accum = 1
+        if year1 == year2:
+            return 1
+        start, end = min(year1, year2), max(year1, year2)
+        # Find the product of all intervening years' discount rates
+        # from the cumulative inflation index:
+        index = self._inflation_index(start, end)
+        accum = index[end - self._index_year]
+        if start != self._index_year:
+            accum = accum / index[start - self._index_year]
         if year1 <= year2:
-            # Find the product of all intervening years' discount rates
-            for year in range(year1, year2):
-                accum = accum * (1 + self.discount_rate(year))
             return accum
-        else:  # Same as above, except invert the result ()
-            for year in range(year2, year1):
-                accum = accum * (1 + self.discount_rate(year))
+        else:  # Same as above, except invert the result
             return 1 / accum
 
     def inflation_adjustments(self, base_year):
@@ -284,5 +419,6 @@ class InflationAdjust(object):
         """
         if base_year is None:
             base_year = self.scenario.initial_year
-        # TODO: Cache inflation adjustments (memoize accumulation_function?)
+        # NOTE: `accumulation_function` is backed by a cached index of
+        # cumulative inflation, so this is cheap to call repeatedly.
         return self.scenario.accumulation_function(base_year, target_year)
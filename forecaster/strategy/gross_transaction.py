@@ -2,6 +2,7 @@
 
 from forecaster.strategy.base import Strategy, strategy_method
 from forecaster.utility.precision import HighPrecisionOptionalPropertyCached
+from forecaster.utility.functions import Constant
 
 
 class LivingExpensesStrategy(Strategy):
@@ -80,7 +81,7 @@ class LivingExpensesStrategy(Strategy):
         if inflation_adjust is not None:
             self.inflation_adjust = inflation_adjust
         else:
-            self.inflation_adjust = lambda *args, **kwargs: 1
+            self.inflation_adjust = Constant(1)
 
         # Types are enforced by explicit conversion; no need to check.
 
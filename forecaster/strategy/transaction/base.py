@@ -21,14 +21,14 @@ from forecaster.utility import EPSILON, add_transactions, HighPrecisionOptional
 from forecaster.accounts.util import LIMIT_TUPLE_FIELDS
 from forecaster.strategy.transaction.util import (
     LimitTuple, transaction_default_methods, group_default_methods,
-    _get_accounts, _get_group, _get_transactions,
+    _get_group, _get_transactions,
     _convert_flows_to_transactions)
-from forecaster.strategy.transaction.node import TransactionNode
+from forecaster.strategy.transaction.node import (
+    TransactionNode, _structure_key)
 from forecaster.strategy.transaction.graph import (
-    _get_empty_graph, _add_edge, _flows_through, _generate_flows,
-    _inbound_capacity, _merge_flows, _outbound_capacity, _sum_weight,
-    _get_outbound_node, _get_overflow_node, _classify_children_by_flows,
-    _swap_saturated, _restrict_overflow, _unrestrict_overflow)
+    _get_empty_graph, _add_edge, _apportion, _edge_capacity, _flows_through,
+    _generate_flows, _inbound_capacity, _merge_flows, _sum_weight,
+    _get_outbound_node, _get_overflow_node, _limited_children)
 
 
 class TransactionTraversal(HighPrecisionOptional):
@@ -182,6 +182,7 @@ class TransactionTraversal(HighPrecisionOptional):
         # Set up data-holding attributes:
         self._priority = None
         self._priority_tree = None
+        self._priority_key = None
         # Set up method-holding attributes:
         if transaction_methods is None:
             self.transaction_methods = transaction_default_methods()
@@ -194,7 +195,11 @@ class TransactionTraversal(HighPrecisionOptional):
         # Convert `precision` to high-precision if it's the default
         # argument and a conversion method has been passed:
         if precision == EPSILON and self.high_precision is not None:
-            self.precision = high_precision(precision)
+            # `EPSILON` isn't exactly representable as a float, so
+            # build it from ints. (Otherwise amounts like 100 would be
+            # scaled up to 9999999.99... and truncated by a unit.)
+            self.precision = (
+                high_precision(1) / high_precision(round(1 / precision)))
         else:
             self.precision = precision
         # Store args used by most class methods as attributes to
@@ -216,11 +221,13 @@ class TransactionTraversal(HighPrecisionOptional):
     @priority.setter
     def priority(self, val):
         """ Sets priority """
-        if val == self._priority:
-            # Take no action if `priority` is unchanged.
-            return
-        # Otherwise, rebuild the annotated priority tree:
-        self._priority_tree = TransactionNode(val)
+        # Only rebuild the annotated priority tree if the structure of
+        # `priority` has changed. (It's common to pass a new priority
+        # tree with the same structure, e.g. each year.)
+        key = _structure_key(val)
+        if self._priority_tree is None or key != self._priority_key:
+            self._priority_tree = TransactionNode(val)
+            self._priority_key = key
         self._priority = val
 
     def __call__(
@@ -260,14 +267,34 @@ class TransactionTraversal(HighPrecisionOptional):
         self.memo = {}
         self.outbound_nodes = {}
         self.overflow_nodes = {}
+        # Each account's transaction limits are queried once and reused
+        # by every traversal:
+        capacities = {}
         # Build and traverse a graph based on `priority`
-        # First traverse to assign min. flows:
-        min_transactions = self._traverse_priority(
-            min_total, available, min_limit)
+        # First traverse to assign min. flows. (Most of the time, no
+        # account has a minimum; skip building that graph if so.)
+        if not self._has_min_transactions(available, min_limit, capacities):
+            min_transactions = {}
+        else:
+            # If the min. flows can be found in the same graph as the
+            # max. flows, traverse only once. (Min. outflows aren't
+            # limited by `total`, so they always get their own graph.)
+            if min_total == total:
+                min_capacities = self._get_min_capacities(
+                    available, min_limit, max_limit, capacities)
+            else:
+                min_capacities = None
+            if min_capacities is not None:
+                return self._traverse_priority(
+                    total, available, max_limit,
+                    min_limit=min_limit, min_capacities=min_capacities,
+                    capacities=capacities)
+            min_transactions = self._traverse_priority(
+                min_total, available, min_limit, capacities=capacities)
         # Then traverse to assign max. flows. Pass in `memo` to ensure
         # that the flows assigned previously are respected
         max_transactions = self._traverse_priority(
-            total, available, max_limit)
+            total, available, max_limit, capacities=capacities)
 
         # Combine min/max transactions to get final result:
         for account, transactions in min_transactions.items():
@@ -277,7 +304,152 @@ class TransactionTraversal(HighPrecisionOptional):
                 max_transactions[account] = transactions
         return max_transactions
 
-    def _traverse_priority(self, total, timing, limit):
+    def _has_min_transactions(self, timing, limit, capacities=None):
+        """ Whether any account has a non-zero transaction for `limit`.
+
+        Node limits can only reduce the flows to leaf nodes, so if every
+        account's transactions for `limit` round to a capacity of 0
+        (see `_add_node_account`), traversing a graph for `limit` would
+        produce no flows and there's no need to build one.
+
+        Args:
+            timing (Timing): The timing of account transactions.
+            limit (str): The name for the appropriate attribute of
+                `LimitTuple` to use for this check (e.g. "min_inflow").
+            capacities (dict[tuple[Hashable, str], int]): Capacities
+                previously found for `timing`. See `_get_capacity`.
+                Optional. *Mutated.*
+
+        Returns:
+            bool: True if any account has a transaction limit of at
+            least `precision` in magnitude, False otherwise.
+        """
+        for account in self._priority_tree.accounts:
+            capacity = self._get_capacity(account, limit, timing, capacities)
+            if abs(capacity) >= 1:
+                return True
+        return False
+
+    def _get_min_capacities(
+            self, timing, min_limit, max_limit, capacities=None):
+        """ Finds min. capacities for a single min/max traversal.
+
+        Min. and max. flows can often be found by traversing one graph,
+        where each account with a minimum transaction has an extra edge
+        to `sink` (via a "min" node) whose capacity is its minimum. Every
+        other edge from an account is weighted so heavily that any flow
+        which can reach a min. edge will do so before flowing anywhere
+        else. (See `_add_node_account`.) This gives the same
+        transactions as traversing the `min_limit` graph and then the
+        `max_limit` graph unless the second traversal would treat the
+        flows of the first differently than the flows it assigns
+        itself. In those cases this method returns `None` and both
+        traversals are needed.
+
+        Specifically, this returns `None` if any `TransactionNode` has
+        a per-node limit for `min_limit` or `max_limit` or if any
+        account with a minimum transaction is a descendant of a
+        weighted node (which reweights its children to account for
+        flows from the first traversal), is in a group (for either
+        limit), or has a minimum larger than its maximum.
+
+        Args:
+            timing (Timing): The timing of account transactions.
+            min_limit (str): The name of the `LimitTuple` attribute for
+                minimum transactions (e.g. "min_inflow").
+            max_limit (str): The name of the `LimitTuple` attribute for
+                maximum transactions (e.g. "max_inflow").
+            capacities (dict[tuple[Hashable, str], int]): Capacities
+                previously found for `timing`. See `_get_capacity`.
+                Optional. *Mutated.*
+
+        Returns:
+            dict[Hashable, int]: A mapping of accounts to the (scaled)
+            capacities of their minimum transactions, or `None` if the
+            min. and max. flows must be found by separate traversals.
+        """
+        # Find the accounts under weighted nodes, checking for per-node
+        # limits along the way. (Those are enforced on all flows through
+        # a node, so they would also restrict min. flows.)
+        weighted_accounts = set()
+        nodes = [(self._priority_tree, False)]
+        while nodes:
+            node, weighted = nodes.pop()
+            if (
+                    getattr(node.limits, min_limit, None) is not None or
+                    getattr(node.limits, max_limit, None) is not None):
+                return None
+            if node.is_leaf_node():
+                if weighted:
+                    weighted_accounts.add(node.source)
+            else:
+                weighted = weighted or node.is_weighted()
+                nodes.extend((child, weighted) for child in node.children)
+
+        min_capacities = {}
+        for account in self._priority_tree.accounts:
+            min_capacity = abs(self._get_capacity(
+                account, min_limit, timing, capacities))
+            if min_capacity < 1:
+                continue
+            max_capacity = abs(self._get_capacity(
+                account, max_limit, timing, capacities))
+            if (
+                    account in weighted_accounts or
+                    min_capacity > max_capacity or
+                    _get_group(
+                        account, min_limit,
+                        group_methods=self.group_methods) is not None or
+                    _get_group(
+                        account, max_limit,
+                        group_methods=self.group_methods) is not None):
+                return None
+            min_capacities[account] = min_capacity
+        return min_capacities
+
+    def _get_capacity(self, account, limit, timing, capacities=None):
+        """ The (scaled) sum of `account`'s transactions for `limit`.
+
+        Querying an account for its transactions is expensive, so if
+        `capacities` is provided then each account is queried at most
+        once for each value of `limit`.
+
+        Args:
+            account (Hashable): An account.
+            limit (str): The name for the appropriate attribute of
+                `LimitTuple` (e.g. "min_inflow", "max_outflow").
+            timing (Timing): The timing of account transactions.
+            capacities (dict[tuple[Hashable, str], int]): A mapping of
+                `(account, limit)` pairs to capacities previously found
+                by this method for `timing`. Optional. *Mutated.*
+
+        Returns:
+            int: The sum of `account`'s transactions, scaled up by
+            `precision`. This is negative for outflows.
+        """
+        if capacities is not None and (account, limit) in capacities:
+            return capacities[(account, limit)]
+        transactions = _get_transactions(
+            account, limit, timing,
+            transaction_methods=self.transaction_methods)
+        transaction_limit = sum(transactions.values())
+        # Ideally if we're operating in a high-precision mode,
+        # `transaction_limit` will already be in a high-precision type
+        # (to match self.precision), but if not then we need to convert:
+        if (
+                self.high_precision is not None and
+                isinstance(transaction_limit,float)):
+            transaction_limit = self.high_precision(transaction_limit)
+        # Scale up based on the precision (as we do with all edge
+        # capacities):
+        capacity = transaction_limit / self.precision
+        if capacities is not None:
+            capacities[(account, limit)] = capacity
+        return capacity
+
+    def _traverse_priority(
+            self, total, timing, limit, min_limit=None, min_capacities=None,
+            capacities=None):
         """ Builds a graph and finds the min-cost max. flow through it.
 
         This method translates `priority` into a graph (via
@@ -293,6 +465,10 @@ class TransactionTraversal(HighPrecisionOptional):
         Only incremental transactions (beyond those allocated in earlier
         invocations) are returned via the return value.
 
+        If `min_capacities` is provided, min. and max. flows are found
+        in a single traversal (see `_get_min_capacities`) and the
+        returned transactions include both.
+
         Args:
             total (float): The maximum amount of flow to allow through
                 the graph.
@@ -301,6 +477,16 @@ class TransactionTraversal(HighPrecisionOptional):
             limit (str): The name for the appropriate attribute of
                 `LimitTuple` to use for this traversal (e.g.
                 "min_inflow", "max_outflow")
+            min_limit (str): The name of the `LimitTuple` attribute for
+                the minimum transactions in `min_capacities` (e.g.
+                "min_inflow"). Optional.
+            min_capacities (dict[Hashable, int]): A mapping of accounts
+                to the (scaled) capacities of their minimum
+                transactions, as returned by `_get_min_capacities`.
+                Optional.
+            capacities (dict[tuple[Hashable, str], int]): Capacities
+                previously found for `timing`. See `_get_capacity`.
+                Optional. *Mutated.*
 
         Returns:
             dict[Hashable, dict[float, Money]]: A mapping of leaf
@@ -310,7 +496,9 @@ class TransactionTraversal(HighPrecisionOptional):
         # Build a graph that can accept up to `total` flow at the
         # source and then find the maximum flow that can actually
         # get through to the sink:
-        self._build_graph(total, timing=timing, limit=limit)
+        self._build_graph(
+            total, timing=timing, limit=limit, min_capacities=min_capacities,
+            capacities=capacities)
 
         _, flows = _generate_flows(self.graph, self.source, self.sink)
 
@@ -321,12 +509,31 @@ class TransactionTraversal(HighPrecisionOptional):
 
         # Generate transactions for the accounts based on the newly-
         # generated flows. (Note that memoized flows aren't included):
-        accounts = _get_accounts(self._priority_tree)
+        accounts = self._priority_tree.accounts
+        if min_capacities:
+            # Flows over each account's edge to its "min" node are min.
+            # transactions; its other outbound flows are max. flows:
+            min_flows = {}
+            for account in min_capacities:
+                min_node = (account, "min")
+                min_flows[account] = flows[min_node]
+                flows[account] = {
+                    node: flow for node, flow in flows[account].items()
+                    if node != min_node}
+            min_transactions = _convert_flows_to_transactions(
+                min_flows, timing, min_limit, min_capacities,
+                transaction_methods=self.transaction_methods, total=total,
+                high_precision=self.high_precision,
+                precision=self.precision)
+        else:
+            min_transactions = {}
         transactions = _convert_flows_to_transactions(
             flows, timing, limit, accounts,
             transaction_methods=self.transaction_methods, total=total,
             high_precision=self.high_precision, # Money value
             precision=self.precision)
+        for account, min_transaction in min_transactions.items():
+            add_transactions(transactions[account], min_transaction)
 
         return transactions
 
@@ -445,9 +652,14 @@ class TransactionTraversal(HighPrecisionOptional):
             self.source = 0
         if self.sink is None:
             self.sink = 1
-
-        # networkx has unexpected behaviour for non-int edge capacities,
-        # so inflate total based on the EPSILON precision constant.
+        # Accounts can be added to the graph several times (e.g. when
+        # weighted nodes are rebalanced), so find each account's
+        # capacity just once and reuse it:
+        if kwargs.get("capacities") is None:
+            kwargs["capacities"] = {}
+
+        # Flows are found in whole units of `precision` (i.e. as
+        # fixed-point amounts), so inflate total based on `precision`.
         # We can ignore infinite-valued `total`, which is dealt with
         # in `_add_edge` (and can't be cast to `int`):
         if abs(total) < float('inf'):
@@ -462,8 +674,13 @@ class TransactionTraversal(HighPrecisionOptional):
             # truncate it to an int.
             total = int(total / self.precision)
 
-        # Create an empty graph:
-        self.graph = _get_empty_graph()
+        # Create an empty graph. The graph is rebuilt on every call,
+        # since capacities throughout the graph (and even some edges,
+        # like those to overflow nodes) depend on `total` and on the
+        # accounts' current limits. Traversals of the same `priority`
+        # tree usually build graphs with the same edges, so let the new
+        # graph start from the flows found for the previous one:
+        self.graph = _get_empty_graph(template=self.graph)
         # We could use the root node of the tree as the graph's source
         # node, but it's convenient if each node can determine the
         # capacities of its outbound weights based on the capacities
@@ -479,6 +696,20 @@ class TransactionTraversal(HighPrecisionOptional):
         self._add_successors(
             self._priority_tree, **kwargs)
 
+        # If accounts have edges for min. flows (see `_add_node_account`)
+        # then weight every other edge from an account so that flow
+        # along any path ending in a min. edge is cheaper than flow
+        # along any other path. (Every path to `sink` passes through
+        # exactly one edge from an account, so this adds the same
+        # weight to every path that doesn't end in a min. edge.)
+        min_capacities = kwargs.get("min_capacities")
+        if min_capacities:
+            weight = 1 + _sum_weight(self.graph, self.source)
+            for account in self._priority_tree.accounts:
+                for child in list(self.graph.successors(account)):
+                    if child != (account, "min"):
+                        _add_edge(self.graph, account, child, weight=weight)
+
         # This first pass results in weighted nodes providing too much
         # outbound capacity to their children. Pass over weighted nodes
         # and limit outbound capacity to actual maximum possible flows.
@@ -747,10 +978,6 @@ class TransactionTraversal(HighPrecisionOptional):
             **kwargs: Arguments to pass to lower-level methods. Must
                 include at least "timing" and "limit" keys.
         """
-        # Weighted nodes assign flows proportionately to weights.
-        # Proportionality is easier to calculate with normalized weights
-        # so determine that first:
-        normalization = sum(children.values())
         # If we've previously assigned flows from `node` (or, rather,
         # its corresponding outbound node) to any of `children`, account
         # for that by increasing `capacity` here and decrementing that
@@ -760,16 +987,15 @@ class TransactionTraversal(HighPrecisionOptional):
             outbound_node, flows=self.memo, children=children)
         capacity += flows
 
-        # Generate a proportionate weighting for each child:
-        totals = {}
-        for child, weight in children.items():
-            # Each child is allocated a slice of `capacity`
-            # proportionate to its weight in `children`:
-            child_total = capacity * weight / normalization
+        # Weighted nodes assign flows proportionately to weights. Each
+        # child is allocated a slice of `capacity` proportionate to its
+        # weight in `children` (in whole units that add up to exactly
+        # `capacity`, so that no flow is lost to rounding):
+        totals = _apportion(capacity, children)
+        for child in totals:
             # Reduce this capacity to account for any memoized flows:
-            child_total -= _flows_through(outbound_node, child, flows=self.memo)
-            # Save this allocation:
-            totals[child] = child_total
+            totals[child] -= _flows_through(
+                outbound_node, child, flows=self.memo)
 
         # Deal with the scenario where some children have been assigned
         # negative capacity (i.e. memoized flows are greater than the
@@ -808,6 +1034,11 @@ class TransactionTraversal(HighPrecisionOptional):
         This method visits each weighted node in breadth-first order
         and calls `_balance_flows` on each child.
 
+        Where the flow into a weighted node is known in advance and
+        each child can accept its proportionate share of it (see
+        `_get_proportional_flows`), capacities are allocated directly
+        and no flows need to be generated to balance that node.
+
         Args:
             **kwargs: Arguments to pass to lower-level methods. Must
                 include at least "timing" and "limit" keys.
@@ -833,193 +1064,256 @@ class TransactionTraversal(HighPrecisionOptional):
                 traverse_nodes.put(child)
 
         # Now we can traverse weighted nodes in breadth-first order.
+        proportional_flows = self._get_proportional_flows(**kwargs)
         while not weighted_nodes.empty():
             node = weighted_nodes.get()
-            self._balance_flows(node, **kwargs)
-
-    def _balance_flows(
-            self, node, children=None, rebalance_all=True, **kwargs):
-        """ Attempts to shift flow between children to match weights.
-
-        Based on the flows from `node` to `children`, we can identify 3
-        sets of child nodes.
-        (References to a child's "capacity" below refers to the
-        capacity of all zero-weight paths from `node` to the child.)
-
-        1. Underflow nodes: Flow to these nodes from `node` is less than
-            their capacity.
-        2. Overflow nodes: Flow to these nodes exceeds their capacity
-            (i.e. they receive flow over non-zero-weight paths).
-        3. Saturated nodes: All nodes that are not underflow or overflow
-            nodes. These have received exactly their capacity in flows.
-
-        There is no guarantee that overflow and underflow nodes are
-        weighted properly relative to each other, since there's no
-        mechanism to force flows through a set of identically-weighted
-        paths to adhere to a certain proportion of flows. This method
-        recurses onto each of those sets of children separately,
-        thereby attempting to reallocate capacity between them in a way
-        that respects weightings.
-
-        We know we can recurse on those sets of nodes separately because
-        overflow nodes only receive flow if they _must_, and underflow
-        nodes only fail to reach saturation if it's _impossible_ to do
-        so (so long as total flow through `node` is at least as large
-        as the capacity of the children - which this method enforces).
-
-        Saturated nodes are included when recursing onto both underflow
-        and overflow nodes. This is because it's possible for a
-        saturated node to share capacity with underflow or overflow
-        nodes. It might be appropriate to reallocate capacity from a
-        saturated node to an underflow node and/or to reallocate
-        capacity from an overflow node to a saturated node.
+            if node in proportional_flows:
+                # No limits bind, so allocating the node's inbound flow
+                # proportionately to its children is exact:
+                self._add_successors(
+                    node, capacity=proportional_flows[node],
+                    add_overflow=False, **kwargs)
+            else:
+                self._balance_flows(node, **kwargs)
+
+    def _get_proportional_flows(self, min_capacities=None, **kwargs):
+        """ Finds weighted nodes that can be balanced without solving.
+
+        If the priority tree has no shared nodes (or linked accounts
+        that share a group node in the graph), the most flow that each
+        node can pass to `sink` can be found by summing over its
+        children (see `_get_max_flows`). Flows into each node can then
+        be found top-down: ordered nodes fill each child in order and
+        weighted nodes split flows proportionately to their weights, so
+        long as no child's share exceeds the most flow it can pass.
+        Weighted nodes where some child's share does exceed that (i.e.
+        where limits bind) are excluded, as are their descendants, since
+        they must be balanced by generating flows.
+
+        Args:
+            min_capacities (dict[Hashable, int]): Minimum capacities, as
+                passed to `_build_graph`. Optional. If provided, no
+                flows are returned (since min. flows are routed first).
+            **kwargs: Arguments passed to `_balance_weighted_flows`.
+                Unused.
+
+        Returns:
+            dict[TransactionNode, int]: A mapping of weighted nodes to
+            the flows into them, for those weighted nodes which can
+            allocate flows to their children in proportion to their
+            weights.
+        """
+        # pylint: disable=unused-argument
+        # Earlier-allocated flows (and, similarly, min. flows) change
+        # how much flow reaches each node; leave that to the solver.
+        if (
+                self.memo or min_capacities or
+                self.source is self._priority_tree):
+            return {}
+        max_flows = {}
+        if self._get_max_flows(self._priority_tree, max_flows) is None:
+            return {}
+
+        proportional_flows = {}
+        root = self._priority_tree
+        flow = min(
+            _edge_capacity(self.graph, self.source, root), max_flows[root])
+        nodes = [(root, flow)]
+        while nodes:
+            node, flow = nodes.pop()
+            if (
+                    not isinstance(node, TransactionNode) or
+                    node.is_leaf_node() or flow == float('inf')):
+                continue
+            if node.is_ordered():
+                # Each child takes as much flow as it can, in order:
+                for child in node.children:
+                    child_flow = min(flow, max_flows[child])
+                    nodes.append((child, child_flow))
+                    flow -= child_flow
+            elif node.is_weighted():
+                # Split flows the same way as `_add_weighted_children`:
+                shares = _apportion(flow, node.children)
+                if all(
+                        share <= max_flows[child]
+                        for child, share in shares.items()):
+                    proportional_flows[node] = flow
+                    nodes.extend(shares.items())
+        return proportional_flows
+
+    def _get_max_flows(self, node, max_flows):
+        """ Finds the most flow that can pass from `node` to `sink`.
+
+        This recurses onto the successors of `node` in the priority
+        tree and records the result for each in `max_flows`.
+
+        Args:
+            node (Hashable): A node in the priority tree (i.e. a
+                `TransactionNode` or an account).
+            max_flows (dict[Hashable, int]): A mapping of nodes to the
+                most flow that can pass from them to `sink`. *Mutated.*
+
+        Returns:
+            int: The most flow that can pass from `node` to `sink`, or
+            `None` if this can't be found by summing over successors
+            (i.e. if a node is found more than once in the tree or if
+            an account shares a group node with other accounts).
+        """
+        if node in max_flows:
+            # Flows through a shared node depend on both of its parents:
+            return None
+        if not isinstance(node, TransactionNode):
+            # Accounts have a single edge to `sink`, or to a group node
+            # (with an edge to `sink`). Flows through a group node
+            # depend on each of its accounts, unless there's only one:
+            successors = list(self.graph.successors(node))
+            if len(successors) != 1:
+                return None
+            flow = _edge_capacity(self.graph, node, successors[0])
+            if successors[0] != self.sink:
+                group_node = successors[0]
+                if (
+                        list(self.graph.predecessors(group_node)) != [node]
+                        or not self.graph.has_edge(group_node, self.sink)):
+                    return None
+                flow = min(
+                    flow, _edge_capacity(self.graph, group_node, self.sink))
+            max_flows[node] = flow
+            return flow
+        if node.is_leaf_node():
+            children = (node.source,)
+        else:
+            children = node.children
+        flow = 0
+        for child in children:
+            child_flow = self._get_max_flows(child, max_flows)
+            if child_flow is None:
+                return None
+            flow += child_flow
+        # Per-node limits are enforced on the edge to the outbound node:
+        outbound_node = _get_outbound_node(node, self.outbound_nodes)
+        if outbound_node is not node:
+            flow = min(
+                flow, _edge_capacity(self.graph, node, outbound_node))
+        max_flows[node] = flow
+        return flow
+
+    def _balance_flows(self, node, **kwargs):
+        """ Shifts capacity between children to match their weights.
+
+        The flows into `node` are divided between its children by
+        progressive filling: each child is given a share of the flows
+        proportionate to its weight. Children that can't receive any
+        more flow than they do (i.e. which have no path to `sink` with
+        unused capacity) keep the flows they can receive, which are
+        balanced amongst themselves (see `_balance_flows_recurse`), and
+        the rest of the flows are divided between the other children
+        in the same way.
+
+        This depends only on how much flow each child can receive, and
+        not on how flows are divided between children when several
+        divisions have the same cost.
 
         Args:
             node (Hashable): The node whose children are being
                 rebalanced.
-            children (dict[Hashable, float]): The children to be
-                rebalanced, mapped to their relative weights. Optional.
-                If not provided, all children of `node` are rebalanced.
-            rebalance_all (bool): If `True`, this method will attempt to
-                reassign capacities if they don't match total flows.
-                It sets this to `False` on recursion to avoid infinite
-                recursion due to rounding error. Optional. Defaults to
-                `True`.
             **kwargs: Arguments to pass to lower-level methods. Must
                 include at least "timing" and "limit" keys.
         """
-        if children is None:
-            children = node.children
-
-        if not children:
+        if not node.children:
             # Nothing to process if there are no children. Done.
             return
+        outbound_node = _get_outbound_node(node, self.outbound_nodes)
+        overflow_node = _get_overflow_node(
+            node, self.overflow_nodes, outbound_node=outbound_node)
 
-        # Try to generate flows through the graph.
+        # Find the total flows into the children of `node`, including
+        # flows that were shifted between children via `overflow_node`:
         _, flows = _generate_flows(self.graph, self.source, self.sink)
-        # Divide nodes based on whether flows match their capacities:
-        underflow, overflow, saturated = _classify_children_by_flows(
-            self.graph, node, children, flows,
-            self.outbound_nodes, self.overflow_nodes)
-
-        # Terminate if all nodes are saturated. This means we found
-        # a perfect proportion of flows to satisfy the source node's
-        # weights:
-        if not underflow and not overflow:
-            return
-        # If only _one_ of those two is empty, then we have an imbalance
-        # in capacity; need to reassign capacities to match flows:
-        elif bool(underflow) != bool(overflow):
-            # `rebalance_all` ensures that we recurse here *at most
-            # once* for each instance of children. (Can have infinite
-            # recursion due to rounding errors; this avoids that.)
-            if rebalance_all:
-                # Force recalculation of 0-weight edges' capacity based
-                # on the actual sum of flows through this node:
-                self._balance_flows_recurse(
-                    node, children=children, flows=flows,
-                    rebalance_all=False, **kwargs)
-                # Don't proceed on, since the old `flows` is based on
-                # unbalanced capacities.
-                return
-            elif saturated:
-                # We can't move capacity out of `saturated`, so treat
-                # them as under/overflow (whichever is empty):
-                if not underflow:
-                    saturated, underflow = underflow, saturated
-                else:
-                    saturated, overflow = overflow, saturated
-            else:
-                # If there are no saturated nodes then we have only
-                # underflow/overflow. Not much that can be done there.
-                return
+        capacity = _flows_through(
+            outbound_node, flows=flows, children=node.children)
+        if overflow_node is not None:
+            capacity += _flows_through(
+                overflow_node, flows=flows, children=node.children)
+            # Balancing decides how much flow each child receives, so
+            # don't let the solver shift flows between children:
+            overflow_capacity = _edge_capacity(
+                self.graph, outbound_node, overflow_node)
+            _add_edge(self.graph, outbound_node, overflow_node, capacity=0)
 
-        # We are guaranteed to have both underflow and overflow nodes.
-        # Recurse first onto all non-overflow nodes, to see if any
-        # capacity from saturated nodes can be shifted to underflow
-        # nodes in a way that better reflects their proportionate
-        # weights:
-        underflow_expanded = underflow.union(saturated)
         self._balance_flows_recurse(
-            node, children=underflow_expanded, flows=flows, **kwargs)
-
-        # Any saturated nodes that have changed capacity will
-        # necessarily have had their capacity reduced; shift those
-        # into `underflow`. This avoids recursing onto them in
-        # the non-overflow step.
-        _swap_saturated(
-            saturated, underflow, node, children, self.graph, flows,
-            outbound_nodes=self.outbound_nodes)
-
-        # Now do the same thing, but for non-underflow nodes.
-        overflow_expanded = overflow.union(saturated)
-        # NOTE: We use the same `flows` because only flows to
-        # _underflow_ nodes have changed in the previous step.
-        self._balance_flows_recurse(
-            node, children=overflow_expanded, flows=flows, **kwargs)
+            node, list(node.children), capacity, **kwargs)
+
+        if overflow_node is not None:
+            _add_edge(
+                self.graph, outbound_node, overflow_node,
+                capacity=overflow_capacity)
 
-    def _balance_flows_recurse(
-            self, node, children=None, flows=None, **kwargs):
+    def _balance_flows_recurse(self, node, children, capacity, **kwargs):
         """ Helper method for `_balance_flows`.
 
-        Calls `_add_successors` on `children` to distribute capacity
-        between them to match the amount in `flows` and then recurses
-        onto `_balance_flows` to ensure that the new capacities of
-        `children` are distributed correctly.
+        Divides `capacity` between `children` by progressive filling.
+        On each pass, `capacity` is divided between `children` in
+        proportion to their weights and flows are generated. Children
+        that can't receive more flow are then removed from `children`
+        (after recursing onto them with the flows they received) and
+        the remaining capacity is divided between the rest.
 
         Args:
             node (Hashable): The node whose children are being
                 rebalanced.
-            children (dict[Hashable, float]): The children to be
-                rebalanced, mapped to their relative weights. Optional.
-                If not provided, all children of `node` are rebalanced.
-            flows (dict[Hashable, dict[Hashable, int]]): Flows through
-                the graph, as `from_node: (to_node: flow)` triples.
+            children (list[Hashable]): The children to be rebalanced,
+                in the same order as in `node.children`.
+            capacity (int): The total flow to be divided between
+                `children`, excluding any flows in `self.memo`.
             **kwargs: Arguments to pass to lower-level methods. Must
                 include at least "timing" and "limit" keys.
         """
-        # Process input:
-        if children is None:
-            children = node.children
         outbound_node = _get_outbound_node(node, self.outbound_nodes)
-        overflow_node = _get_overflow_node(
-            node, self.overflow_nodes, outbound_node=outbound_node)
-
-        if flows is not None:
-            # Calling code can provide `flows`, in which case edges to
-            # children should be re-allocated based on actual flows
-            # (rather than capacities, which may be under- or
-            # over-provisioned).
-            capacity = sum(flows[outbound_node][child] for child in children)
-            if overflow_node is not None:
-                capacity += sum(
-                    flows[overflow_node][child] for child in children)
-        else:
-            # Otherwise, simply use the 0-weight capacity to `children`:
-            capacity = _outbound_capacity(
-                self.graph, outbound_node, weight=0, children=children)
-
-        # _add_successors expects `children` to have the appropriate
-        # typing for this kind of node, so enforce that here:
-        children_subset = node.children_subset(children)
-        # Attempt to reallocate capacity among children based on the
-        # parent node's weights.
-        self._add_successors(
-            node, capacity=capacity, children=children_subset,
-            # (Don't mess with overflow nodes at this stage)
-            add_overflow=False, **kwargs)
-        # If there are multiple children, recurse onto them to ensure
-        # that they are balanced relative to each other:
-        if len(children) > 1:
-            # Ensure that, if any changes in capacity cause additional
-            # flow to go through `overflow_node`, that such overflows
-            # are directed to `children` (which we know can accept it.)
-            _restrict_overflow(
-                self.graph, node, children, flows, self.overflow_nodes,
-                outbound_nodes=self.outbound_nodes)
-            self._balance_flows(node, children=children, **kwargs)
-            # Undo the foregoing mutation of edges from `overflow_node`:
-            _unrestrict_overflow(self.graph, node, self.overflow_nodes)
+        while children:
+            # _add_successors expects `children` to have the appropriate
+            # typing for this kind of node, so enforce that here:
+            self._add_successors(
+                node, capacity=capacity,
+                children=node.children_subset(children),
+                # (Don't mess with overflow nodes at this stage)
+                add_overflow=False, **kwargs)
+            if len(children) == 1:
+                # A single child gets all of `capacity`. Done.
+                return
+            _, flows = _generate_flows(self.graph, self.source, self.sink)
+            limited = _limited_children(
+                self.graph, node, children, flows, self.sink,
+                outbound_nodes=self.outbound_nodes,
+                overflow_nodes=self.overflow_nodes)
+            limited_capacity = _flows_through(
+                outbound_node, flows=flows, children=limited)
+            if not limited:
+                total = _flows_through(
+                    outbound_node, flows=flows, children=children)
+                if total >= capacity:
+                    # Every child receives its share. Done.
+                    return
+                # Less flow reaches `node` than expected, so there's
+                # less to divide between children:
+                capacity = total
+            elif len(limited) == len(children):
+                # None of the children can receive more flow, so there's
+                # no way to shift flows between them. Fix their
+                # capacities at the flows they receive:
+                for child in children:
+                    _add_edge(
+                        self.graph, outbound_node, child,
+                        capacity=flows[outbound_node][child])
+                return
+            else:
+                # Divide the flows that `limited` can receive between
+                # them, then divide the rest between the other children:
+                self._balance_flows_recurse(
+                    node, limited, limited_capacity, **kwargs)
+                children = [
+                    child for child in children if child not in limited]
+                capacity -= limited_capacity
 
     def _add_node_ordered(
             self, node, children, *, capacity=None, **kwargs):
@@ -1104,7 +1398,8 @@ class TransactionTraversal(HighPrecisionOptional):
 
     def _add_node_account(
             self, node, *args,
-            timing=None, limit=None, **kwargs):
+            timing=None, limit=None, min_capacities=None, capacities=None,
+            **kwargs):
         """ Adds an account (of any type) to the graph.
 
         This method determines the limit on transactions to this account
@@ -1121,6 +1416,13 @@ class TransactionTraversal(HighPrecisionOptional):
         node in `self.memo`, edge capacities for both are reduced
         accordingly to avoid exceeding transaction limits.
 
+        If `node` is in `min_capacities`, it also gets an edge to a
+        "min" node (which has an edge to `sink`) with capacity equal to
+        its minimum transactions, and its other edge to `sink` has its
+        capacity reduced by that amount. The min. edge has 0 weight;
+        `_build_graph` weights the other edges of every account so that
+        min. flows are assigned in preference to others.
+
         Args:
             node (Hashable): A node that acts as the origin for edges
                 to the members of `children`. Need not be a
@@ -1130,6 +1432,12 @@ class TransactionTraversal(HighPrecisionOptional):
             limit (str): The name for the appropriate attribute of
                 `LimitTuple` to use for this traversal (e.g.
                 "min_inflow", "max_outflow")
+            min_capacities (dict[Hashable, int]): A mapping of accounts
+                to the (scaled) capacities of their minimum
+                transactions. Optional.
+            capacities (dict[tuple[Hashable, str], int]): Capacities
+                previously found for `timing`. See `_get_capacity`.
+                Optional. *Mutated.*
             **kwargs: Arguments to pass to lower-level methods. Must
                 include at least "timing" and "limit" keys.
         """
@@ -1139,28 +1447,23 @@ class TransactionTraversal(HighPrecisionOptional):
         # `_add_successors` will always pass a third value (None, in the
         # case of this method).
 
-        # NOTE: It's expensive to query the account, and for a given
-        # `limit` the result shouldn't change. Consider caching the
-        # result on first invocation and reusing it on subsequent
-        # invocations.
-
         # The capacity of an account is not a function of its
         # inbound edges. It's dictated by the account itself.
         # Query the account for the time-series of transactions that
-        # defines its capacity for the given `limit`:
-        transactions = _get_transactions(
-            node, limit, timing, transaction_methods=self.transaction_methods)
-        transaction_limit = sum(transactions.values())
-        # Ideally if we're operating in a high-precision mode,
-        # `transaction_limit` will already be in a high-precision type
-        # (to match self.precision), but if not then we need to convert:
-        if (
-                self.high_precision is not None and
-                isinstance(transaction_limit,float)):
-            transaction_limit = self.high_precision(transaction_limit)
-        # Scale up based on the precision (as we do with all edge
-        # capacities):
-        capacity = transaction_limit / self.precision
+        # defines its capacity for the given `limit` (or reuse it, if
+        # it's already been found for this `timing`):
+        # (Flows are non-negative, so use the magnitude of the limit;
+        # outflow limits are negative.)
+        capacity = abs(self._get_capacity(node, limit, timing, capacities))
+
+        # Route min. flows over a separate edge, if applicable:
+        if min_capacities and node in min_capacities:
+            min_node = (node, "min")
+            min_capacity = min_capacities[node]
+            _add_edge(
+                self.graph, node, min_node, capacity=min_capacity, weight=0)
+            _add_edge(self.graph, min_node, self.sink, capacity=min_capacity)
+            capacity -= min_capacity
 
         # Most accounts add an edge straight to `sink`, but accounts
         # that have shared transaction limits have special treatment:
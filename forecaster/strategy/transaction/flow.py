@@ -0,0 +1,303 @@
+""" Provides a min-cost max-flow solver for small directed graphs.
+
+`TransactionTraversal` solves the same graph many times over, changing
+only a few edge capacities (and occasionally weights) between solves.
+`FlowNetwork` stores a graph as integer arrays of edges and keeps its
+flows between solves, so that each re-solve only has to find the
+(usually small) change in flows rather than starting from scratch.
+"""
+
+from array import array
+
+# Used to represent edges without a capacity limit:
+INFINITY = float('inf')
+# Residual capacities are stored as 64-bit ints, so `INFINITY` is stored
+# as this value instead. Finite capacities must be less than
+# `MAX_CAPACITY`, so that the residual of an unlimited edge can't be
+# mistaken for a finite one (even after flows are pushed over it):
+_UNLIMITED = 2 ** 62
+MAX_CAPACITY = 2 ** 61
+
+
+class UnboundedFlowError(ArithmeticError):
+    """ Raised when a graph admits unlimited flow (or unlimited gain). """
+
+
+class FlowNetwork(object):
+    """ A residual graph for solving min-cost max-flow problems.
+
+    Each edge of the input graph is stored as a pair of residual edges:
+    a forward edge at an even index `2k` and its reverse edge at `2k+1`.
+    Edge endpoints, costs, capacities and residual capacities are all
+    stored in integer arrays. (Capacities of `INFINITY` are stored as a
+    sentinel value larger than any finite capacity.)
+
+    Flows are found by successive shortest paths: flow is repeatedly
+    pushed along the cheapest path from `source` to `sink` with spare
+    capacity until no such path remains. Flows are retained between
+    calls to `solve`. If capacities or costs have changed, the retained
+    flows are first made optimal (by cancelling negative-cost cycles)
+    and then augmented, which is much cheaper than re-solving when only
+    a few edges have changed. If any edge's new capacity is less than
+    its retained flow, the network is re-solved from zero flow.
+
+    Examples:
+        ```
+        network = FlowNetwork(
+            ['s', 'a', 'b', 't'],
+            [('s', 'a', 10, 0), ('s', 'b', INFINITY, 0),
+             ('a', 't', 5, 0), ('b', 't', 5, 1)])
+        network.solve('s', 't')  # 10 (5 via a, 5 via b)
+        network.set_capacity('a', 't', 10)
+        network.solve('s', 't')  # 15 (10 via a, 5 via b)
+        ```
+
+    Args:
+        nodes (Iterable[Hashable]): The nodes of the graph.
+        edges (Iterable[tuple[Hashable, Hashable, int, int]]): The
+            edges of the graph, as `(from_node, to_node, capacity,
+            cost)` tuples. `capacity` must be a non-negative `int`
+            less than `MAX_CAPACITY` or `INFINITY` and `cost` must be
+            an `int`. Costs may be negative, but no cycle of edges may
+            have negative total cost.
+
+    Attributes:
+        nodes (list[Hashable]): The nodes of the graph. The index of a
+            node in this list is used to refer to it internally.
+    """
+
+    def __init__(self, nodes, edges):
+        """ Inits FlowNetwork. """
+        self.nodes = list(nodes)
+        self._node_index = {node: i for i, node in enumerate(self.nodes)}
+        # `_adjacent[i]` lists the residual edges leaving node `i`:
+        self._adjacent = [array('l') for _ in self.nodes]
+        self._head = array('l')
+        self._cost = array('q')
+        self._residual = array('q')
+        self._capacity = array('q')
+        self._edge_index = {}
+        # Whether the retained flows might no longer be cheapest:
+        self._stale = False
+        for from_node, to_node, capacity, cost in edges:
+            self._add_edge(from_node, to_node, capacity, cost)
+
+    def _add_edge(self, from_node, to_node, capacity, cost):
+        """ Adds a forward edge and its reverse edge to the network. """
+        capacity = _to_stored(capacity)
+        i = self._node_index[from_node]
+        j = self._node_index[to_node]
+        edge = len(self._head)
+        self._edge_index[(from_node, to_node)] = edge
+        self._capacity.append(capacity)
+        # Forward edge:
+        self._head.append(j)
+        self._cost.append(cost)
+        self._residual.append(capacity)
+        self._adjacent[i].append(edge)
+        # Reverse edge (no capacity until flow is pushed forward):
+        self._head.append(i)
+        self._cost.append(-cost)
+        self._residual.append(0)
+        self._adjacent[j].append(edge + 1)
+
+    def has_edge(self, from_node, to_node):
+        """ Whether the network has an edge from `from_node` to `to_node`. """
+        return (from_node, to_node) in self._edge_index
+
+    @property
+    def num_edges(self):
+        """ The number of (forward) edges in the network. """
+        return len(self._capacity)
+
+    def flow(self, from_node, to_node):
+        """ The flow over the edge from `from_node` to `to_node`. """
+        # The flow over a forward edge is the residual of its reverse:
+        return self._residual[self._edge_index[(from_node, to_node)] + 1]
+
+    def set_capacity(self, from_node, to_node, capacity):
+        """ Sets the capacity of an edge, retaining its flow if possible.
+
+        If `capacity` is less than the flow over the edge, the flow is
+        retained until the next call to `solve`, which will re-solve
+        the whole network.
+        """
+        edge = self._edge_index[(from_node, to_node)]
+        capacity = _to_stored(capacity)
+        if capacity == self._capacity[edge // 2]:
+            return
+        if capacity > self._capacity[edge // 2]:
+            # New spare capacity might offer a cheaper route for flows:
+            self._stale = True
+        self._capacity[edge // 2] = capacity
+        # Negative residuals are caught by `solve`:
+        self._residual[edge] = capacity - self._residual[edge + 1]
+
+    def set_cost(self, from_node, to_node, cost):
+        """ Sets the cost of an edge. """
+        edge = self._edge_index[(from_node, to_node)]
+        if cost == self._cost[edge]:
+            return
+        self._stale = True
+        self._cost[edge] = cost
+        self._cost[edge + 1] = -cost
+
+    def reset(self):
+        """ Removes all flows from the network. """
+        for edge in range(0, len(self._residual), 2):
+            self._residual[edge] = self._capacity[edge // 2]
+            self._residual[edge + 1] = 0
+        self._stale = False
+
+    def solve(self, source, sink):
+        """ Finds a maximum flow from `source` to `sink` at minimum cost.
+
+        Args:
+            source (Hashable): The node that flow originates from.
+            sink (Hashable): The node that flow terminates at.
+
+        Returns:
+            int: The total flow from `source` to `sink`.
+
+        Raises:
+            UnboundedFlowError: A path from `source` to `sink` (or a
+                negative-cost cycle) has unlimited capacity.
+        """
+        # If a capacity has been reduced below its flow, the retained
+        # flows are infeasible. Start over:
+        if any(residual < 0 for residual in self._residual):
+            self.reset()
+        # Otherwise the retained flows are feasible, but if costs have
+        # changed or capacities increased they might not be cheapest:
+        elif self._stale:
+            self._cancel_negative_cycles()
+        self._stale = False
+        source = self._node_index[source]
+        sink = self._node_index[sink]
+        while True:
+            path = self._shortest_path(source, sink)
+            if path is None:
+                break
+            self._augment(path)
+        return self._net_outflow(source)
+
+    def _net_outflow(self, node):
+        """ The flow out of `node` less the flow into it. """
+        total = 0
+        for edge in self._adjacent[node]:
+            if edge % 2 == 0:
+                # Forward edge out of `node`; its flow is outbound:
+                total += self._residual[edge + 1]
+            else:
+                # Reverse of an edge into `node`; its flow is inbound:
+                total -= self._residual[edge]
+        return total
+
+    def _augment(self, path):
+        """ Pushes as much flow as possible along `path` (a list of edges). """
+        amount = min(self._residual[edge] for edge in path)
+        if amount >= MAX_CAPACITY:
+            raise UnboundedFlowError(
+                'Flow is unbounded: found a path or negative-cost cycle '
+                + 'with infinite capacity.')
+        for edge in path:
+            self._residual[edge] -= amount
+            self._residual[edge ^ 1] += amount
+
+    def _shortest_path(self, source, sink):
+        """ The cheapest path with spare capacity, as a list of edges.
+
+        Uses a queue-based Bellman-Ford search, since reverse edges have
+        negative costs. Returns `None` if there is no such path.
+        """
+        num_nodes = len(self.nodes)
+        distance = [INFINITY] * num_nodes
+        via = [-1] * num_nodes
+        queued = bytearray(num_nodes)
+        distance[source] = 0
+        queue = [source]
+        queued[source] = 1
+        position = 0
+        while position < len(queue):
+            node = queue[position]
+            position += 1
+            queued[node] = 0
+            for edge in self._adjacent[node]:
+                if self._residual[edge] <= 0:
+                    continue
+                head = self._head[edge]
+                cost = distance[node] + self._cost[edge]
+                if cost < distance[head]:
+                    distance[head] = cost
+                    via[head] = edge
+                    if not queued[head]:
+                        queued[head] = 1
+                        queue.append(head)
+        if via[sink] == -1:
+            return None
+        path = []
+        node = sink
+        while node != source:
+            edge = via[node]
+            path.append(edge)
+            node = self._head[edge ^ 1]
+        return path
+
+    def _cancel_negative_cycles(self):
+        """ Pushes flow around negative-cost cycles until none remain.
+
+        A flow of a given value is cheapest if and only if its residual
+        graph has no negative-cost cycles, so this restores optimality
+        after costs or capacities have changed.
+        """
+        while True:
+            cycle = self._negative_cycle()
+            if cycle is None:
+                return
+            self._augment(cycle)
+
+    def _negative_cycle(self):
+        """ A negative-cost cycle with spare capacity, or `None`. """
+        num_nodes = len(self.nodes)
+        # Start every node at distance 0, as if from a virtual source
+        # with an edge to every node. This finds cycles anywhere:
+        distance = [0] * num_nodes
+        via = [-1] * num_nodes
+        updated = -1
+        for _ in range(num_nodes):
+            updated = -1
+            for node in range(num_nodes):
+                for edge in self._adjacent[node]:
+                    if self._residual[edge] <= 0:
+                        continue
+                    head = self._head[edge]
+                    cost = distance[node] + self._cost[edge]
+                    if cost < distance[head]:
+                        distance[head] = cost
+                        via[head] = edge
+                        updated = head
+            if updated == -1:
+                return None
+        # Still updating after `num_nodes` passes, so there's a cycle.
+        # Walking back `num_nodes` steps is guaranteed to land on it:
+        node = updated
+        for _ in range(num_nodes):
+            node = self._head[via[node] ^ 1]
+        cycle = []
+        start = node
+        while True:
+            edge = via[node]
+            cycle.append(edge)
+            node = self._head[edge ^ 1]
+            if node == start:
+                return cycle
+
+
+def _to_stored(capacity):
+    """ Converts `capacity` to the `int` stored in a `FlowNetwork`. """
+    if capacity == INFINITY:
+        return _UNLIMITED
+    if capacity >= MAX_CAPACITY:
+        raise OverflowError(
+            'FlowNetwork: capacity ' + str(capacity) + ' is too large.')
+    return int(capacity)
@@ -4,18 +4,34 @@ Wraps networkx and adds a few convenience methods.
 """
 
 import networkx
+from forecaster.strategy.transaction.flow import (
+    FlowNetwork, UnboundedFlowError, INFINITY)
 
 CAPACITY_KEY = "capacity"
 WEIGHT_KEY = "weight"
 LIMIT_KEY = "limit"
+# The key of the `FlowNetwork` stored in a graph's attributes dict:
+FLOW_NETWORK_KEY = "flow_network"
+# The key of the cached `_sum_weight` values in a graph's attributes:
+WEIGHT_SUMS_KEY = "weight_sums"
 
-def _get_empty_graph():
+def _get_empty_graph(template=None):
     """ Generates an empty directed graph.
 
+    Args:
+        template (networkx.DiGraph): A graph that was previously solved
+            by `_generate_flows`. If provided, the new graph will reuse
+            the flows found for `template` as a starting point, which
+            is faster if the new graph is given the same edges.
+            Optional.
+
     Returns:
         networkx.DiGraph
     """
-    return networkx.DiGraph()
+    graph = networkx.DiGraph()
+    if template is not None and FLOW_NETWORK_KEY in template.graph:
+        graph.graph[FLOW_NETWORK_KEY] = template.graph[FLOW_NETWORK_KEY]
+    return graph
 
 def _inbound_capacity(graph, node):
     """ Calculates the total capacity of inbound edges to node.
@@ -25,8 +41,8 @@ def _inbound_capacity(graph, node):
         node (Hashable): A node in `graph`.
 
     Returns:
-        float: The sum of the capacities of inbound edges. Inbound
-        edges with no `capacity` attribute are ignored.
+        int: The sum of the capacities of inbound edges. This is
+        `INFINITY` if any such edge has unlimited capacity.
     """
     # For each node, we'll calculate this amount each time the node is
     # encountered and distribute it between outbound edges.
@@ -34,13 +50,11 @@ def _inbound_capacity(graph, node):
     # from the parent node during recursion, because `node` could be
     # found at multiple spots in the tree, so the amount to distribute
     # between outbound edges can change during recursion.)
-    capacity = sum(
+    # Any unlimited edge makes the sum unlimited, since `INFINITY` is
+    # a float and adding it to anything gives `INFINITY`:
+    return sum(
         graph[parent][node][CAPACITY_KEY]
-        for parent in graph.predecessors(node)
-        if CAPACITY_KEY in graph[parent][node])
-    # TODO: If any(CAPACITY_KEY not in graph[parent[node]]) then
-    # return float('inf')?
-    return capacity
+        for parent in graph.predecessors(node))
 
 def _outbound_capacity(graph, node, weight=None, children=None):
     """ Calculates the total capacity of outbound edges from node.
@@ -54,9 +68,9 @@ def _outbound_capacity(graph, node, weight=None, children=None):
             `node` and members of `children` are included. Optional.
 
     Returns:
-        float: The sum of the capacities of outbound edges from
-        `node` to its successors. Outbound edges with no `capacity`
-        attribute are ignored.
+        int: The sum of the capacities of outbound edges from `node`
+        to its successors. This is `INFINITY` if any such edge has
+        unlimited capacity.
     """
     if children is None:
         children = graph.successors(node)
@@ -65,31 +79,85 @@ def _outbound_capacity(graph, node, weight=None, children=None):
     for child in children:
         # `edge` is a dict with str-valued keys.
         edge = graph[node][child]
-        if CAPACITY_KEY in edge:
-            if (
-                    # If `weight` is not provided, add up all edges:
-                    weight is None or
-                    # If `weight` is provided, only add edges with that
-                    # specific weight (i.e. ignore other edges)
-                    (
-                        WEIGHT_KEY in edge and
-                        edge[WEIGHT_KEY] == weight) or
-                    # If an edge lacks a weight attribute, it is treated
-                    # as if it has 0 weight. If `weight` is 0, we should
-                    # include that edge's capacity:
-                    (WEIGHT_KEY not in edge and weight == 0)
-            ):
-                capacity += graph[node][child][CAPACITY_KEY]
-        else:
-            # If capacity is not explicitly provided, it's infinite:
-            capacity = float('inf')
+        if edge[CAPACITY_KEY] == INFINITY:
+            # Any edge with unlimited capacity makes the total
+            # unlimited (regardless of its weight):
+            capacity = INFINITY
+        elif (
+                # If `weight` is not provided, add up all edges:
+                weight is None or
+                # If `weight` is provided, only add edges with that
+                # specific weight (i.e. ignore other edges)
+                (
+                    WEIGHT_KEY in edge and
+                    edge[WEIGHT_KEY] == weight) or
+                # If an edge lacks a weight attribute, it is treated
+                # as if it has 0 weight. If `weight` is 0, we should
+                # include that edge's capacity:
+                (WEIGHT_KEY not in edge and weight == 0)
+        ):
+            capacity += edge[CAPACITY_KEY]
     return capacity
 
+def _edge_capacity(graph, from_node, to_node):
+    """ Returns the capacity of the edge from `from_node` to `to_node`.
+
+    Args:
+        graph (networkx.DiGraph): A directed graph.
+        from_node (Hashable): A node in `graph`.
+        to_node (Hashable): A successor of `from_node` in `graph`.
+
+    Returns:
+        int: The capacity of the edge (`INFINITY` if unlimited).
+    """
+    return graph[from_node][to_node][CAPACITY_KEY]
+
+def _apportion(capacity, weights):
+    """ Divides `capacity` into whole units in proportion to `weights`.
+
+    Each key of `weights` receives its proportionate share of
+    `capacity`, rounded down. The units left over are then given to
+    the keys with the largest remainders (i.e. largest-remainder
+    apportionment), so the shares sum to exactly `capacity` (or to
+    `int(capacity)` if `capacity` isn't a whole number of units.)
+
+    Args:
+        capacity (int): The capacity to divide. Must be non-negative.
+            May be `INFINITY`, in which case each key gets `INFINITY`.
+        weights (dict[Hashable, float]): A mapping of keys to their
+            relative weights. Weights must be non-negative and must not
+            all be zero.
+
+    Returns:
+        dict[Hashable, int]: A mapping of each key of `weights` to its
+        share of `capacity`.
+    """
+    if capacity == INFINITY:
+        return {key: INFINITY for key in weights}
+    normalization = sum(weights.values())
+    shares = {}
+    remainders = {}
+    for key, weight in weights.items():
+        share = capacity * weight / normalization
+        shares[key] = int(share)
+        remainders[key] = share - shares[key]
+    # Hand out the remaining units, largest remainder first. (`sorted`
+    # is stable, so ties go to keys in the order of `weights`.)
+    remaining = max(int(capacity) - sum(shares.values()), 0)
+    for key in sorted(
+            remainders, key=remainders.get, reverse=True)[:remaining]:
+        shares[key] += 1
+    return shares
+
 def _sum_weight(graph, node):
     """ Returns the sum of edge weights of all n-successors of `node`.
 
     `graph` must be acyclic, otherwise this method may not terminate.
 
+    Sums are cached on `graph` (see `_clear_weight_sums`), so each
+    node's sum is only calculated once per graph, no matter how many
+    times this method is called for `node` or its ancestors.
+
     Args:
         graph (networkx.DiGraph): A directed graph.
         node (Hashable): A node in `graph`
@@ -103,14 +171,57 @@ def _sum_weight(graph, node):
     # weight of any path from `node` to `sink`. But that problem is
     # NP-hard, whereas just summing over all descendant edges can be
     # done in linear time. Just be sure that there are no cycles!
-    weight = 0
-    for child in graph.successors(node):
-        # Find weights on this node's children:
-        if WEIGHT_KEY in graph[node][child]:
-            weight += graph[node][child][WEIGHT_KEY]
-        # And also on those children's descendants:
-        weight += _sum_weight(graph, child)
-    return weight
+    # (That's only an upper bound if there are no negative weights,
+    # which `TransactionTraversal` never adds.)
+    weight_sums = graph.graph.setdefault(WEIGHT_SUMS_KEY, {})
+    # Visit descendants in post-order, so that each node's sum is
+    # found after the sums of all of its children:
+    stack = [node]
+    while stack:
+        current = stack[-1]
+        if current in weight_sums:
+            stack.pop()
+            continue
+        pending = [
+            child for child in graph.successors(current)
+            if child not in weight_sums]
+        if pending:
+            stack.extend(pending)
+            continue
+        stack.pop()
+        weight = 0
+        for child in graph.successors(current):
+            # Find weights on this node's children:
+            weight += graph[current][child].get(WEIGHT_KEY, 0)
+            # And also on those children's descendants:
+            weight += weight_sums[child]
+        weight_sums[current] = weight
+    return weight_sums[node]
+
+def _clear_weight_sums(graph, node):
+    """ Discards cached `_sum_weight` values affected by `node`.
+
+    This must be called whenever an edge from `node` is added or has
+    its weight changed. Only the sums of `node` and its ancestors are
+    discarded; they are recalculated (reusing the sums of any other
+    nodes) the next time they're needed.
+
+    Args:
+        graph (networkx.DiGraph): A directed graph.
+        node (Hashable): A node in `graph`.
+    """
+    weight_sums = graph.graph.get(WEIGHT_SUMS_KEY)
+    if not weight_sums:
+        return
+    # A cached node's descendants are always cached too, so we can
+    # stop at any ancestor without a cached sum:
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if current in weight_sums:
+            del weight_sums[current]
+            if current in graph:
+                stack.extend(graph.predecessors(current))
 
 def _add_edge(
         graph, from_node, to_node, memo=None, **kwargs):
@@ -125,6 +236,11 @@ def _add_edge(
     handles infinite-valued inputs appropriately, and reduces edges'
     capacities based on any flows in `memo`.
 
+    Capacities are amounts in fixed-point units (i.e. amounts that
+    have been divided by some `precision`) and are truncated to whole
+    units. New edges without a `capacity` value get a capacity of
+    `INFINITY`.
+
     Args:
         graph (networkx.DiGraph): A directed graph.
         from_node (Hashable): A node in `graph`. The added edge will
@@ -150,18 +266,16 @@ def _add_edge(
         # Reduce capacity by any previously-allocated flows over this
         # edge:
         capacity -= _flows_through(from_node, to_node, flows=memo)
-        # Only assign `capacity` as an edge value if it is finite.
-        # (networkx doesn't deal well with float('inf'). The
-        # "capacity" attr should be absent if capacity is unbounded.)
-        if capacity < float('inf'):
-            # Round `capacity` to an int (recommended by networkx):
-            # https://networkx.github.io/documentation/stable/reference/algorithms/generated/networkx.algorithms.flow.max_flow_min_cost.html#networkx.algorithms.flow.max_flow_min_cost
-            # (See `Notes`: "This algorithm is not guaranteed to
-            # work if edge weights or demands [capacities] are
-            # floating point numbers.")
+        if capacity < INFINITY:
+            # Flows are found in whole units. Truncate (rather than
+            # round) so that flows never exceed the amount that
+            # `capacity` represents:
             kwargs[CAPACITY_KEY] = int(capacity)
         else:
-            del kwargs[CAPACITY_KEY]
+            kwargs[CAPACITY_KEY] = INFINITY
+    elif not graph.has_edge(from_node, to_node):
+        # Edges have unlimited capacity unless otherwise specified:
+        kwargs[CAPACITY_KEY] = INFINITY
 
     if WEIGHT_KEY in kwargs:
         # We shouldn't ever add non-floating-point weight, but just in
@@ -169,6 +283,15 @@ def _add_edge(
         # NOTE: No need to worry about infinite-value weights.
         kwargs[WEIGHT_KEY] = int(kwargs[WEIGHT_KEY])
 
+    # New edges and changes to weights change the weight sums of
+    # `from_node` and its ancestors:
+    if not graph.has_edge(from_node, to_node):
+        _clear_weight_sums(graph, from_node)
+    elif WEIGHT_KEY in kwargs:
+        old_weight = graph[from_node][to_node].get(WEIGHT_KEY, 0)
+        if old_weight != kwargs[WEIGHT_KEY]:
+            _clear_weight_sums(graph, from_node)
+
     graph.add_edge(from_node, to_node, **kwargs)
 
 def _merge_flows(first, second):
@@ -267,14 +390,60 @@ def _generate_flows(graph, source, sink):
         dict[Hashable: dict[Hashable: int]]: Flows as
             `from_node: (to_node: flow_value)` triples. Optional.
     """
-    # For more on this networkx algoritm, see:
-    # https://networkx.github.io/documentation/networkx-1.10/reference/generated/networkx.algorithms.flow.max_flow_min_cost.html#networkx.algorithms.flow.max_flow_min_cost
-    flows = networkx.algorithms.flow.max_flow_min_cost(
-        graph, source, sink, capacity=CAPACITY_KEY, weight=WEIGHT_KEY)
-    # Total flow is equal to whatever's flowing out of `source`:
-    total = sum(flows[source].values())
+    # This is called repeatedly on the same graph with only a few
+    # edges changed between calls, so we keep a `FlowNetwork` with the
+    # graph and update it rather than solving from scratch each time:
+    network = _get_flow_network(graph)
+    try:
+        total = network.solve(source, sink)
+    except UnboundedFlowError as error:
+        # Raise the same error that networkx's solver would:
+        raise networkx.NetworkXUnbounded(str(error)) from error
+    flows = {
+        node: {child: network.flow(node, child) for child in children}
+        for node, children in graph.adjacency()}
     return total, flows
 
+def _get_flow_network(graph):
+    """ Returns a `FlowNetwork` matching `graph`'s current edges.
+
+    The network is stored in `graph`'s attributes dict and reused on
+    later calls (with its flows, which speeds up re-solving). If edges
+    have been added to or removed from `graph` since the network was
+    built, a new network is built.
+
+    Args:
+        graph (networkx.DiGraph): A directed graph.
+
+    Returns:
+        FlowNetwork: A network with the same nodes and edges as
+        `graph`, with the capacities and weights of `graph`'s edges.
+    """
+    network = graph.graph.get(FLOW_NETWORK_KEY)
+    if (
+            network is not None
+            and len(network.nodes) == graph.number_of_nodes()
+            and network.num_edges == graph.number_of_edges()):
+        # Update the existing network in place, unless we find an edge
+        # that it doesn't have:
+        for from_node, to_node, data in graph.edges(data=True):
+            if not network.has_edge(from_node, to_node):
+                break
+            network.set_capacity(from_node, to_node, data[CAPACITY_KEY])
+            network.set_cost(from_node, to_node, data.get(WEIGHT_KEY, 0))
+        else:
+            return network
+    # Edges without a weight attribute have zero weight:
+    network = FlowNetwork(
+        graph.nodes,
+        (
+            (
+                from_node, to_node, data[CAPACITY_KEY],
+                data.get(WEIGHT_KEY, 0))
+            for from_node, to_node, data in graph.edges(data=True)))
+    graph.graph[FLOW_NETWORK_KEY] = network
+    return network
+
 def _get_related_node(node_relations, *nodes):
     """ Finds a node that is related to one of the nodes in `nodes`.
 
@@ -367,193 +536,60 @@ def _get_overflow_node(node, overflow_nodes, outbound_node=None):
     # then fall back to `node` if none was found:
     return _get_related_node(overflow_nodes, outbound_node, node)
 
-def _restrict_overflow(
-        graph, node, children, flows, overflow_nodes, outbound_nodes=None):
-    """ Limits overflows to successors not in `children` at given flows.
-
-    If `node` (or its outbound node) has an overflow node, outbound
-    edges from that overflow node to any children not in `children` have
-    their capacity limited to the values for those edges in `flows`.
-    This prevents any children not in `children` from increasing their
-    total flows, but allows flows to shift between nodes in `children`.
-
-    `_unrestrict_overflow` is a companion method.
-
-    Args:
-        graph (networkx.DiGraph): A directed graph.
-        node (Hashable): A node in `graph`
-        children (Iterable[Hashable]): A collection of `node`'s children
-            to which overflows should _not_ be restricted.
-        flows (dict[Hashable: dict[Hashable: int]]): Flows as
-            `from_node: (to_node: flow_value)` triples. Optional.
-        overflow_nodes (dict[Hashable, Hashable]): A mapping of
-            `node: overflow_node` pairs.
-        outbound_nodes (dict[Hashable, Hashable]): A mapping of
-            `node: outbound_node` pairs. Optional.
-    """
-    # Process input:
-    outbound_node = _get_outbound_node(node, outbound_nodes)
-    overflow_node = _get_overflow_node(
-        node, overflow_nodes, outbound_node=outbound_node)
-
-    if overflow_node is None:
-        # If there is no overflow node, there's nothing to do.
-        return
-
-    # Limit the capacity from `overflow_node` to each child of `node`
-    # which is _not_ in `children`. The goal here is to ensure that any
-    # changed in 0-weight capacity result in excess flow being forced
-    # through `children` (via `overflow_node`) and not other nodes.
-    for child in node.children:
-        if child not in children:
-            if overflow_node in flows and child in flows[overflow_node]:
-                capacity = flows[overflow_node][child]
-            else:
-                capacity = 0
-            edge_data = {CAPACITY_KEY: capacity}
-            graph.add_edge(overflow_node, child, **edge_data)
-
-def _unrestrict_overflow(
-        graph, node, overflow_nodes, outbound_nodes=None):
-    """ Undoes the effects of `_restrict_overflow`.
-
-    If `node` (or its outbound node) has an overflow node, outbound
-    edges from that overflow node have their capacity reset so as not
-    to restrict flows over those edges.
-
-    Args:
-        graph (networkx.DiGraph): A directed graph.
-        node (Hashable): A node in `graph`
-        overflow_nodes (dict[Hashable, Hashable]): A mapping of
-            `node: overflow_node` pairs.
-        outbound_nodes (dict[Hashable, Hashable]): A mapping of
-            `node: outbound_node` pairs. Optional.
-    """
-    # Process input:
-    outbound_node = _get_outbound_node(node, outbound_nodes)
-    overflow_node = _get_overflow_node(
-        node, overflow_nodes, outbound_node=outbound_node)
-
-    if overflow_node is None:
-        # If there is no overflow node, there's nothing to do.
-        return
-
-    # Restore plenty of capacity to each edge from `overflow_node` to
-    # each child:
-    capacity = _outbound_capacity(graph, outbound_node, weight=0)
-    for child in node.children:
-        edge_data = {CAPACITY_KEY: capacity}
-        graph.add_edge(overflow_node, child, **edge_data)
-
-def _swap_saturated(
-        saturated, non_saturated, node, children, graph, flows,
-        outbound_nodes=None):
-    """ Moves nodes with differing flows/capacity to `non_saturated`.
+def _limited_children(
+        graph, node, children, flows, sink,
+        outbound_nodes=None, overflow_nodes=None):
+    """ Finds children of `node` that can't receive any more flow.
 
-    Any nodes in `saturated` which have inbound flows from `node`
-    that are different from the flows in `flows` are moved to
-    `non_saturated`. The implication of such a mismatch is that
-    such nodes now receive more or less flows than their 0-weight
-    capacity, which means they are not saturated.
+    A child can receive more flow if, given `flows`, there's a path
+    from it to `sink` over edges with unused capacity (or backwards over
+    edges with flow) which doesn't pass through the outbound or overflow
+    nodes of `node`. (Paths through those nodes only shift flow between
+    the children of `node`.)
 
-    `saturated` and `non_saturated` are mutated by this method.
-
-    Args:
-        saturated (set[Hashable]): A collection of nodes to check for
-            saturated status.
-        non_saturated (set[Hashable]): A collection of nodes to move
-            non-saturated nodes to.
-        node (Hashable): A predecessor to nodes in `saturated`; only
-            paths between `node` and nodes in `saturated` are considered
-        children (Iterable[Hashable]): A collection of `node`'s
-            children. Only nodes in `children` will be moved.
-        graph (networkx.DiGraph): A directed graph.
-        flows (dict[Hashable: dict[Hashable: int]]): Flows as
-            `from_node: (to_node: flow_value)` triples. Optional.
-        outbound_nodes (dict[Hashable, Hashable]): A mapping of
-            `node: outbound_node` pairs. Optional.
-    """
-    # Process input:
-    outbound_node = _get_outbound_node(node, outbound_nodes)
-
-    # Re-calculate membership of `saturated`. This is intended to be
-    # called after reallocation of capacity between nodes based on
-    # previously-identified underflows or overflows:
-    for child in children:
-        # Iterate over `children` instead of `saturated` because we
-        # want to mutate `saturated`:
-        if child in saturated:
-            new_capacity = graph[outbound_node][child][CAPACITY_KEY]
-            old_capacity = flows[outbound_node][child]
-            if new_capacity != old_capacity:
-                saturated.remove(child)
-                non_saturated.add(child)
-
-def _classify_children_by_flows(
-        graph, node, children, flows,
-        outbound_nodes=None, overflow_nodes=None):
-    """ Classifies children as overflowed, underflowed, or saturated.
-
-    Each child in `children` receives some amount of flow from `node`
-    (via `flows`). If this exceeds the capacity of 0-weight edges then
-    the child is an overflow node. If it is less than the capacity of
-    0-weight edges then it is an underflow node. If flows and 0-weight
-    capacity are matched then it is a saturated node.
-
-    This tells you something about whether or not the node is a
-    bottleneck in the flow algorithm:
-
-    *   Underflow nodes definitely *are*. Paths from underflow nodes to
-        `sink` cannot accomodate the current outbound capacity.
-    *   Overflow nodes definitely *are not*. Flow intended for
-        underflow nodes has been redirected to them because paths from
-        those nodes to `sink` have excess capacity.
-    *   Saturated nodes might go either way. It might be that they have
-        excess capacity which simply wasn't used by the flow-assigning
-        algorithm, or they might have consumed 100% of their capacity
-        (and thus implicitly be bottlenecks insofar as the question of
-        where to assign excess capacity is concerned.)
+    Every maximum flow through `graph` leaves the same nodes able to
+    reach `sink` in this way, so the result doesn't depend on which of
+    several equal-cost flows `flows` is.
 
     Args:
         graph (networkx.DiGraph): A directed graph.
         node (Hashable): A node in `graph`
-        children (Iterable[Hashable]): A collection of `node`'s children
-            to which overflows should _not_ be restricted.
+        children (Iterable[Hashable]): A collection of `node`'s children.
         flows (dict[Hashable: dict[Hashable: int]]): Flows as
-            `from_node: (to_node: flow_value)` triples. Optional.
+            `from_node: (to_node: flow_value)` triples, as returned by
+            `_generate_flows`.
+        sink (Hashable): The node in `graph` that receives flows.
         outbound_nodes (dict[Hashable, Hashable]): A mapping of
             `node: outbound_node` pairs. Optional.
         overflow_nodes (dict[Hashable, Hashable]): A mapping of
             `node: overflow_node` pairs. Optional.
 
     Returns:
-        tuple[set[Hashable], set[Hashable], set[Hashable]]: The nodes in
-        `children`, divided into disjoint sets as follows:
-        `(underflow_nodes, overflow_nodes, saturated_nodes)`.
+        list[Hashable]: The members of `children` that can't receive
+        any more flow, in the same order as `children`.
     """
     # Process input:
     outbound_node = _get_outbound_node(node, outbound_nodes)
     overflow_node = _get_overflow_node(
         node, overflow_nodes, outbound_node=outbound_node)
-
-    # Define some sets to contain each group of children:
-    underflow_nodes = set()
-    overflow_nodes = set()
-    saturated_nodes = set()
-    # Add each node to exactly one of those sets:
-    for child in children:
-        # Nodes with flows that are less than their max. 0-weight
-        # capacity are underflow nodes:
-        if (
-                graph[outbound_node][child][CAPACITY_KEY]
-                > flows[outbound_node][child]):
-            underflow_nodes.add(child)
-        # Nodes that receive flow via overflow_node must be receiving
-        # more than their max. 0-weight capacity, and are overflow nodes
-        elif overflow_node is not None and flows[overflow_node][child] > 0:
-            overflow_nodes.add(child)
-        # Any other node is receiving exactly its 0-weight capacity, and
-        # is a saturated node:
-        else:
-            saturated_nodes.add(child)
-    return underflow_nodes, overflow_nodes, saturated_nodes
+    blocked = {outbound_node, overflow_node}
+
+    # Search backwards from `sink` for every node that can reach it:
+    reaches_sink = {sink}
+    queue = [sink]
+    while queue:
+        to_node = queue.pop()
+        # Flow can be added to edges with unused capacity...
+        from_nodes = [
+            from_node for from_node in graph.predecessors(to_node)
+            if flows[from_node][to_node]
+            < graph[from_node][to_node][CAPACITY_KEY]]
+        # ... or removed from edges with flow:
+        from_nodes.extend(
+            from_node for from_node in graph.successors(to_node)
+            if flows[to_node][from_node] > 0)
+        for from_node in from_nodes:
+            if from_node not in reaches_sink and from_node not in blocked:
+                reaches_sink.add(from_node)
+                queue.append(from_node)
+    return [child for child in children if child not in reaches_sink]
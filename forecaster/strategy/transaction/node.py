@@ -47,9 +47,12 @@ class TransactionNode:
             `source` version of the node is a dict) and a tuple if the
             node is ordered (i.e. if the `source` version of the node
             is a list or tuple).
+        accounts (frozenset[Any]): The objects wrapped by all leaf nodes
+            under this node. Computed on first access.
     """
     def __init__(self, source, limits=None):
         """ Initializes TransactionNode. """
+        self._accounts = None
         if isinstance(source, type(self)):
             # Copy initialization:
             self.source = source.source
@@ -76,6 +79,17 @@ class TransactionNode:
         # TransactionNode instance for each child in `source`.
         self.children = _children_from_source(self)
 
+    @property
+    def accounts(self):
+        """ The objects wrapped by all leaf nodes under this node. """
+        if self._accounts is None:
+            if self.is_leaf_node():
+                self._accounts = frozenset((self.source,))
+            else:
+                self._accounts = frozenset().union(
+                    *(child.accounts for child in self.children))
+        return self._accounts
+
     def is_leaf_node(self):
         """ Returns True if the node is a leaf node, False otherwise. """
         return not self.is_parent_node()
@@ -169,3 +183,37 @@ def _children_from_source_weighted(node):
             child = TransactionNode(child)
         children[child] = weight
     return children
+
+def _structure_key(source):
+    """ Returns a hashable key describing the structure of a priority tree.
+
+    Two priority trees have the same key if they have the same nodes
+    (ordered or weighted), the same weights and limits (of the same
+    types), and the same leaf accounts in the same positions, even if
+    they are built from different `list`, `dict`, and `TransactionNode`
+    objects. Traversing either tree yields the same graph topology.
+
+    Weights and limits are compared by type as well as value, since
+    e.g. `0.5 == Decimal(0.5)` but trees with `float` and `Decimal`
+    weights aren't interchangeable (mixing the two in arithmetic
+    raises `TypeError`).
+
+    Args:
+        source (dict[Any, Decimal], list[Any], tuple[Any], Account,
+            TransactionNode): A priority tree (or subtree).
+
+    Returns:
+        Hashable: A key that is equal for structurally-identical trees.
+    """
+    if isinstance(source, TransactionNode):
+        return (
+            TransactionNode, _structure_key(source.source), source.limits,
+            tuple(type(limit) for limit in source.limits))
+    if isinstance(source, ORDERED_NODE_TYPES):
+        return (type(source), tuple(_structure_key(child) for child in source))
+    if isinstance(source, WEIGHTED_NODE_TYPES):
+        return (type(source), tuple(
+            (_structure_key(child), type(weight), weight)
+            for child, weight in source.items()))
+    # Leaf nodes (i.e. accounts) are compared by identity:
+    return source
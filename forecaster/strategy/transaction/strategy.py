@@ -1,14 +1,18 @@
 """ Provides Strategy-type wrappers for TransactionTraversal. """
 
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from forecaster.accounts.debt import Debt
 from forecaster.strategy.base import Strategy, strategy_method
 from forecaster.strategy.debt_payment.util import (
     PRIORITY_METHODS, AVALANCHE_KEY)
 from forecaster.strategy.transaction.base import TransactionTraversal
-from forecaster.strategy.transaction.node import TransactionNode
+from forecaster.strategy.transaction.node import (
+    TransactionNode, _structure_key)
 from forecaster.utility.precision import HighPrecisionOptionalPropertyCached
 
+# The number of traversals (one per distinct priority tree) to keep:
+TRAVERSAL_CACHE_SIZE = 8
+
 class TransactionStrategy(Strategy):
     """ Determines transactions to/from a group of accounts.
 
@@ -82,6 +86,17 @@ class TransactionStrategy(Strategy):
             debt_strategy = AVALANCHE_KEY
         self.debt_strategy = debt_strategy
         self.high_interest_threshold = high_interest_threshold
+        # Traversals of recently-used priority trees, keyed by the
+        # structure of the tree (see `_get_traversal`):
+        self._traversals = OrderedDict()
+
+    def __getstate__(self):
+        """ Omits cached traversals when pickling or copying. """
+        # Cached traversals hold graphs that are expensive to copy and
+        # are rebuilt on demand anyways:
+        state = self.__dict__.copy()
+        state['_traversals'] = OrderedDict()
+        return state
 
     @strategy_method('Ordered')
     def strategy_ordered(
@@ -333,6 +348,38 @@ class TransactionStrategy(Strategy):
             priority = [high_interest_priority, priority]
 
         # Traverse the tree and return the results:
+        traverse = self._get_traversal(priority)
+        return traverse(available)
+
+    def _get_traversal(self, priority):
+        """ Returns a `TransactionTraversal` for `priority`.
+
+        The priority tree is usually rebuilt with the same structure
+        each year (only the accounts' balances and limits change), so
+        traversals are cached based on the tree's structure. Reusing a
+        traversal avoids re-annotating the tree and lets each traversal
+        start from the flows found by the previous one. (Each traversal
+        still builds a new graph, since the graph's capacities and
+        some of its edges depend on the accounts' current limits.)
+
+        At most `TRAVERSAL_CACHE_SIZE` traversals are retained; the
+        least-recently-used traversal is discarded first.
+
+        Args:
+            priority (dict[Any, Decimal], list[Any], tuple[Any],
+                Account, TransactionNode): A priority tree.
+
+        Returns:
+            TransactionTraversal: A traversal of a tree with the same
+            structure as `priority`.
+        """
+        key = _structure_key(priority)
+        if key in self._traversals:
+            self._traversals.move_to_end(key)
+            return self._traversals[key]
         traverse = TransactionTraversal(
             priority=priority, high_precision=self.high_precision)
-        return traverse(available)
+        self._traversals[key] = traverse
+        if len(self._traversals) > TRAVERSAL_CACHE_SIZE:
+            self._traversals.popitem(last=False)
+        return traverse
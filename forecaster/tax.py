@@ -4,10 +4,11 @@ These classes are callable with the form `tax(taxable_income, year)`
 """
 
 import collections
+import itertools
 from forecaster.person import Person
 from forecaster.utility import (
     build_inflation_adjust, nearest_year, extend_inflation_adjusted,
-    Timing, HighPrecisionOptional)
+    frozen_timing, HighPrecisionOptional, BracketTable)
 
 # NOTE: Consider making this a ledger-like object that stores values
 # year-over-year. These values might include:
@@ -163,6 +164,8 @@ class Tax(HighPrecisionOptional):
         # generate an entry in `accum` for each new bracket:
         self._accum = {}
         self._tax_brackets = {}
+        # Brackets (and accums) for each year, sorted for fast lookup:
+        self._compiled_brackets = {}
         for year in tax_brackets:
             self.add_brackets(tax_brackets[year], year)
 
@@ -281,7 +284,8 @@ class Tax(HighPrecisionOptional):
     @payment_timing.setter
     def payment_timing(self, val):
         """ Sets `payment_timing`. """
-        self._payment_timing = Timing(val)
+        self._payment_timing = frozen_timing(
+            val, high_precision=self.high_precision)
 
     @property
     def refund_timing(self):
@@ -291,32 +295,50 @@ class Tax(HighPrecisionOptional):
     @refund_timing.setter
     def refund_timing(self, val):
         """ Sets `refund_timing`. """
-        self._refund_timing = Timing(val)
+        self._refund_timing = frozen_timing(
+            val, high_precision=self.high_precision)
 
     def marginal_bracket(self, taxable_income, year):
         """ The top tax bracket that taxable_income falls into. """
-        brackets = self.tax_brackets(year)
-        return max(
-            (bracket for bracket in brackets
-             if bracket < taxable_income),
-            default=min(brackets)
-        )
+        table, _ = self.compiled_brackets(year)
+        return table.bracket(taxable_income)
 
     def marginal_rate(self, taxable_income, year):
         """ The marginal rate for the given income. """
-        brackets = self.tax_brackets(year)
-        return brackets[self.marginal_bracket(taxable_income, year)]
+        table, _ = self.compiled_brackets(year)
+        return table.lookup(taxable_income)
+
+    def compiled_brackets(self, year):
+        """ The tax brackets for `year`, compiled for fast lookups.
+
+        Returns:
+            tuple[BracketTable, list[float]]: A table of
+            `{bracket: rate}` pairs for `year` and the accumulated tax
+            payable at each bracket of the table (in the same order as
+            `table.thresholds`).
+        """
+        if year not in self._compiled_brackets:
+            # Compiled brackets are added alongside the tax brackets:
+            self.tax_brackets(year)
+        return self._compiled_brackets[year]
 
     def add_brackets(self, brackets, year):
         """ Adds a year of tax brackets to attribute self.tax_brackets.
 
-        Also generates an `accum` dict based on the tax brackets.
+        Also generates an `accum` dict based on the tax brackets and
+        compiles both for use by `compiled_brackets`.
         """
         year = int(year)
         self._tax_brackets[year] = brackets
 
         self.add_accum(brackets, year)
 
+        # Sort the brackets (and accums) to allow for fast lookups:
+        table = BracketTable(brackets)
+        accum = self._accum[year]
+        self._compiled_brackets[year] = (
+            table, [accum[bracket] for bracket in table.thresholds])
+
     def add_accum(self, brackets, year):
         """ Generates an accum dict for the given brackets and year. """
         # For each bracket, the new accumulation is whatever the accum
@@ -361,25 +383,64 @@ class Tax(HighPrecisionOptional):
             float: Total tax liability arising from `taxable_income` in
                 `year`, after applying `deduction` and `credit`.
         """
+        return self.tax_money_many(
+            (taxable_income,), year, deduction=deduction, credit=credit)[0]
+
+    def tax_money_many(self, incomes, year, deduction=0, credit=0):
+        """ Returns taxes owing on each of several amounts of income.
+
+        This is equivalent to calling `tax_money` for each element of
+        `incomes`, but the brackets for `year` are looked up only once.
+        This is useful when evaluating the same year's tax treatment
+        for many people or many scenarios.
+
+        Args:
+            incomes (Iterable[float]): Amounts of taxable income, each
+                taxed as if in the hands of a different person.
+            year (int): The year for which tax treatment is applied.
+            deduction (float): A deduction applied to each of
+                `incomes`. Optional.
+            credit (float): A tax credit applied to each of `incomes`.
+                Optional.
+
+        Returns:
+            list[float]: The tax liability for each of `incomes`, in
+                the same order.
+        """
         # Apply deductions:
-        taxable_income -= deduction
+        net_incomes = [income - deduction for income in incomes]
+        return self._tax_net_many(
+            net_incomes, itertools.repeat(credit), year)
+
+    def _tax_net_many(self, net_incomes, credits_, year):
+        """ Taxes owing on each of `net_incomes` after `credits_`.
 
+        Args:
+            net_incomes (Iterable[float]): Amounts of taxable income,
+                after deductions.
+            credits_ (Iterable[float]): The tax credit for each of
+                `net_incomes`, in the same order.
+            year (int): The year for which tax treatment is applied.
+
+        Returns:
+            list[float]: The tax liability for each of `net_incomes`.
+        """
         # Get the inflation-adjusted tax brackets for this year:
-        brackets = self.tax_brackets(year)
-        bracket = self.marginal_bracket(taxable_income, year)
-
-        # `accum` gives us the tax owing on lower brackers, so we only
-        # have to think about the effect of the marginal rate on any
-        # income over the bracket threshold
-        marginal_rate = brackets[bracket]
-        accum = self.accum(year, bracket)
-
-        # Assess tax owing on marginal bracket:
-        gross_tax = accum + (taxable_income - bracket) * marginal_rate
-        # Apply tax credts:
-        net_tax = gross_tax - credit * self.credit_rate(year)
-        # Assume credits are non-refundable:
-        return max(net_tax, self.precision_convert(0))
+        table, accums = self.compiled_brackets(year)
+        credit_rate = self.credit_rate(year)
+        zero = self.precision_convert(0)
+        taxes = []
+        for taxable_income, credit in zip(net_incomes, credits_):
+            # `accum` gives us the tax owing on lower brackets, so we
+            # only have to think about the effect of the marginal rate
+            # on any income over the bracket threshold:
+            index = table.index(taxable_income)
+            gross_tax = accums[index] + (
+                (taxable_income - table.thresholds[index])
+                * table.values[index])
+            # Apply tax credits, assuming they are non-refundable:
+            taxes.append(max(gross_tax - credit * credit_rate, zero))
+        return taxes
 
     def tax_person(
             self, person, year, deduction=0, credit=0):
@@ -436,28 +497,18 @@ class Tax(HighPrecisionOptional):
         if credit is None:
             credit = {}
 
-        # Base case: If {} is passed, return $0.
-        if not people:
-            return self.precision_convert(0)
-
-        # Otherwise, grab someone at random and determine their taxes.
-        person = next(iter(people))
-
-        # Treat spouses in a special way; send them to a different
-        # method for processing and recurse on the remaining folks.
-        # NOTE: This logic (and the logic of Person.spouse) needs to be
-        # overridden in subclasses implementing plural marriage.
-        if person.spouse is not None and person.spouse in people:
-            # Process taxes for the couple and recurse on the remaining
-            # people.
-            return (
-                self.tax_spouses(
-                    {person, person.spouse}, year, deduction, credit)
-                + self.tax_people(
-                    people - {person, person.spouse}, year, deduction, credit))
-        # Otherwise, process this person as a single individual and
-        # recurse on the remaining folks:
-        else:
+        # Determine each person's tax (or each couple's, for spouses)
+        # in a single pass:
+        taxes = []
+        for group in _group_spouses(people):
+            # Treat spouses in a special way; send them to a different
+            # method for processing.
+            if len(group) > 1:
+                taxes.append(
+                    self.tax_spouses(group, year, deduction, credit))
+                continue
+            # Otherwise, process this person as a single individual.
+            person = next(iter(group))
             # We don't want to override default values for tax_person,
             # so fill a kwargs dict with only explicitly-passed
             # deduction and credit for this person.
@@ -466,11 +517,17 @@ class Tax(HighPrecisionOptional):
                 kwargs['deduction'] = deduction[person]
             if person in credit:
                 kwargs['credit'] = credit[person]
-
-            # Determine tax owing for this person and then recurse.
-            return (
-                self.tax_person(person, year, **kwargs)
-                + self.tax_people(people - {person}, year, deduction, credit))
+            taxes.append(self.tax_person(person, year, **kwargs))
+
+        # Add up taxes in the order that people appear in `people`,
+        # starting from $0, so the result is the same for the same
+        # input. (Floating-point results may differ in the last digit
+        # from those of older versions, which added them up in a
+        # different order.)
+        total = self.precision_convert(0)
+        for tax in taxes:
+            total += tax
+        return total
 
     def tax_spouses(self, people, year, deduction=None, credit=None):
         """ Tax treatment for a pair of spouses.
@@ -519,6 +576,91 @@ class Tax(HighPrecisionOptional):
             tax += self.tax_person(person, year, **kwargs)
         return tax
 
+    def tax_people_many(
+            self, incomes, year, deductions=None, credits_=None, **kwargs):
+        """ Total tax liability for a group of people in many scenarios.
+
+        This is a batch counterpart to `tax_people`, for evaluating the
+        same household's taxes for one year across many scenarios
+        (e.g. in a Monte Carlo simulation). Rather than reading each
+        person's income, deductions, and credits from their recorded
+        histories, these are passed as sequences with one value for
+        each scenario.
+
+        Args:
+            incomes (dict[Person, Sequence[float]]): The taxable
+                income of each person in each scenario. Each sequence
+                must have the same length.
+            year (int): The year for which tax treatment is needed.
+            deductions (dict[Person, Sequence[float]]): The deductions
+                of each person in each scenario, other than the
+                personal deduction (which is applied automatically).
+                Optional.
+            credits_ (dict[Person, Sequence[float]]): The credits of
+                each person in each scenario, other than those
+                determined by `credit_many`. Optional.
+            **kwargs (dict[str, dict[Person, Sequence[float]]]):
+                Other per-scenario values which subclasses use to
+                determine credits. See `credit_many`.
+
+        Returns:
+            list[float]: The total tax liability of the people in each
+            scenario, in the same order as the values of `incomes`.
+
+        Raises:
+            ValueError: The values of `incomes` have different lengths.
+        """
+        zero = self.precision_convert(0)
+        num_scenarios = _batch_size(incomes)
+        personal_deduction = self.personal_deduction(year)
+        # Determine income net of deductions for everyone first, since
+        # one person's credits may depend on others' net income:
+        net_incomes = {}
+        for person, person_incomes in incomes.items():
+            person_deductions = _batch_values(
+                deductions, person, num_scenarios, zero)
+            net_incomes[person] = [
+                income - personal_deduction - deduction
+                for income, deduction
+                in zip(person_incomes, person_deductions)]
+
+        taxes = [zero] * num_scenarios
+        for person, person_net_incomes in net_incomes.items():
+            person_credits = [
+                credit + other for credit, other in zip(
+                    _batch_values(credits_, person, num_scenarios, zero),
+                    self.credit_many(person, year, net_incomes, **kwargs))]
+            person_taxes = self._tax_net_many(
+                person_net_incomes, person_credits, year)
+            taxes = [tax + person_tax for tax, person_tax in zip(
+                taxes, person_taxes)]
+        return taxes
+
+    # This method establishes a framework for subclasses to use.
+    # pylint: disable=unused-argument
+    def credit_many(self, person, year, net_incomes, **kwargs):
+        """ The tax credits `person` is eligible for in each scenario.
+
+        This is a batch counterpart to `credit`, used by
+        `tax_people_many`. This base class doesn't provide any credits
+        other than those passed to `tax_people_many` explicitly.
+
+        Args:
+            person (Person): The person for whom credits are being
+                assessed.
+            year (int): The year for which credits are being assessed.
+            net_incomes (dict[Person, list[float]]): The taxable income
+                net of deductions of each person (including `person`)
+                in each scenario.
+            **kwargs (dict[str, dict[Person, Sequence[float]]]):
+                Per-scenario values passed to `tax_people_many`.
+
+        Returns:
+            list[float]: The credits for the person in each scenario.
+        """
+        return [self.precision_convert(0)] * len(net_incomes[person])
+    # pylint: enable=unused-argument
+
     def __call__(self, income, year,
                  deduction=None, credit=None):
         """ Determines taxes owing on one or more income sources.
@@ -779,6 +921,28 @@ class TaxMulti(object):
                 deduction=deductions[tax], credit=credits_[tax])
             for tax in self.jurisdictions)
 
+    def tax_people_many(
+            self, incomes, year, deductions=None, credits_=None, **kwargs):
+        """ Tax liability for a group of people in many scenarios.
+
+        See `Tax.tax_people_many` for details on the arguments.
+        `deductions` and `credits_` map each jurisdiction to a dict of
+        `{person: values}` pairs, as with the other methods of this
+        class.
+
+        Returns:
+            dict[Tax, list[float]]: The total tax liability of the
+            people in each scenario, for each jurisdiction.
+        """
+        # Wrap args in defaultdicts to avoid key errors:
+        deductions = make_defaultdict(deductions)
+        credits_ = make_defaultdict(credits_)
+        return {
+            tax: tax.tax_people_many(
+                incomes, year, deductions=deductions[tax],
+                credits_=credits_[tax], **kwargs)
+            for tax in self.jurisdictions}
+
     def __call__(
             self, income, year, deductions=None, credits_=None):
         """ Determines taxes owing in multiple jurisdictions. """
@@ -789,6 +953,48 @@ class TaxMulti(object):
             tax(income, year, deduction=deductions[tax], credit=credits_[tax])
             for tax in self.jurisdictions)
 
+def _group_spouses(people):
+    """ Groups `people` into couples and single people.
+
+    Spouses are grouped together only if both are in `people`.
+    NOTE: This logic (and the logic of Person.spouse) needs to be
+    overridden in subclasses implementing plural marriage.
+
+    Returns:
+        list[set[Person]]: Sets of one person (for single people, or
+        people whose spouse isn't in `people`) or two people (for
+        spouses), in the order that people appear in `people`.
+    """
+    groups = []
+    grouped = set()
+    for person in people:
+        if person in grouped:
+            continue
+        if person.spouse is not None and person.spouse in people:
+            group = {person, person.spouse}
+        else:
+            group = {person}
+        grouped.update(group)
+        groups.append(group)
+    return groups
+
+def _batch_size(values):
+    """ The common length of the sequences in `values`.
+
+    Raises:
+        ValueError: The values of `values` have different lengths.
+    """
+    lengths = {len(sequence) for sequence in values.values()}
+    if len(lengths) > 1:
+        raise ValueError('All sequences must have the same length.')
+    return lengths.pop() if lengths else 0
+
+def _batch_values(values, person, size, default):
+    """ Values for `person` in `values`, or `size` copies of `default`. """
+    if values is None or person not in values:
+        return [default] * size
+    return values[person]
+
 def make_defaultdict(arg, default_factory=lambda: None):
     """ Creates a defaultdict from `arg` (empty if `arg` is None). """
     if arg is None:
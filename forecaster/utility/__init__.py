@@ -9,16 +9,20 @@ types.
 # See forecaster.__init__.py for version, author, and licensing info.
 
 __all__ = [
-    'timing', 'inflation', 'precision']
+    'timing', 'series', 'inflation', 'precision', 'functions', 'brackets']
 
-from forecaster.utility import timing, precision, inflation
+from forecaster.utility import (
+    timing, series, precision, inflation, functions, brackets)
 from forecaster.utility.timing import (
     FREQUENCY_MAPPING, WHEN_DEFAULT,
     when_conv, frequency_conv,
-    Timing, transactions_from_timing,
+    Timing, FrozenTiming, frozen_timing, transactions_from_timing,
     add_transactions, subtract_transactions)
+from forecaster.utility.series import TransactionSeries
 from forecaster.utility.inflation import (
     nearest_year, extend_inflation_adjusted, build_inflation_adjust)
 from forecaster.utility.precision import (
     EPSILON, HighPrecisionOptional, HighPrecisionOptionalProperty,
     HighPrecisionOptionalPropertyCached)
+from forecaster.utility.functions import Constant, identity
+from forecaster.utility.brackets import BracketTable
@@ -0,0 +1,60 @@
+""" A module for looking up values in bracketed tables.
+
+Brackets are dicts of `{threshold: value}` pairs, such as tax brackets
+(`{income: rate}`) or withholding tax rates. A value falls into the
+highest bracket with a threshold strictly below it (or, if there is no
+such bracket, into the lowest bracket).
+
+Used throughout the application, without any dependency on any other
+modules from this project.
+"""
+
+from bisect import bisect_left
+
+
+class BracketTable(object):
+    """ A `{threshold: value}` dict compiled for fast lookups.
+
+    Lookups take logarithmic time in the number of brackets (via
+    `bisect`), rather than the linear time needed to scan a dict.
+
+    Examples:
+        ```
+        table = BracketTable({0: 0.1, 100: 0.2})
+        table.bracket(100)  # Returns 0
+        table.lookup(150)  # Returns 0.2
+        ```
+
+    Attributes:
+        thresholds (list[float]): The thresholds of the brackets, in
+            ascending order.
+        values (list[Any]): The value for each of `thresholds`.
+    """
+
+    def __init__(self, brackets):
+        """ Inits BracketTable from a dict of `{threshold: value}` pairs.
+
+        Raises:
+            ValueError: `brackets` is empty.
+        """
+        if not brackets:
+            raise ValueError('BracketTable: brackets must not be empty.')
+        self.thresholds = sorted(brackets)
+        self.values = [brackets[threshold] for threshold in self.thresholds]
+
+    def index(self, value):
+        """ The index (in `thresholds`) of the bracket for `value`. """
+        # `bisect_left` counts the thresholds strictly less than `value`.
+        # The last of those is the bracket, if there are any:
+        return max(bisect_left(self.thresholds, value) - 1, 0)
+
+    def bracket(self, value):
+        """ The threshold of the bracket that `value` falls into. """
+        return self.thresholds[self.index(value)]
+
+    def lookup(self, value):
+        """ The value of the bracket that `value` falls into. """
+        return self.values[self.index(value)]
+
+    def __len__(self):
+        return len(self.thresholds)
@@ -0,0 +1,47 @@
+""" Picklable callables for use in place of lambdas and closures.
+
+Many objects wrap user-provided values in callables (e.g. a constant
+rate of return is wrapped in a function of the year). Lambdas and
+nested functions can't be pickled, which prevents those objects from
+being sent to other processes. These module-level equivalents can be.
+
+Used throughout the application, without any dependency on any other
+modules from this project.
+"""
+
+class Constant(object):
+    """ A callable object that returns the same value for any args.
+
+    This can be used as a `default_factory` for a `defaultdict` (as an
+    alternative to `lambda: value`) or to wrap a scalar in a function
+    (as an alternative to `lambda *args, **kwargs: value`).
+
+    Examples:
+        ```
+        func = Constant(5)
+        func()  # Returns 5
+        func(2000, key='value')  # Returns 5
+        ```
+
+    Attributes:
+        value (Any): The value returned on each call.
+    """
+
+    # This class is intended to behave like a function, so no public
+    # methods other than __call__ are required.
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, value):
+        """ Inits Constant. """
+        self.value = value
+
+    def __call__(self, *args, **kwargs):
+        """ Returns `value`, ignoring any args. """
+        return self.value
+
+    def __repr__(self):
+        return type(self).__name__ + '(' + repr(self.value) + ')'
+
+def identity(value):
+    """ Returns `value` unchanged. """
+    return value
@@ -131,29 +131,16 @@ def build_inflation_adjust(inflation_adjust=None):
         value as `val`, a nominal value in `this_year`.
     """
     # Use a default value
+    # (The methods returned here are picklable, so module-level
+    # callables are used rather than nested functions.)
     if inflation_adjust is None:
         # Assume real values if no inflation-adjustment method is
         # given - i.e. always return val without adjustment.
-        # pylint: disable=W0613,E0102
-        def inflation_adjust_func(target_year=None, base_year=None):
-            """ No inflation adjustment; returns 1 every year. """
-            return 1
+        inflation_adjust_func = _no_inflation_adjust
     elif isinstance(inflation_adjust, dict):
         # If a dict of {year: val} values has been passed in,
         # convert that to a suitable method.
-
-        # It's slightly more efficient to find the smallest key in
-        # inflation_adjust outside of the function.
-        default_base = min(inflation_adjust.keys())
-
-        def inflation_adjust_func(target_year, base_year=None):
-            """ Inflation adjustment from """
-            if base_year is None:
-                base_year = default_base
-            return (
-                inflation_adjust[target_year] /
-                inflation_adjust[base_year]
-            )
+        inflation_adjust_func = _DictInflationAdjust(inflation_adjust)
     elif not callable(inflation_adjust):
         # If it's not a dict and not callable, then we don't know
         # what to do with it. Raise an error.
@@ -164,3 +151,39 @@ def build_inflation_adjust(inflation_adjust=None):
         inflation_adjust_func = inflation_adjust
 
     return inflation_adjust_func
+
+
+# pylint: disable=unused-argument
+# This has the same signature as other inflation_adjust methods.
+def _no_inflation_adjust(target_year=None, base_year=None):
+    """ No inflation adjustment; returns 1 every year. """
+    return 1
+# pylint: enable=unused-argument
+
+class _DictInflationAdjust(object):
+    """ Wraps a dict of `{year: inflation_adjustment}` pairs in a method.
+
+    Attributes:
+        inflation_adjust (dict[int, float]): Cumulative year-over-year
+            inflation factors for each year.
+        default_base (int): The base year used when none is provided.
+    """
+
+    # pylint: disable=too-few-public-methods
+    # This class is intended to behave like a function.
+
+    def __init__(self, inflation_adjust):
+        """ Inits _DictInflationAdjust. """
+        self.inflation_adjust = inflation_adjust
+        # It's slightly more efficient to find the smallest key in
+        # inflation_adjust once, rather than on each call.
+        self.default_base = min(inflation_adjust.keys())
+
+    def __call__(self, target_year, base_year=None):
+        """ Inflation adjustment from `base_year` to `target_year`. """
+        if base_year is None:
+            base_year = self.default_base
+        return (
+            self.inflation_adjust[target_year] /
+            self.inflation_adjust[base_year]
+        )
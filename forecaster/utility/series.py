@@ -0,0 +1,378 @@
+""" Module providing a compact mapping for time-series of transactions.
+
+Transactions are stored throughout this package as `{when: value}`
+mappings. A `dict` stores a boxed key, a boxed value and a hash table
+entry for each timing, and combining two of them means looping over
+keys in Python. `TransactionSeries` stores its timings in sorted order
+in one array and its values in another, which is smaller and lets
+series be merged, accumulated and discounted in a single ordered pass.
+
+Used throughout the application, without any dependency on any other
+modules from this project.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import (
+    Mapping, MutableMapping, ItemsView, ValuesView)
+from itertools import accumulate
+
+# Types that can be stored in an `array('d')` without changing type:
+_FLOAT_TYPES = (float,)
+
+class TransactionSeries(MutableMapping):
+    """ A `{when: value}` mapping stored as sorted parallel arrays.
+
+    While every timing and value is a `float`, both are stored in
+    `array('d')` columns. If any other type is stored (e.g. `Decimal`
+    timings or values, as in high-precision mode, or even `int`
+    values), the series switches to plain lists so that values keep
+    their type.
+
+    Like a `defaultdict`, looking up a missing timing returns `zero`,
+    which lets calling code write `series[when] += value`. (Unlike a
+    `defaultdict`, the missing timing isn't inserted by the lookup.)
+    Unlike a `dict`, iteration is in ascending order of timing, not in
+    insertion order.
+
+    Examples:
+        ```
+        series = TransactionSeries({0.5: 100.0})
+        series[0.0] += 50.0
+        series.add({0.5: -25.0, 1.0: 10.0})
+        dict(series)  # {0.0: 50.0, 0.5: 75.0, 1.0: 10.0}
+        dict(series.cumulative())  # {0.0: 50.0, 0.5: 125.0, 1.0: 135.0}
+        ```
+
+    Args:
+        transactions (Mapping[float, float]): Initial `{when: value}`
+            pairs. Optional.
+        zero (float, Decimal): The value of a timing with no
+            transactions. Optional.
+
+    Attributes:
+        zero (float, Decimal): The value of a timing with no
+            transactions.
+    """
+
+    __slots__ = ('zero', '_whens', '_values')
+
+    def __init__(self, transactions=None, *, zero=0):
+        """ Inits TransactionSeries. """
+        self.zero = zero
+        self._whens = array('d')
+        self._values = array('d')
+        if transactions:
+            self.add(transactions)
+
+    def _fits(self, when, value):
+        """ Whether `when` and `value` can be stored in the arrays. """
+        return (
+            isinstance(self._whens, array)
+            and type(when) in _FLOAT_TYPES and type(value) in _FLOAT_TYPES)
+
+    def _unpack(self):
+        """ Switches to list storage, e.g. to store Decimal values. """
+        if isinstance(self._whens, array):
+            self._whens = self._whens.tolist()
+            self._values = self._values.tolist()
+
+    def _index(self, when):
+        """ Returns `(i, found)` for the position of `when`. """
+        i = bisect_left(self._whens, when)
+        return i, i < len(self._whens) and self._whens[i] == when
+
+    def __len__(self):
+        return len(self._whens)
+
+    def __iter__(self):
+        return iter(self._whens)
+
+    def __contains__(self, when):
+        return self._index(when)[1]
+
+    def __getitem__(self, when):
+        i, found = self._index(when)
+        if found:
+            return self._values[i]
+        # Like `defaultdict`, return a default value for missing keys.
+        # (Unlike it, don't insert the key; `series[when] += value`
+        # inserts `when` via `__setitem__` anyways, and inserting `zero`
+        # here could force float series into list storage.)
+        return self.zero
+
+    def __setitem__(self, when, value):
+        i, found = self._index(when)
+        if not found:
+            self._insert(i, when, value)
+            return
+        if not self._fits(when, value):
+            self._unpack()
+        self._values[i] = value
+
+    def __delitem__(self, when):
+        i, found = self._index(when)
+        if not found:
+            raise KeyError(when)
+        del self._whens[i]
+        del self._values[i]
+
+    # The `Mapping` mixins for these methods are built on `self[when]`,
+    # which doesn't raise `KeyError` for missing timings.
+    def get(self, when, default=None):
+        """ Returns the value at `when`, or `default` if there is none. """
+        i, found = self._index(when)
+        return self._values[i] if found else default
+
+    _NO_DEFAULT = object()
+
+    def pop(self, when, default=_NO_DEFAULT):
+        """ Removes `when` and returns its value (or `default`). """
+        i, found = self._index(when)
+        if not found:
+            if default is self._NO_DEFAULT:
+                raise KeyError(when)
+            return default
+        value = self._values[i]
+        del self._whens[i]
+        del self._values[i]
+        return value
+
+    def setdefault(self, when, default=None):
+        """ Returns the value at `when`, inserting `default` if absent. """
+        i, found = self._index(when)
+        if found:
+            return self._values[i]
+        self._insert(i, when, default)
+        return default
+
+    def _insert(self, i, when, value):
+        """ Inserts a new `when: value` pair at index `i`. """
+        if not self._fits(when, value):
+            self._unpack()
+        self._whens.insert(i, when)
+        self._values.insert(i, value)
+
+    def __copy__(self):
+        result = TransactionSeries(zero=self.zero)
+        result._whens = self._whens[:]
+        result._values = self._values[:]
+        return result
+
+    def copy(self):
+        """ Returns a shallow copy of this series. """
+        return self.__copy__()
+
+    def clear(self):
+        """ Removes all transactions. """
+        del self._whens[:]
+        del self._values[:]
+
+    def __repr__(self):
+        return type(self).__name__ + '(' + repr(dict(self.items())) + ')'
+
+    def items(self):
+        """ The `(when, value)` pairs of the series, in order. """
+        return _SeriesItemsView(self)
+
+    def values(self):
+        """ The values of the series, in order of timing. """
+        return _SeriesValuesView(self)
+
+    def add(self, transactions):
+        """ Adds `transactions` to this series in place.
+
+        Values at timings shared by both are summed; other timings are
+        inserted. This is equivalent to `add_transactions(self,
+        transactions)`, but merges the two series in one ordered pass
+        rather than inserting each timing separately.
+
+        Args:
+            transactions (Mapping[float, float]): A `{when: value}`
+                mapping (or another `TransactionSeries`).
+
+        Returns:
+            TransactionSeries: This series (for convenience).
+        """
+        other_whens, other_values = _sorted_columns(transactions)
+        return self._merge(other_whens, other_values)
+
+    def subtract(self, transactions):
+        """ Subtracts `transactions` from this series in place.
+
+        This is the counterpart to `add`, equivalent to
+        `subtract_transactions(self, transactions)`.
+
+        Returns:
+            TransactionSeries: This series (for convenience).
+        """
+        other_whens, other_values = _sorted_columns(transactions)
+        return self._merge(other_whens, [-value for value in other_values])
+
+    def _merge(self, other_whens, other_values):
+        """ Adds sorted `when: value` pairs to this series in place. """
+        if not other_whens:
+            return self
+        # When `self` is empty, or every new timing comes after every
+        # existing timing, there's nothing to interleave:
+        if not self._whens or other_whens[0] > self._whens[-1]:
+            for when, value in zip(other_whens, other_values):
+                self._insert(len(self._whens), when, value)
+            return self
+        # Otherwise, merge the two sorted sequences of timings:
+        whens, values = self._whens, self._values
+        self._whens, self._values = whens[:0], values[:0]
+        i, j = 0, 0
+        while i < len(whens) and j < len(other_whens):
+            if whens[i] < other_whens[j]:
+                self._insert(len(self._whens), whens[i], values[i])
+                i += 1
+            elif other_whens[j] < whens[i]:
+                self._insert(
+                    len(self._whens), other_whens[j], other_values[j])
+                j += 1
+            else:
+                self._insert(
+                    len(self._whens), whens[i], values[i] + other_values[j])
+                i += 1
+                j += 1
+        for k in range(i, len(whens)):
+            self._insert(len(self._whens), whens[k], values[k])
+        for k in range(j, len(other_whens)):
+            self._insert(len(self._whens), other_whens[k], other_values[k])
+        return self
+
+    def merge(self, *others):
+        """ Returns a new series summing this series and `others`.
+
+        Args:
+            others (Mapping[float, float]): Any number of
+                `{when: value}` mappings. Not mutated.
+
+        Returns:
+            TransactionSeries: The sum of this series and `others`.
+        """
+        result = self.copy()
+        for other in others:
+            result.add(other)
+        return result
+
+    def cumulative(self):
+        """ The running total of this series at each of its timings.
+
+        Returns:
+            TransactionSeries: A series with the same timings as this
+            one, where each value is the sum of the values of this
+            series at or before that timing.
+        """
+        result = TransactionSeries(zero=self.zero)
+        result._whens = self._whens[:]
+        totals = accumulate(self._values)
+        if isinstance(self._values, array):
+            result._values = array('d', totals)
+        else:
+            result._values = list(totals)
+        return result
+
+    def total(self, time=None):
+        """ The sum of all values at or before `time`.
+
+        Args:
+            time (float, Decimal): The latest timing to include.
+                Optional; if omitted, all values are summed.
+
+        Returns:
+            The sum of the values at timings no later than `time`.
+        """
+        if time is None:
+            end = len(self._whens)
+        else:
+            end = bisect_right(self._whens, time)
+        total = self.zero
+        for k in range(end):
+            total += self._values[k]
+        return total
+
+    def present_value(self, accumulation):
+        """ The value at time 0 of this series of transactions.
+
+        Args:
+            accumulation (Callable[[float], float]): The accumulation
+                function A(t), i.e. the growth factor over [0,t], such
+                as `accounts.util.accumulation_function` with a fixed
+                rate and nper.
+
+        Returns:
+            The sum of each value discounted by `accumulation` from its
+            timing back to time 0.
+        """
+        total = self.zero
+        for when, value in zip(self._whens, self._values):
+            total += value / accumulation(when)
+        return total
+
+    def future_value(self, accumulation, time):
+        """ The value at `time` of this series of transactions.
+
+        Transactions after `time` are ignored.
+
+        Args:
+            accumulation (Callable[[float], float]): The accumulation
+                function A(t), as for `present_value`.
+            time (float, Decimal): The time at which to value the
+                transactions.
+
+        Returns:
+            The sum of each value (at or before `time`) grown by
+            `accumulation` from its timing to `time`.
+        """
+        total = self.zero
+        for k in range(bisect_right(self._whens, time)):
+            total += self._values[k] * accumulation(time - self._whens[k])
+        return total
+
+    def as_arrays(self):
+        """ The timings and values of this series as `array('d')`s.
+
+        Returns:
+            tuple[array, array]: `(whens, values)` arrays, in ascending
+            order of timing.
+
+        Raises:
+            TypeError: A timing or value can't be converted to float.
+        """
+        return (
+            array('d', (float(when) for when in self._whens)),
+            array('d', (float(value) for value in self._values)))
+
+
+def _sorted_columns(transactions):
+    """ Returns `(whens, values)` sequences sorted by timing. """
+    if isinstance(transactions, TransactionSeries):
+        # pylint: disable=protected-access
+        return transactions._whens, transactions._values
+    if not isinstance(transactions, Mapping):
+        raise TypeError(
+            'TransactionSeries: cannot add ' + type(transactions).__name__)
+    whens = sorted(transactions)
+    return whens, [transactions[when] for when in whens]
+
+class _SeriesItemsView(ItemsView):
+    """ An items view that reads both columns in one pass. """
+
+    def __contains__(self, item):
+        when, value = item
+        # pylint: disable=protected-access
+        i, found = self._mapping._index(when)
+        return found and self._mapping._values[i] == value
+
+    def __iter__(self):
+        # pylint: disable=protected-access
+        return zip(self._mapping._whens, self._mapping._values)
+
+class _SeriesValuesView(ValuesView):
+    """ A values view that reads the values column directly. """
+
+    def __iter__(self):
+        # pylint: disable=protected-access
+        return iter(self._mapping._values)
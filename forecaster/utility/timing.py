@@ -4,6 +4,9 @@ Used throughout the application, without any dependency on any other
 modules.
 """
 
+from functools import lru_cache
+from forecaster.utility.series import TransactionSeries
+
 WHEN_DEFAULT = 0.5
 
 class Timing(dict):
@@ -79,6 +82,8 @@ class Timing(dict):
             if isinstance(when, str) and when in FREQUENCY_MAPPING:
                 frequency = when
                 when = WHEN_DEFAULT  # default value
+                if high_precision is not None:
+                    when = high_precision(when)
             # Arguments might be str-valued; make them numeric:
             when = when_conv(when, high_precision=high_precision)
             frequency = frequency_conv(frequency)
@@ -138,6 +143,19 @@ class Timing(dict):
         """
         return Timing(self._normalized(keys))
 
+    def normalized_items(self):
+        """ Returns `(when, weight)` pairs with normalized weights.
+
+        This is a lightweight alternative to `normalized` for callers
+        that only need to iterate over the normalized weights.
+
+        Returns:
+            Iterable[tuple[Number, Any]]: `(when, weight)` pairs for
+            each key of this `Timing` object, where the weights sum to
+            1 and are proportional to the values of this object.
+        """
+        return self._normalized().items()
+
     def time_series(self, scalar, keys=None):
         """ Scales `scalar` into portions proportionate to this timing.
 
@@ -170,6 +188,127 @@ class Timing(dict):
             normalized[key] *= scalar
         return normalized
 
+class FrozenTiming(Timing):
+    """ An immutable, hashable `Timing` with precomputed weights.
+
+    This accepts the same arguments as `Timing`. Once built, it can't
+    be mutated. Its normalized weights and sorted timings are computed
+    once, at init, so that `normalized`, `time_series` and similar
+    methods don't need to re-sum the weights on every call.
+
+    Since instances are immutable, copying one returns the same object.
+    Use `frozen_timing` to get a shared instance for common
+    `(when, frequency)` pairs rather than building a new one each time.
+
+    Attributes:
+        whens (tuple[Number]): The keys of this timing, sorted in
+            ascending order.
+        weights (tuple[Number]): The normalized weights of this timing,
+            ordered to correspond to `whens`.
+    """
+    def __init__(self, when=WHEN_DEFAULT, frequency=1, *, high_precision=None):
+        """ Initializes a FrozenTiming dict. """
+        # `Timing.__init__` builds itself via `__setitem__`/`update`,
+        # which are blocked here, so build a mutable Timing first and
+        # copy it in via `dict.__init__` (which bypasses both).
+        if not isinstance(when, Timing):
+            when = Timing(when, frequency, high_precision=high_precision)
+        dict.__init__(self, when)
+        self.whens = tuple(sorted(self.keys()))
+        # Weights that sum to zero can't be normalized; leave that to
+        # `Timing._normalized` to complain about if it's ever called.
+        if self and sum(self.values()) != 0:
+            normalized = Timing._normalized(self)
+            self.weights = tuple(normalized[key] for key in self.whens)
+        else:
+            self.weights = ()
+        self._hash = None
+
+    def _is_normalizable(self):
+        """ Whether `weights` holds a weight for each of `whens`. """
+        return len(self.weights) == len(self.whens)
+
+    def _normalized(self, keys=None):
+        """ Returns a normalized dict based on this `FrozenTiming`. """
+        if keys is None and self._is_normalizable():
+            return dict(zip(self.whens, self.weights))
+        return super()._normalized(keys=keys)
+
+    def normalized_items(self):
+        """ Returns `(when, weight)` pairs with normalized weights.
+
+        These are the precomputed `whens` and `weights`, in ascending
+        order of `when`.
+        """
+        if self._is_normalizable():
+            return zip(self.whens, self.weights)
+        return super().normalized_items()
+
+    def normalized(self, keys=None):
+        """ Returns a normalized version of the `FrozenTiming` object. """
+        return FrozenTiming(self._normalized(keys))
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(frozenset(self.items()))
+        return self._hash
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        # Dict subclasses are unpickled via `__setitem__` by default,
+        # which is blocked here; rebuild from a plain dict instead.
+        return (FrozenTiming, (dict(self),))
+
+    def _immutable(self, *args, **kwargs):
+        """ Raises TypeError; `FrozenTiming` can't be mutated. """
+        raise TypeError("FrozenTiming objects are immutable")
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __ior__ = _immutable
+    clear = _immutable
+    pop = _immutable
+    popitem = _immutable
+    setdefault = _immutable
+    update = _immutable
+
+def frozen_timing(when=WHEN_DEFAULT, frequency=1, *, high_precision=None):
+    """ Returns a (possibly shared) `FrozenTiming` instance.
+
+    Instances built from hashable arguments (i.e. anything other than a
+    dict) are cached, so repeated calls like
+    `frozen_timing(0.5, 'M')` return the same object.
+
+    Args:
+        when (Number, str, dict): As for `Timing`.
+        frequency (str, int): As for `Timing`.
+        high_precision (Callable[[float], T]): As for `Timing`.
+
+    Returns:
+        FrozenTiming: An immutable timing for the given arguments.
+    """
+    if isinstance(when, FrozenTiming):
+        return when
+    if isinstance(when, dict):
+        return FrozenTiming(when, frequency, high_precision=high_precision)
+    # `Timing` only converts the default `when` to high precision if it
+    # receives `WHEN_DEFAULT` itself, which the cache can't tell apart
+    # from an equal float; convert it here so the cache key differs.
+    if high_precision is not None and when is WHEN_DEFAULT:
+        when = high_precision(when)
+    return _frozen_timing_cached(when, frequency, high_precision)
+
+@lru_cache(maxsize=256, typed=True)
+def _frozen_timing_cached(when, frequency, high_precision):
+    """ Cached helper for `frozen_timing`. """
+    # NOTE: `typed=True` keeps e.g. `0.5` and `Decimal('0.5')` apart.
+    return FrozenTiming(when, frequency, high_precision=high_precision)
+
 def _convert_dict(when, *, high_precision=None):
     """ Converts `dict` input to `Timing`-style `when: weight` pairs.
 
@@ -372,11 +511,7 @@ def transactions_from_timing(timing, total):
     """
     if not isinstance(timing, Timing):
         timing = Timing(timing)
-    normalization = sum(timing.values())
-    transactions = {
-        time: total * (weight / normalization)
-        for time, weight in timing.items()}
-    return transactions
+    return {time: total * weight for time, weight in timing.normalized_items()}
 
 def when_conv(when, *, high_precision=None):
     """ Converts various types of `when` inputs to floats in [0,1].
@@ -490,6 +625,10 @@ def add_transactions(base, added):
     Returns:
         None. Input `base` is mutated instead.
     """
+    # `TransactionSeries` can merge in one ordered pass:
+    if isinstance(base, TransactionSeries):
+        base.add(added)
+        return
     for key, value in added.items():
         # Sum values if the key is in both inputs, insert otherwise:
         if key in base:
@@ -519,6 +658,9 @@ def subtract_transactions(base, added):
     Returns:
         None. Input `base` is mutated instead.
     """
+    if isinstance(base, TransactionSeries):
+        base.subtract(added)
+        return
     for key, value in added.items():
         # Sum values if the key is in both inputs, insert otherwise:
         if key in base:
@@ -2,9 +2,11 @@
 
 import unittest
 import math
+import pickle
 import decimal
 from decimal import Decimal
 from forecaster import Person, Account, Scenario, AllocationStrategy
+from forecaster.utility import when_conv
 from tests.test_helper import type_check
 
 class TestAccountMethods(unittest.TestCase):
@@ -186,6 +188,21 @@ class TestAccountMethods(unittest.TestCase):
         with self.assertRaises(ValueError):  # test positive
             self.account.add_transaction(1, when=2)
 
+    def test_pickle(self):
+        """ Test that accounts can be pickled (e.g. for multiprocessing). """
+        self.account.add_transaction(1, when=0.5)
+        account = pickle.loads(pickle.dumps(self.account))
+        self.assertEqual(account.balance, self.account.balance)
+        self.assertEqual(account.transactions, self.account.transactions)
+        self.assertEqual(account.rate, self.account.rate)
+        self.assertEqual(account.owner.name, self.account.owner.name)
+        # Relationships between pickled objects should be preserved:
+        self.assertIn(account, account.owner.accounts)
+        # The copy should advance to next year just like the original:
+        account.next_year()
+        self.account.next_year()
+        self.assertAlmostEqual(account.balance, self.account.balance)
+
     def test_returns(self, *args, **kwargs):
         """ Tests Account.returns and Account.returns_history. """
         # Account with $1 balance and 100% non-compounded growth.
@@ -368,6 +385,69 @@ class TestAccountMethods(unittest.TestCase):
         self.assertEqual(account.inflows(), 2)
         self.assertEqual(account.outflows(), 0)
 
+    def test_balance_at_time(self, *args, **kwargs):
+        """ Tests balance_at_time with transactions. """
+        # Account with $1 balance and 100% non-compounded growth:
+        account = self.AccountType(
+            self.owner, *args, balance=1, rate=1.0, nper=1, **kwargs)
+        account.add_transaction(1, 'start')
+        account.add_transaction(1, 'end')
+        # The $1 balance and $1 inflow at the start each grow by a
+        # factor of sqrt(2) by mid-year. The inflow at the end is
+        # ignored:
+        self.assertAlmostEqual(
+            account.balance_at_time(0.5), 2 * math.sqrt(2))
+        # At the end of the year, the start-of-year amounts have each
+        # doubled and the $1 inflow at year-end has been added:
+        self.assertAlmostEqual(account.balance_at_time('end'), 5)
+        # Additional transactions are included if provided:
+        self.assertAlmostEqual(
+            account.balance_at_time('end', transactions={0.5: 2}),
+            5 + 2 * math.sqrt(2))
+
+    def test_balances_at_times(self, *args, **kwargs):
+        """ Tests balances_at_times against balance_at_time. """
+        account = self.AccountType(
+            self.owner, *args, balance=1, rate=1.0, nper=1, **kwargs)
+        account.add_transaction(1, 'start')
+        account.add_transaction(-1, 0.25)
+        account.add_transaction(1, 'end')
+        times = [0.5, 'end', 0, 0.25]
+        balances = account.balances_at_times(times)
+        # Results are keyed by converted time, in ascending order:
+        self.assertEqual(list(balances), [0, 0.25, 0.5, 1])
+        for time in times:
+            self.assertAlmostEqual(
+                balances[when_conv(time)], account.balance_at_time(time))
+        # Additional transactions are included if provided:
+        self.assertAlmostEqual(
+            account.balances_at_times([1], transactions={0.5: 2})[1],
+            account.balance_at_time(1, transactions={0.5: 2}))
+
+    def test_max_outflow_curve(self, *args, **kwargs):
+        """ Tests max_outflow_curve against max_outflow. """
+        account = self.AccountType(
+            self.owner, *args, balance=100, rate=1.0, nper=1, **kwargs)
+        account.add_transaction(-50, 0.5)
+        times = [0, 0.5, 0.75, 1]
+        curve = account.max_outflow_curve(times)
+        for time in times:
+            self.assertAlmostEqual(curve[time], account.max_outflow(time))
+
+    def test_growth_factors(self, *args, **kwargs):
+        """ Tests that growth factors are reused between calls. """
+        account = self.AccountType(
+            self.owner, *args, balance=1, rate=1.0, nper=1, **kwargs)
+        account.add_transaction(1, 'start')
+        balance = account.balance_at_time('end')
+        # pylint: disable=protected-access
+        # We're testing the memoization of this member directly.
+        factors = dict(account._growth_factors)
+        self.assertTrue(factors)
+        # Repeat calls give the same result without new factors:
+        self.assertEqual(account.balance_at_time('end'), balance)
+        self.assertEqual(account._growth_factors, factors)
+
     def test_add_trans_diff_in_out(self, *args, **kwargs):
         """ Tests add_transaction with in- and outflows at different times. """
         account = self.AccountType(
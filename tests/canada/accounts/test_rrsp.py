@@ -4,6 +4,7 @@ import unittest
 import decimal
 from decimal import Decimal
 from forecaster import Person
+from forecaster.utility import Constant
 from forecaster.canada import RRSP, constants
 from tests.canada.accounts.test_registered_account import (
     TestRegisteredAccountMethods)
@@ -86,6 +87,13 @@ class TestRRSPMethods(TestRegisteredAccountMethods):
             self.owner.age(account.rrif_conversion_year),
             self.constants.RRSP_RRIF_CONVERSION_AGE)
 
+    def test_pickle(self):
+        """ Test that RRSPs can be pickled (e.g. for multiprocessing). """
+        # `setUp` gives the owner a lambda for its raise rate, which
+        # can't be pickled; module-level callables like `Constant` can:
+        self.owner.raise_rate_function = Constant(0)
+        super().test_pickle()
+
     def test_taxable_income_gain(self, *args, **kwargs):
         """ Test taxable_income with no withdrawals or contributions. """
         # Create an RRSP with a $1,000,000 balance, 100% growth,
@@ -81,6 +81,15 @@ class TestForecasterCanada(TestForecaster):
         param = self.forecaster.get_param(Parameter.TAX_TREATMENT)
         self.assertEqual(param, self.tax_treatment)
 
+    def test_run_vectorized(self):
+        """ Test that Canadian tax treatment can't be vectorized. """
+        with self.assertRaises(ValueError):
+            self.forecaster.run_vectorized(
+                [self.scenario],
+                people={self.person},
+                accounts={self.account},
+                debts={})
+
 
 if __name__ == '__main__':
     unittest.TextTestRunner().run(
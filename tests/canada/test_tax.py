@@ -298,6 +298,54 @@ class TestTaxCanada(unittest.TestCase):
         # the amount of the spousal tax credit:
         self.assertEqual(spousal_tax, target)
 
+    def test_tax_people_many(self):
+        """ Test batch tax treatment against per-person treatment. """
+        self.person1.spouse = self.person2
+        self.taxable_account2.owner = self.person1
+        people = {self.person1, self.person2}
+        year = self.initial_year
+        # Evaluate two scenarios, where person2's net income is less
+        # than the spousal amount and then more than person1's:
+        incomes = {person: [] for person in people}
+        pension_incomes = {person: [] for person in people}
+        targets = {tax: [] for tax in self.tax.jurisdictions}
+        for gross_income in (150, 1000000):
+            self.person2.gross_income = gross_income
+            for person in people:
+                incomes[person].append(person.taxable_income)
+                pension_incomes[person].append(
+                    abs(sum(
+                        account.outflows() for account in person.accounts
+                        if isinstance(account, RRSP))))
+            for tax in self.tax.jurisdictions:
+                targets[tax].append(tax(people, year))
+
+        taxes = self.tax.tax_people_many(
+            incomes, year, pension_incomes=pension_incomes)
+        self.assertEqual(set(taxes), set(self.tax.jurisdictions))
+        for tax in self.tax.jurisdictions:
+            for actual, target in zip(taxes[tax], targets[tax]):
+                self.assertAlmostEqual(actual, target, places=2)
+
+    def test_tax_people_many_mismatch(self):
+        """ Test batch tax treatment with different numbers of values. """
+        with self.assertRaises(ValueError):
+            self.tax.tax_people_many(
+                {self.person1: [1, 2], self.person2: [1]}, self.initial_year)
+
+    def test_decimal_timing(self):
+        """ Tests that Decimal inputs produce Decimal timings. """
+        self.setUp_decimal()
+        tax = TaxCanada(
+            self.inflation_adjustments, province='BC',
+            constants=self.constants, high_precision=Decimal)
+        for jurisdiction in (tax.federal_tax, tax.provincial_tax):
+            self.assertEqual(jurisdiction.high_precision, Decimal)
+        for timing in (tax.payment_timing, tax.refund_timing):
+            for when, weight in timing.items():
+                self.assertIsInstance(when, Decimal)
+                self.assertIsInstance(weight, Decimal)
+
     def test_pension_tax_credit(self):
         """ Test pension tax credit behaviour. """
         # TODO Implement pension tax credit, then test it.
@@ -5,7 +5,7 @@ from copy import copy
 from decimal import Decimal
 from forecaster import (
     Person, Forecast, Tax, Scenario, Timing,
-    Account, TransactionTraversal, SavingForecast)
+    Account, TransactionTraversal, SavingForecast, ForecastProfiler)
 
 class DummyForecast(object):
     """ Acts like a SubForecast but is easier to debug with. """
@@ -30,6 +30,8 @@ class DummyForecast(object):
         self.available_out = None
         self.initial_year = initial_year
         self.this_year = initial_year
+        # This class never undoes its transactions when called again:
+        self.call_invoked = False
 
     def __call__(self, available):
         """ Adds transactions to `available`. """
@@ -296,6 +298,34 @@ class TestForecast(unittest.TestCase):
         for first, second in zip(results, target):
             self.assertAlmostEqual(first, second, places=2)
 
+    def test_profiler(self):
+        """ Tests profiling each subforecast in a multi-year forecast. """
+        self.scenario = Scenario(self.initial_year, 2)
+        self.tax_forecast_dummy.tax_adjustment = 0
+        events = []
+        profiler = ForecastProfiler(callback=events.append)
+        forecast = Forecast(
+            income_forecast=self.income_forecast_dummy,
+            living_expenses_forecast=self.living_expenses_forecast_dummy,
+            saving_forecast=self.saving_forecast,
+            withdrawal_forecast=self.null_forecast,
+            tax_forecast=self.tax_forecast_dummy,
+            scenario=self.scenario,
+            profiler=profiler)
+        # Each year calls 4 dummies and 1 SavingForecast. `next_year` is
+        # recorded against the year that it ends:
+        for year in (self.initial_year, self.initial_year + 1):
+            self.assertEqual(profiler.records[year]['DummyForecast'].calls, 4)
+            self.assertEqual(profiler.records[year]['SavingForecast'].calls, 1)
+        self.assertEqual(
+            profiler.records[self.initial_year]['next_year'].calls, 1)
+        self.assertNotIn('next_year', profiler.records[self.initial_year + 1])
+        self.assertEqual(len(events), 11)
+        # Re-running subforecasts should be recorded as undos:
+        forecast.call_subforecasts()
+        record = profiler.records[self.initial_year + 1]['SavingForecast']
+        self.assertEqual((record.calls, record.undos), (2, 1))
+
     def test_refund(self):
         """ Tests tax refund carryovers """
         # Set up a forecast where we receive a $100 refund in the middle
@@ -0,0 +1,64 @@
+""" Unit tests for `ForecastProfiler`. """
+
+import json
+import unittest
+from forecaster.forecast.profiler import (
+    ForecastProfiler, ProfileRecord, ProfileEvent)
+
+
+class TestForecastProfiler(unittest.TestCase):
+    """ Tests ForecastProfiler. """
+
+    def setUp(self):
+        """ Builds a profiler with a timer that advances 1s per call. """
+        self.now = 0
+        def timer():
+            self.now += 1
+            return self.now
+        self.events = []
+        self.profiler = ForecastProfiler(
+            callback=self.events.append, timer=timer)
+
+    def test_profile(self):
+        """ Tests timing a `with` block. """
+        with self.profiler.profile(2000, 'step'):
+            pass
+        self.assertEqual(
+            self.profiler.records[2000]['step'], ProfileRecord(1, 1, 0))
+        self.assertEqual(self.events, [ProfileEvent(2000, 'step', 1, False)])
+
+    def test_profile_error(self):
+        """ Tests that steps which raise errors are still recorded. """
+        with self.assertRaises(ValueError):
+            with self.profiler.profile(2000, 'step'):
+                raise ValueError()
+        self.assertEqual(self.profiler.records[2000]['step'].calls, 1)
+
+    def test_totals(self):
+        """ Tests aggregating over years. """
+        self.profiler.record(2000, 'step', 1)
+        self.profiler.record(2001, 'step', 2, undone=True)
+        self.profiler.record(2001, 'other', 3)
+        self.assertEqual(
+            self.profiler.totals(),
+            {'step': ProfileRecord(3, 2, 1), 'other': ProfileRecord(3, 1, 0)})
+
+    def test_report(self):
+        """ Tests that reports can be serialized. """
+        self.profiler.record(2000, 'step', 1)
+        report = json.loads(json.dumps(self.profiler.report()))
+        self.assertEqual(
+            report['years']['2000']['step'],
+            {'time': 1, 'calls': 1, 'undos': 0})
+        self.assertEqual(report['totals'], report['years']['2000'])
+
+    def test_clear(self):
+        """ Tests discarding measurements. """
+        self.profiler.record(2000, 'step', 1)
+        self.profiler.clear()
+        self.assertEqual(self.profiler.totals(), {})
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(
+        unittest.TestLoader().loadTestsFromName(__name__))
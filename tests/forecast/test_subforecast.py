@@ -112,6 +112,14 @@ class TestSubForecast(unittest.TestCase):
             self.subforecast.transactions[self.account1],
             {0: 100})
 
+    def test_call_invoked(self):
+        """ Tests that `call_invoked` tracks calls and undos. """
+        self.assertFalse(self.subforecast.call_invoked)
+        self.subforecast(self.available_dict)
+        self.assertTrue(self.subforecast.call_invoked)
+        self.subforecast.undo_transactions()
+        self.assertFalse(self.subforecast.call_invoked)
+
     def test_transaction_delay(self):
         """ Tests that delayed transactions are saved correctly. """
         # Receive cash mid-year:
@@ -386,6 +394,59 @@ class TestSubForecast(unittest.TestCase):
             self.available_dict,
             {0.5: 50, 1: 50})
 
+    def test_shift_whens(self):
+        """ Shift several withdrawals from a dict at once. """
+        # $100 arrives at start of year and $100 more at the end:
+        available = {0: 100, 1: 100}
+        # Withdraw $50 at 0.5 twice, then $100 at start:
+        shifted = self.subforecast._shift_whens(
+            {0.5: 50, 0: 100}, available)
+        # The first $50 fits at 0.5; the $100 at 0 would overdraw the
+        # balance at 0.5, so it's delayed until the end of the year:
+        self.assertEqual(shifted, [(0.5, 50), (1, 100)])
+        # `available` isn't mutated:
+        self.assertEqual(available, {0: 100, 1: 100})
+
+    def test_shift_whens_matches_shift_when(self):
+        """ Batch shifts match sequential `_shift_when` calls. """
+        available = {0: 10, 0.25: -5, 0.5: 20, 0.75: -20, 1: 30}
+        transactions = {0: 5, 0.5: 10, 0.25: 10, 1: 20}
+        shifted = self.subforecast._shift_whens(transactions, available)
+        expected = []
+        for when, value in transactions.items():
+            when = self.subforecast._shift_when(value, when, available)
+            available[when] = available.get(when, 0) - value
+            expected.append((when, value))
+        self.assertEqual(shifted, expected)
+
+    def test_add_transactions_batch(self):
+        """ Adds a schedule of transactions from a dict in bulk. """
+        # $100 arrives at start of year and $100 more at the end:
+        self.available_dict.update({0: 100, 1: 100})
+        # Move $50 at 0.5 and $100 at start to account1. The second
+        # would overdraw `available` at 0.5, so it's delayed:
+        self.subforecast.add_transactions(
+            {0.5: 50, 0: 100},
+            from_account=self.available_dict, to_account=self.account1)
+        self.assertEqual(self.available_dict, {0: 100, 0.5: -50, 1: 0})
+        self.assertEqual(self.account1.transactions, {0.5: 50, 1: 100})
+        self.assertEqual(
+            self.subforecast.transactions[self.available_dict],
+            {0.5: -50, 1: -100})
+        self.assertEqual(
+            self.subforecast.transactions[self.account1],
+            {0.5: 50, 1: 100})
+
+    def test_add_transactions_batch_negative(self):
+        """ Adds negative transactions in bulk, reversing the flow. """
+        self.available_dict.update({0: 100})
+        # Negative values flow from `to_account` to `from_account`:
+        self.subforecast.add_transactions(
+            {0: -25, 1: -25},
+            from_account=self.account1, to_account=self.available_dict)
+        self.assertEqual(self.available_dict, {0: 75, 1: -25})
+        self.assertEqual(self.account1.transactions, {0: 25, 1: 25})
+
     def test_decimal(self):
         """ Tests Subforecast with Decimal inputs. """
         # Convert values to Decimal:
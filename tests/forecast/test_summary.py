@@ -0,0 +1,123 @@
+""" Unit tests for `ForecastSummary`. """
+
+import unittest
+from decimal import Decimal
+from forecaster import ForecastSummary
+
+class DummyForecast(object):
+    """ Provides `*_history` dicts like a `Forecast`. """
+    def __init__(self, principal, withdrawals=None, tax=None):
+        """ Inits DummyForecast with `{year: value}` histories. """
+        self.principal_history = principal
+        self.withdrawals_history = (
+            withdrawals if withdrawals is not None
+            else {year: 0 for year in principal})
+        self.tax_history = (
+            tax if tax is not None
+            else {year: 0 for year in principal})
+
+class TestForecastSummary(unittest.TestCase):
+    """ Tests ForecastSummary. """
+
+    def setUp(self):
+        """ Builds forecasts with easy-to-aggregate principal values. """
+        self.initial_year = 2000
+        # Principal values of 0, 100, ..., 400 in the first year,
+        # doubled in the second year:
+        self.forecasts = [
+            DummyForecast({
+                self.initial_year: val, self.initial_year + 1: 2 * val})
+            for val in range(0, 500, 100)]
+        self.summary = ForecastSummary()
+        for forecast in self.forecasts:
+            self.summary.add(forecast)
+
+    def test_add(self):
+        """ Test that values for each year are recorded. """
+        self.assertEqual(self.summary.num_forecasts, 5)
+        self.assertEqual(
+            self.summary.years, [self.initial_year, self.initial_year + 1])
+        self.assertEqual(
+            sorted(self.summary.values['principal'][self.initial_year]),
+            [0, 100, 200, 300, 400])
+
+    def test_percentile_exact(self):
+        """ Test percentiles that fall exactly on a value. """
+        self.assertEqual(
+            self.summary.percentile('principal', 50),
+            {self.initial_year: 200, self.initial_year + 1: 400})
+        self.assertEqual(
+            self.summary.percentile('principal', 0)[self.initial_year], 0)
+        self.assertEqual(
+            self.summary.percentile('principal', 100)[self.initial_year], 400)
+
+    def test_percentile_interpolated(self):
+        """ Test percentiles that fall between values. """
+        # The 10th percentile is 40% of the way from 0 to 100:
+        self.assertAlmostEqual(
+            self.summary.percentile('principal', 10)[self.initial_year], 40)
+
+    def test_percentile_invalid(self):
+        """ Test percentiles outside of [0, 100]. """
+        with self.assertRaises(ValueError):
+            self.summary.percentile('principal', 101)
+
+    def test_percentiles(self):
+        """ Test several percentiles at once. """
+        percentiles = self.summary.percentiles('principal', (25, 75))
+        self.assertEqual(percentiles[25][self.initial_year], 100)
+        self.assertEqual(percentiles[75][self.initial_year + 1], 600)
+
+    def test_depletion_none(self):
+        """ Test forecasts with no depletion. """
+        # A forecast that never has positive principal isn't depleted:
+        self.assertEqual(
+            self.summary.depletion_probability(),
+            {self.initial_year: 0, self.initial_year + 1: 0})
+
+    def test_depletion(self):
+        """ Test forecasts that run out of money. """
+        summary = ForecastSummary()
+        # Depleted in the second year:
+        summary.add(DummyForecast({2000: 100, 2001: 0, 2002: 100}))
+        # Depleted in the third year:
+        summary.add(DummyForecast({2000: 100, 2001: 50, 2002: -10}))
+        # Never depleted:
+        summary.add(DummyForecast({2000: 100, 2001: 100, 2002: 100}))
+        summary.add(DummyForecast({2000: 100, 2001: 100, 2002: 100}))
+        self.assertEqual(
+            summary.depletion_probability(),
+            {2000: 0, 2001: 0.25, 2002: 0.5})
+
+    def test_merge(self):
+        """ Test merging two summaries. """
+        summary1 = ForecastSummary()
+        summary2 = ForecastSummary()
+        for forecast in self.forecasts[:2]:
+            summary1.add(forecast)
+        for forecast in self.forecasts[2:]:
+            summary2.add(forecast)
+        summary1.merge(summary2)
+        self.assertEqual(summary1.num_forecasts, 5)
+        self.assertEqual(
+            summary1.percentile('principal', 50),
+            self.summary.percentile('principal', 50))
+
+    def test_merge_invalid(self):
+        """ Test merging summaries of different fields. """
+        with self.assertRaises(ValueError):
+            self.summary.merge(ForecastSummary(fields=('principal',)))
+
+    def test_decimal(self):
+        """ Test interpolating Decimal values. """
+        summary = ForecastSummary(high_precision=Decimal)
+        for val in range(0, 500, 100):
+            summary.add(DummyForecast({2000: Decimal(val)}))
+        percentile = summary.percentile('principal', 10)[2000]
+        self.assertIsInstance(percentile, Decimal)
+        self.assertAlmostEqual(percentile, Decimal(40))
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(
+        unittest.TestLoader().loadTestsFromName(__name__))
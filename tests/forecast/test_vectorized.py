@@ -0,0 +1,154 @@
+""" Unit tests for `VectorizedForecast`. """
+
+import unittest
+from array import array
+from unittest import mock
+from forecaster import (
+    Person, Account, Debt, Scenario, Tax, LivingExpensesStrategy,
+    VectorizedForecast, ForecastSummary, SubForecast)
+from forecaster.forecast.vectorized import _Cashflows
+
+class TestVectorizedForecast(unittest.TestCase):
+    """ Tests VectorizedForecast. """
+
+    def setUp(self):
+        """ Builds a simple portfolio with no growth and no tax. """
+        self.initial_year = 2000
+        self.person = Person(
+            initial_year=self.initial_year,
+            name="Test",
+            birth_date="1 January 1980",
+            retirement_date="31 December 2040",
+            gross_income=10000,
+            payment_timing='end')
+        self.account = Account(owner=self.person, balance=1000)
+        # Two 3-year scenarios; one with no inflation, one with 100%:
+        self.scenarios = [
+            Scenario(
+                self.initial_year, 3, inflation=inflation, stock_return=0,
+                bond_return=0)
+            for inflation in (0, 1)]
+        self.living_expenses_strategies = [
+            LivingExpensesStrategy(
+                'Constant living expenses', base_amount=9000,
+                inflation_adjust=scenario.inflation_adjust)
+            for scenario in self.scenarios]
+        self.tax_treatments = [
+            Tax({self.initial_year: {0: 0}}) for _ in self.scenarios]
+
+    def forecast(self, accounts=None, debts=None, tax_treatments=None):
+        """ Builds a VectorizedForecast with default args. """
+        if accounts is None:
+            accounts = {self.account}
+        if debts is None:
+            debts = set()
+        if tax_treatments is None:
+            tax_treatments = self.tax_treatments
+        return VectorizedForecast(
+            {self.person}, accounts, debts, self.scenarios,
+            self.living_expenses_strategies, tax_treatments)
+
+    def test_principal(self):
+        """ Test contributions and withdrawals for each scenario. """
+        forecast = self.forecast()
+        # With no inflation, $1000 is saved each year:
+        self.assertEqual(
+            [forecast.principal_history[year][0] for year in range(
+                self.initial_year, self.initial_year + 3)],
+            [1000, 2000, 3000])
+        # With 100% inflation, $8000 is needed in the second year,
+        # which depletes the account:
+        self.assertEqual(
+            [forecast.principal_history[year][1] for year in range(
+                self.initial_year, self.initial_year + 3)],
+            [1000, 2000, 0])
+        self.assertAlmostEqual(
+            forecast.withdrawals_history[self.initial_year + 1][1], 6000)
+
+    def test_paths(self):
+        """ Test that paths provide per-scenario histories. """
+        paths = list(self.forecast().paths())
+        self.assertEqual(len(paths), 2)
+        self.assertEqual(
+            paths[0].living_expenses_history,
+            {self.initial_year: 9000, self.initial_year + 1: 9000,
+             self.initial_year + 2: 9000})
+
+    def test_summary(self):
+        """ Test summarizing the forecast. """
+        summary = self.forecast().summary()
+        self.assertIsInstance(summary, ForecastSummary)
+        self.assertEqual(summary.num_forecasts, 2)
+        self.assertEqual(
+            summary.depletion_probability()[self.initial_year + 2], 0.5)
+
+    def test_batch(self):
+        """ Test that cashflows aren't added one scenario at a time. """
+        calls = []
+        for num in (2, 6):
+            self.scenarios = self.scenarios[:1] * num
+            self.living_expenses_strategies = (
+                self.living_expenses_strategies[:1] * num)
+            self.tax_treatments = self.tax_treatments[:1] * num
+            with mock.patch.object(
+                    SubForecast, 'add_transaction', autospec=True,
+                    side_effect=SubForecast.add_transaction) as method:
+                forecast = self.forecast()
+            calls.append(method.call_count)
+            # Every scenario is the same, so results should be too:
+            self.assertEqual(
+                set(forecast.principal_history[self.initial_year + 2]),
+                {3000})
+        self.assertEqual(calls[0], calls[1])
+
+    def test_deferred_withdrawals(self):
+        """ Test deferring withdrawals as `SubForecast` does. """
+        times = [0, 0.25, 0.5, 0.75, 1]
+        scenarios = [
+            {0: 100, 0.5: 50, 1: 10},
+            {0: 10, 0.25: -20, 0.75: 100},
+            {0.5: -10, 1: 50}]
+        columns = [
+            array('d', (float(scenario.get(when, 0)) for scenario in scenarios))
+            for when in times]
+        cashflows = _Cashflows(columns)
+        subforecast = SubForecast(self.initial_year)
+        for when, amount in ((0.5, 40), (0.25, 30), (0.75, 25)):
+            cashflows.withdraw(
+                times.index(when), array('d', [amount] * len(scenarios)))
+            for scenario in scenarios:
+                subforecast.add_transaction(
+                    amount, timing=when, from_account=scenario)
+        for i, scenario in enumerate(scenarios):
+            self.assertEqual(
+                {when: column[i] for when, column in zip(times, columns)
+                 if column[i]},
+                {when: value for when, value in scenario.items() if value})
+
+    def test_mutation(self):
+        """ Test that the inputs aren't mutated. """
+        self.forecast()
+        # pylint: disable=no-member
+        self.assertEqual(len(self.person.gross_income_history), 1)
+        self.assertEqual(len(self.account.balance_history), 1)
+
+    def test_unsupported_debt(self):
+        """ Test that debts aren't supported. """
+        with self.assertRaises(ValueError):
+            self.forecast(debts={Debt(owner=self.person)})
+
+    def test_unsupported_accounts(self):
+        """ Test that multiple accounts aren't supported. """
+        with self.assertRaises(ValueError):
+            self.forecast(accounts={self.account, Account(self.person)})
+
+    def test_unsupported_scenarios(self):
+        """ Test that scenarios must span the same years. """
+        self.scenarios[1] = Scenario(self.initial_year, 2)
+        with self.assertRaises(ValueError):
+            self.forecast()
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(
+        unittest.TestLoader().loadTestsFromName(__name__))
@@ -1,10 +1,16 @@
 """ Unit tests for `TransactionStrategy`. """
 
 import unittest
+from unittest import mock
+from collections import Counter
 from decimal import Decimal
 from forecaster import (
     Person, TransactionTraversal, Debt, TransactionNode, LimitTuple)
 from forecaster.canada import RRSP, TFSA, TaxableAccount
+from forecaster.strategy.transaction import base
+from forecaster.strategy.transaction.flow import INFINITY
+from forecaster.strategy.transaction.graph import (
+    _add_edge, _edge_capacity, _inbound_capacity, _sum_weight)
 from tests.util import TestCaseTransactions
 
 
@@ -162,6 +168,40 @@ class TestTransactionTraversalMethods(TestCaseTransactions):
         self.assertTransactions(transactions[self.tfsa], 25)
         self.assertTransactions(transactions[self.taxable_account], 25)
 
+    def test_proportional_flows(self):
+        """ Balance weighted nodes without solving if no limits bind. """
+        # pylint: disable=protected-access
+        strategy = TransactionTraversal(priority=self.priority_weighted)
+        available = {0.5: 100}
+        # $50 to RRSP, $25 to TFSA and $25 to taxable are all allowed:
+        strategy._build_graph(100, timing=available, limit='max_inflow')
+        self.assertIn(
+            strategy._priority_tree, strategy._get_proportional_flows())
+        # But $200 to RRSP is not (it only has $100 contribution room):
+        strategy._build_graph(400, timing=available, limit='max_inflow')
+        self.assertNotIn(
+            strategy._priority_tree, strategy._get_proportional_flows())
+
+    def test_proportional_flows_remainder(self):
+        """ Split flows that don't divide evenly between weights. """
+        # pylint: disable=protected-access
+        priority = {self.rrsp: 1, self.tfsa: 1, self.taxable_account: 1}
+        strategy = TransactionTraversal(priority=priority)
+        available = {0.5: 100}
+        # $100 doesn't divide evenly into thirds (in whole units):
+        strategy._build_graph(100, timing=available, limit='max_inflow')
+        root = strategy._priority_tree
+        self.assertIn(root, strategy._get_proportional_flows())
+        # The children's capacities should add up to exactly the flow
+        # into the root, with no more than a unit between any two:
+        total = _edge_capacity(strategy.graph, strategy.source, root)
+        outbound_node = strategy.outbound_nodes[root]
+        capacities = [
+            _edge_capacity(strategy.graph, outbound_node, child)
+            for child in root.children]
+        self.assertEqual(sum(capacities), total)
+        self.assertLessEqual(max(capacities) - min(capacities), 1)
+
     def test_nested_basic(self):
         """ Test with weighted dict nested in ordered list. """
         # Contribute $100 to the accounts.
@@ -175,6 +215,50 @@ class TestTransactionTraversalMethods(TestCaseTransactions):
             self.assertTransactions(
                 transactions[self.taxable_account], 0)
 
+    def test_sum_weight_cached(self):
+        """ Cached weight sums should stay current as edges are added. """
+        # pylint: disable=protected-access
+        strategy = TransactionTraversal(priority=self.priority_nested)
+        strategy._build_graph(100, timing={0.5: 100}, limit='max_inflow')
+        graph = strategy.graph
+        # Cache sums for every node:
+        _sum_weight(graph, strategy.source)
+        # Adding a weighted edge below the root should update the
+        # (previously cached) sum for the root:
+        _add_edge(graph, self.rrsp, "new_node", weight=10)
+        # Compare against a copy of the graph with no cached sums:
+        uncached = graph.copy()
+        uncached.graph.clear()
+        self.assertEqual(
+            _sum_weight(graph, strategy.source),
+            _sum_weight(uncached, strategy.source))
+
+    def test_sum_weight_negative(self):
+        """ Negative weights are included in weight sums. """
+        # pylint: disable=protected-access
+        strategy = TransactionTraversal(priority=self.priority_nested)
+        strategy._build_graph(100, timing={0.5: 100}, limit='max_inflow')
+        graph = strategy.graph
+        weight = _sum_weight(graph, self.rrsp)
+        _add_edge(graph, self.rrsp, "new_node", weight=-10)
+        self.assertEqual(_sum_weight(graph, self.rrsp), weight - 10)
+
+    def test_unbounded_total(self):
+        """ An unlimited inbound edge gives a node unlimited capacity. """
+        # pylint: disable=protected-access
+        strategy = TransactionTraversal(priority=self.priority_ordered)
+        strategy._build_graph(
+            INFINITY, timing={0.5: 100}, limit='max_inflow')
+        root = strategy._priority_tree
+        self.assertEqual(_inbound_capacity(strategy.graph, root), INFINITY)
+        # Capacity is passed on to the root's children, rather than
+        # being treated as 0:
+        outbound_node = strategy.outbound_nodes[root]
+        for child in root.children:
+            self.assertEqual(
+                _edge_capacity(strategy.graph, outbound_node, child),
+                INFINITY)
+
     def test_ordered_overflow_partial(self):
         """ Contribute to first and second accounts of an ordered list. """
         # Contribute $200 to RRSP, then TFSA, then taxable.
@@ -199,6 +283,26 @@ class TestTransactionTraversalMethods(TestCaseTransactions):
         self.assertTransactions(transactions[self.tfsa], 150)
         self.assertTransactions(transactions[self.taxable_account], 150)
 
+    def test_weighted_overflow_equal(self):
+        """ Split overflow equally between equally-weighted accounts. """
+        accounts = [
+            TaxableAccount(
+                initial_year=self.initial_year, owner=self.person)
+            for _ in range(3)]
+        # The debt's $100 minimum payment exceeds its weighted share:
+        debt = Debt(
+            initial_year=self.initial_year, owner=self.person,
+            balance=100, minimum_payment=100)
+        priority = {account: 1 for account in accounts}
+        priority[debt] = 1
+        strategy = TransactionTraversal(priority=priority)
+        available = {0.5: 250}
+        transactions = strategy(available)
+        # $100 will go to the debt and $50 to each account:
+        self.assertTransactions(transactions[debt], 100)
+        for account in accounts:
+            self.assertTransactions(transactions[account], 50)
+
     def test_nested_overflow_partial(self):
         """ Max out one nested account, contribute overflow to neighbor. """
         # Contribute $400 to the accounts.
@@ -583,6 +687,84 @@ class TestTransactionTraversalMethods(TestCaseTransactions):
             self.assertTransactions(
                 transactions[self.rrsp], 0)
 
+    def test_has_min_transactions(self):
+        """ Detect whether any account in the tree has a minimum. """
+        # pylint: disable=protected-access
+        available = {0.5: 10}
+        # None of these accounts has a minimum inflow:
+        strategy = TransactionTraversal(priority=self.priority_ordered)
+        self.assertFalse(
+            strategy._has_min_transactions(available, 'min_inflow'))
+        # But `debt` has a minimum payment:
+        strategy = TransactionTraversal(priority=[self.rrsp, self.debt])
+        self.assertTrue(
+            strategy._has_min_transactions(available, 'min_inflow'))
+
+    def test_get_min_capacities(self):
+        """ Decide whether min. and max. flows share one traversal. """
+        # pylint: disable=protected-access
+        available = {0.5: 50}
+        # An ordered tree can be traversed once:
+        strategy = TransactionTraversal(
+            priority=[self.taxable_account, self.debt])
+        min_capacities = strategy._get_min_capacities(
+            available, 'min_inflow', 'max_inflow')
+        self.assertEqual(set(min_capacities), {self.debt})
+        # But a weighted node needs to know about min. flows first:
+        strategy = TransactionTraversal(
+            priority={self.taxable_account: 1, self.debt: 1})
+        self.assertIsNone(strategy._get_min_capacities(
+            available, 'min_inflow', 'max_inflow'))
+
+    def test_get_capacity_cached(self):
+        """ Query each account's transactions once per limit. """
+        # pylint: disable=protected-access
+        # The RRSP's limit binds, so weighted flows get rebalanced (and
+        # the accounts added to the graph again):
+        strategy = TransactionTraversal(
+            priority={self.rrsp: 1, self.debt: 1, self.taxable_account: 1})
+        available = {0.5: 400}
+        with mock.patch.object(
+                base, '_get_transactions',
+                wraps=base._get_transactions) as get_transactions:
+            strategy(available)
+        calls = Counter(
+            call.args[:2] for call in get_transactions.call_args_list)
+        self.assertEqual(max(calls.values()), 1)
+
+    def test_assign_mins_single_traversal(self):
+        """ Assign min. and max. inflows in a single traversal. """
+        priority = [self.taxable_account, self.debt]
+        strategy = TransactionTraversal(priority=priority)
+        available = {0.5: 50}
+        transactions = strategy(available)
+        # `debt` gets its $10 min. payment and `taxable_account` gets
+        # the rest, even though it comes first in the priority tree:
+        self.assertTransactions(transactions[self.debt], 10)
+        self.assertTransactions(transactions[self.taxable_account], 40)
+
+    def test_assign_mins_weights(self):
+        """ Prefer min. flows without negative-weight edges. """
+        # pylint: disable=protected-access
+        strategy = TransactionTraversal(
+            priority=[self.taxable_account, self.debt])
+        available = {0.5: 50}
+        min_capacities = strategy._get_min_capacities(
+            available, 'min_inflow', 'max_inflow')
+        strategy._build_graph(
+            50, timing=available, limit='max_inflow',
+            min_capacities=min_capacities)
+        graph = strategy.graph
+        # The edge to `debt`'s min. node has 0 weight and the other
+        # edges from accounts to `sink` share a positive weight:
+        self.assertEqual(graph[self.debt][(self.debt, "min")]["weight"], 0)
+        weight = graph[self.debt][strategy.sink]["weight"]
+        self.assertGreater(weight, 0)
+        self.assertEqual(
+            graph[self.taxable_account][strategy.sink]["weight"], weight)
+        self.assertTrue(all(
+            weight >= 0 for _, _, weight in graph.edges.data("weight", 0)))
+
     def test_assign_mins_out(self):
         """ Assign minimum outflows without throwing off total outflows. """
         # RRSPs have min outflows (if converted to an RRIF), so use
@@ -657,6 +839,50 @@ class TestTransactionTraversalMethods(TestCaseTransactions):
         self.assertTransactions(
             transactions[self.taxable_account], -17000)
 
+    def test_priority_tree_reused(self):
+        """ Tests that structurally-equal priorities reuse a tree. """
+        traversal = TransactionTraversal(priority=self.priority_nested)
+        # pylint: disable=protected-access
+        tree = traversal._priority_tree
+        # Build the same priority from new list/dict objects:
+        priority = [
+            {self.rrsp: 0.5, self.tfsa: 0.5},
+            self.taxable_account]
+        traversal.priority = priority
+        self.assertIs(traversal._priority_tree, tree)
+        self.assertIs(traversal.priority, priority)
+        self.assertEqual(
+            traversal._priority_tree.accounts,
+            {self.rrsp, self.tfsa, self.taxable_account})
+
+    def test_priority_tree_changed(self):
+        """ Tests that a priority with new weights gets a new tree. """
+        traversal = TransactionTraversal(priority=self.priority_weighted)
+        # pylint: disable=protected-access
+        tree = traversal._priority_tree
+        priority = dict(self.priority_weighted)
+        priority[self.rrsp] = 0.25
+        traversal.priority = priority
+        self.assertIsNot(traversal._priority_tree, tree)
+
+    def test_priority_tree_mixed_types(self):
+        """ Tests that float and Decimal weights get different trees. """
+        traversal = TransactionTraversal(priority=self.priority_nested)
+        # pylint: disable=protected-access
+        tree = traversal._priority_tree
+        # Use the same weights as `priority_nested`, but as Decimals.
+        # (These compare equal to the float weights.)
+        priority = [
+            {self.rrsp: Decimal(0.5), self.tfsa: Decimal(0.5)},
+            self.taxable_account]
+        self.assertEqual(priority, self.priority_nested)
+        traversal.priority = priority
+        self.assertIsNot(traversal._priority_tree, tree)
+        # The new tree should have the Decimal weights:
+        weights = traversal._priority_tree.children[0].children.values()
+        self.assertTrue(
+            all(isinstance(weight, Decimal) for weight in weights))
+
     def test_decimal(self):
         """ A weighted root with weighted children with common groups. """
         # Convert values to Decimal:
@@ -680,6 +906,16 @@ class TestTransactionTraversalMethods(TestCaseTransactions):
         self.assertTransactions(transactions[self.rrsp2], Decimal(50))
         self.assertTransactions(transactions[self.tfsa2], Decimal(50))
 
+    def test_decimal_exact(self):
+        """ Allocate Decimal amounts without losing a unit of precision. """
+        self.setUp_decimal()
+        strategy = TransactionTraversal(
+            priority=self.taxable_account, high_precision=Decimal)
+        available = {Decimal(0.5): Decimal(100)}
+        transactions = strategy(available)
+        self.assertEqual(
+            sum(transactions[self.taxable_account].values()), Decimal(100))
+
 if __name__ == '__main__':
     unittest.TextTestRunner().run(
         unittest.TestLoader().loadTestsFromName(__name__))
@@ -0,0 +1,83 @@
+""" Tests for flow.py """
+
+import unittest
+from forecaster.strategy.transaction.flow import (
+    FlowNetwork, UnboundedFlowError, INFINITY, MAX_CAPACITY)
+
+
+class TestFlowNetwork(unittest.TestCase):
+    """ Tests FlowNetwork. """
+
+    def setUp(self):
+        """ Builds a network with a cheap and an expensive path. """
+        # Flow from s to t can go via a (cheap) or via b (expensive):
+        self.network = FlowNetwork(
+            ['s', 'a', 'b', 't'],
+            [
+                ('s', 'a', 10, 0), ('s', 'b', INFINITY, 0),
+                ('a', 't', 5, 0), ('b', 't', 5, 1)])
+
+    def test_solve(self):
+        """ Test finding maximum flows at minimum cost. """
+        self.assertEqual(self.network.solve('s', 't'), 10)
+        self.assertEqual(self.network.flow('a', 't'), 5)
+        self.assertEqual(self.network.flow('b', 't'), 5)
+
+    def test_solve_min_cost(self):
+        """ Test that flows prefer cheaper paths. """
+        self.network.set_capacity('s', 'b', 3)
+        self.network.set_capacity('s', 'a', 3)
+        self.assertEqual(self.network.solve('s', 't'), 6)
+        # All flow via `a` is used before any via `b`:
+        self.assertEqual(self.network.flow('a', 't'), 3)
+        self.assertEqual(self.network.flow('b', 't'), 3)
+        # Make `b` cheaper and limit total flow out of `s`:
+        self.network.set_cost('b', 't', 0)
+        self.network.set_cost('a', 't', 1)
+        self.network.set_capacity('s', 'a', 0)
+        self.assertEqual(self.network.solve('s', 't'), 3)
+        self.assertEqual(self.network.flow('a', 't'), 0)
+
+    def test_resolve_increase(self):
+        """ Test re-solving after increasing a capacity. """
+        self.network.solve('s', 't')
+        self.network.set_capacity('a', 't', 10)
+        self.assertEqual(self.network.solve('s', 't'), 15)
+        self.assertEqual(self.network.flow('a', 't'), 10)
+        self.assertEqual(self.network.flow('b', 't'), 5)
+
+    def test_resolve_reroute(self):
+        """ Test re-solving when a cheaper route becomes available. """
+        self.network.set_capacity('b', 't', INFINITY)
+        self.network.set_capacity('s', 'b', 5)
+        self.assertEqual(self.network.solve('s', 't'), 10)
+        # Make the path via `a` expensive, but give `b` more capacity.
+        # Flows should move from `a` to `b` without changing total:
+        self.network.set_cost('a', 't', 2)
+        self.network.set_capacity('s', 'b', 10)
+        self.assertEqual(self.network.solve('s', 't'), 15)
+        self.assertEqual(self.network.flow('s', 'b'), 10)
+        self.assertEqual(self.network.flow('a', 't'), 5)
+
+    def test_resolve_decrease(self):
+        """ Test re-solving after reducing a capacity below its flow. """
+        self.network.solve('s', 't')
+        self.network.set_capacity('a', 't', 2)
+        self.assertEqual(self.network.solve('s', 't'), 7)
+        self.assertEqual(self.network.flow('s', 'a'), 2)
+
+    def test_unbounded(self):
+        """ Test a path with infinite capacity. """
+        self.network.set_capacity('b', 't', INFINITY)
+        with self.assertRaises(UnboundedFlowError):
+            self.network.solve('s', 't')
+
+    def test_capacity_too_large(self):
+        """ Test that finite capacities can't be mistaken for INFINITY. """
+        with self.assertRaises(OverflowError):
+            self.network.set_capacity('a', 't', MAX_CAPACITY)
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(
+        unittest.TestLoader().loadTestsFromName(__name__))
@@ -1,6 +1,7 @@
 """ Unit tests for `TransactionStrategy`. """
 
 import unittest
+from copy import deepcopy
 from decimal import Decimal
 from forecaster import Person, TransactionStrategy
 from forecaster.canada import RRSP, TFSA, TaxableAccount
@@ -191,6 +192,30 @@ class TestTransactionStrategyOrdered(TestCaseTransactions):
         if self.taxable_account in results:
             self.assertTransactions(results[self.taxable_account], 0)
 
+    def test_repeat(self):
+        """ Test calling strategy_ordered repeatedly. """
+        # Later calls reuse the traversal (and flows) of earlier calls;
+        # ensure that they don't affect the results:
+        self.strategy(make_available(1000, self.timing), self.accounts)
+        results = self.strategy(
+            make_available(250, self.timing), self.accounts)
+        self.assertTransactions(results[self.rrsp], 200)
+        self.assertTransactions(results[self.tfsa], 50)
+        if self.taxable_account in results:
+            self.assertTransactions(results[self.taxable_account], 0)
+        # pylint: disable=protected-access
+        # Test that only one traversal was built:
+        self.assertEqual(len(self.strategy._traversals), 1)
+
+    def test_copy(self):
+        """ Test that copies don't share cached traversals. """
+        self.strategy(make_available(100, self.timing), self.accounts)
+        strategy = deepcopy(self.strategy)
+        # pylint: disable=protected-access
+        self.assertEqual(len(strategy._traversals), 0)
+        # The copy should still work:
+        results = strategy(make_available(100, self.timing), self.accounts)
+        self.assertTransactions(results[self.rrsp], 100)
 
     def test_decimal(self):
         """ Tests an ordered TransactionStrategy with Decimal inputs. """
@@ -1,11 +1,14 @@
 """ Unit tests for `Forecaster`. """
 
 import unittest
+from unittest import mock
 from decimal import Decimal
+import networkx
 from forecaster import (
     Settings, Tax, Person, Account, Debt, Scenario,
     LivingExpensesStrategy, TransactionStrategy,
     AllocationStrategy, DebtPaymentStrategy, Forecaster, Parameter)
+from forecaster.strategy.transaction import base as transaction_base
 from tests.forecaster_tester import ForecasterTester
 
 class TestForecaster(ForecasterTester):
@@ -274,6 +277,49 @@ class TestForecaster(ForecasterTester):
             10000,
             places=2)
 
+    def test_run_forecast_weighted(self):
+        """ Test Forecaster.run_forecast with equally-weighted accounts. """
+        # Use the default (weighted) saving strategy for a 10-year
+        # forecast, so that savings are split between the accounts:
+        settings = Settings()
+        settings.num_years = 10
+        forecaster = Forecaster(settings=settings)
+        person = Person(
+            initial_year=settings.initial_year,
+            name="Test 2",
+            birth_date="1 January 1980",
+            retirement_date="31 December 2040",
+            gross_income=100000,
+            raise_rate=0.02,
+            payment_timing='BW')
+        accounts = {
+            Account(owner=person, balance=10000 * i, rate=0.04 + 0.01 * i)
+            for i in (1, 2, 3)}
+        debts = {
+            Debt(
+                owner=person, balance=-20000, rate=0.05,
+                minimum_payment=1000, accelerated_payment=float('inf'))}
+
+        def generate_flows(graph, source, sink):
+            """ Generates flows with networkx's solver. """
+            flows = networkx.max_flow_min_cost(graph, source, sink)
+            return sum(flows[source].values()), flows
+
+        # Flows are balanced the same way regardless of which of several
+        # equal-cost flows the solver finds, so this should match a
+        # forecast that uses networkx's solver:
+        forecast = forecaster.run_forecast(
+            people={person}, accounts=accounts, debts=debts)
+        with mock.patch.object(
+                transaction_base, '_generate_flows', generate_flows):
+            expected = forecaster.run_forecast(
+                people={person}, accounts=accounts, debts=debts)
+        # pylint: disable=no-member
+        for year, value in expected.principal_history.items():
+            self.assertAlmostEqual(
+                forecast.principal_history[year], value, places=2)
+        # pylint: enable=no-member
+
     def test_run_forecast_mutation(self):
         """ Test that Forecaster.run_forecast doesn't mutate arguments. """
         # Run a forecast and check whether the inputs were mutated:
@@ -290,6 +336,186 @@ class TestForecaster(ForecasterTester):
         self.assertEqual(
             len(next(iter(forecast.people)).gross_income_history), 2)
 
+    def test_run_many_scenarios(self):
+        """ Test Forecaster.run_many with `Scenario` samples. """
+        # Build one scenario with no returns and one where everything
+        # grows by 10%:
+        scenario_growth = Scenario(
+            inflation=0, stock_return=0.1, bond_return=0.1,
+            other_return=0.1, management_fees=0,
+            initial_year=self.initial_year,
+            num_years=self.settings.num_years)
+        samples = [self.scenario, scenario_growth]
+        summary = self.forecaster.run_many(
+            samples,
+            people={self.person},
+            accounts={self.account},
+            debts={})
+        self.assertEqual(summary.num_forecasts, 2)
+        # Each sample should match a forecast run separately:
+        principal = []
+        for scenario in samples:
+            self.forecaster.scenario = scenario
+            forecast = self.forecaster.run_forecast(
+                people={self.person},
+                accounts={self.account},
+                debts={})
+            # pylint: disable=no-member
+            principal.append(forecast.principal_history)
+            # pylint: enable=no-member
+        for year in principal[0]:
+            self.assertAlmostEqual(
+                summary.percentile('principal', 0)[year],
+                min(values[year] for values in principal), places=2)
+            self.assertAlmostEqual(
+                summary.percentile('principal', 100)[year],
+                max(values[year] for values in principal), places=2)
+
+    def test_run_many_dict(self):
+        """ Test Forecaster.run_many with dict samples. """
+        # Use a 3-year forecast so that inflation in the second year
+        # affects contributions (and thus principal) in the third year:
+        self.settings.num_years = 3
+        self.forecaster = self.forecaster_type(settings=self.settings)
+        # Provide per-year inflation; other args come from `settings`:
+        samples = [{'inflation': [0, 0, 0]}, {'inflation': [0.5, 0.5, 0.5]}]
+        summary = self.forecaster.run_many(
+            samples,
+            people={self.person},
+            accounts={self.account},
+            debts={})
+        self.assertEqual(summary.num_forecasts, 2)
+        principal = summary.percentiles('principal', (0, 100))
+        # $1000 is contributed in each year, inflation-adjusted:
+        self.assertAlmostEqual(
+            principal[0][self.initial_year + 2], 3000, places=2)
+        self.assertAlmostEqual(
+            principal[100][self.initial_year + 2], 3500, places=2)
+        self.assertEqual(
+            summary.depletion_probability()[self.initial_year + 2], 0)
+
+    def test_run_many_mutation(self):
+        """ Test that Forecaster.run_many doesn't mutate arguments. """
+        self.forecaster.run_many(
+            [self.scenario, self.scenario],
+            people={self.person},
+            accounts={self.account},
+            debts={self.debt})
+        # pylint: disable=no-member
+        self.assertEqual(len(self.person.gross_income_history), 1)
+        # pylint: enable=no-member
+
+    def test_run_many_parallel(self):
+        """ Test that parallel forecasts match serial forecasts. """
+        self.settings.num_years = 3
+        self.forecaster = self.forecaster_type(settings=self.settings)
+        samples = [{'inflation': [val / 4] * 3} for val in range(5)]
+        serial = self.forecaster.run_many(
+            samples,
+            people={self.person},
+            accounts={self.account},
+            debts={})
+        parallel = self.forecaster.run_many(
+            samples,
+            people={self.person},
+            accounts={self.account},
+            debts={},
+            workers=2, chunk_size=2)
+        self.assertEqual(parallel.num_forecasts, serial.num_forecasts)
+        for field in serial.fields:
+            self.assertEqual(parallel.values[field], serial.values[field])
+
+    def test_run_many_parallel_weighted(self):
+        """ Test parallel forecasts with equally-weighted accounts. """
+        # Worker processes unpickle their own copies of the accounts, so
+        # this checks that splitting savings between equally-weighted
+        # accounts doesn't depend on the identity of those copies:
+        settings = Settings()
+        settings.num_years = 10
+        forecaster = Forecaster(settings=settings)
+        person = Person(
+            initial_year=settings.initial_year,
+            name="Test 2",
+            birth_date="1 January 1980",
+            retirement_date="31 December 2040",
+            gross_income=100000,
+            raise_rate=0.02,
+            payment_timing='BW')
+        accounts = {
+            Account(owner=person, balance=10000 * i, rate=0.04 + 0.01 * i)
+            for i in (1, 2, 3)}
+        debts = {
+            Debt(
+                owner=person, balance=-20000, rate=0.05,
+                minimum_payment=1000, accelerated_payment=float('inf'))}
+        samples = [{'inflation': [val / 20] * 10} for val in range(4)]
+        serial = forecaster.run_many(
+            samples, people={person}, accounts=accounts, debts=debts)
+        parallel = forecaster.run_many(
+            samples, people={person}, accounts=accounts, debts=debts,
+            workers=2, chunk_size=2)
+        # Sums over accounts may be added up in a different order, so
+        # allow for rounding errors:
+        for field in serial.fields:
+            for year, values in serial.values[field].items():
+                for actual, expected in zip(
+                        parallel.values[field][year], values):
+                    self.assertAlmostEqual(actual, expected, places=2)
+
+    def test_run_many_parallel_chunks(self):
+        """ Test that Forecaster.run_many_parallel yields chunks in order. """
+        samples = [self.scenario] * 5
+        summaries = list(self.forecaster.run_many_parallel(
+            samples,
+            people={self.person},
+            accounts={self.account},
+            debts={},
+            workers=2, chunk_size=2))
+        self.assertEqual(
+            [summary.num_forecasts for summary in summaries], [2, 2, 1])
+
+    def test_run_vectorized(self):
+        """ Test that vectorized forecasts match `Forecast`. """
+        self.settings.num_years = 4
+        self.settings.tax_brackets = {self.initial_year: {0: 0.1, 5000: 0.3}}
+        self.settings.tax_personal_deduction = {self.initial_year: 1000}
+        self.forecaster = self.forecaster_type(settings=self.settings)
+        # `self.person` also owns `self.debt`, so build a new person
+        # with just one account (which grows by 5% each year):
+        person = Person(
+            initial_year=self.initial_year,
+            name="Test 2",
+            birth_date="1 January 1980",
+            retirement_date="31 December 2040",
+            gross_income=10000,
+            raise_rate=0,
+            tax_treatment=self.tax_treatment,
+            payment_timing='BW')
+        account = Account(owner=person, balance=1000, rate=0.05)
+        samples = [{'inflation': [val / 10] * 4} for val in range(3)]
+        vectorized = self.forecaster.run_vectorized(
+            samples, people={person}, accounts={account}, debts={})
+        self.assertEqual(vectorized.num_scenarios, 3)
+        for index, sample in enumerate(samples):
+            forecast = self.forecaster._run_forecast(
+                {person}, {account}, {},
+                memo=self.forecaster._sample_memo(sample, {}))
+            for field in ('principal', 'withdrawals', 'tax'):
+                expected = getattr(forecast, field + '_history')
+                actual = getattr(vectorized, field + '_history')
+                for year, value in expected.items():
+                    self.assertAlmostEqual(
+                        actual[year][index], value, places=3)
+
+    def test_run_vectorized_unsupported(self):
+        """ Test Forecaster.run_vectorized with debts. """
+        with self.assertRaises(ValueError):
+            self.forecaster.run_vectorized(
+                [self.scenario],
+                people={self.person},
+                accounts={self.account},
+                debts={self.debt})
+
     def test_decimal(self):
         """ Test Forecaster.run_forecast with Decimal arguments. """
         # Convert values to Decimal:
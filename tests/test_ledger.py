@@ -1,8 +1,14 @@
 """ Unit tests for `Ledger` class. """
 
+import math
+import pickle
 import unittest
+from array import array
+from copy import deepcopy
+from decimal import Decimal
 from forecaster.ledger import (
-    Ledger, recorded_property, recorded_property_cached)
+    Ledger, recorded_property, recorded_property_cached, ColumnarHistory,
+    fork)
 
 
 class TestLedger(Ledger):
@@ -131,6 +137,123 @@ class TestLedgerMethods(unittest.TestCase):
         self.ledger.clear_cache()
         self.assertEqual(self.ledger.cached, 4)
 
+    def test_fork(self):
+        """ Tests that forks can be advanced independently. """
+        self.ledger.next_year()
+        forked = self.ledger.fork()
+        forked.next_year()
+        # pylint: disable=no-member
+        # Pylint is confused by members added by metaclass
+        self.assertEqual(forked.this_year, self.ledger.this_year + 1)
+        self.assertEqual(len(forked.cached_history), 3)
+        self.assertEqual(len(self.ledger.cached_history), 2)
+        # Past values are shared, but histories aren't:
+        self.assertEqual(
+            forked.cached_history[0], self.ledger.cached_history[0])
+        self.assertIsNot(
+            forked.cached_history, self.ledger.cached_history)
+
+    def test_fork_related(self):
+        """ Tests that forking preserves relationships between objects. """
+        self.ledger.other = TestLedger()
+        self.ledger.other.current = {'value': 1}
+        forks = fork((self.ledger, self.ledger.other))
+        # The copy of `ledger` refers to the copy of `other`:
+        self.assertIs(forks[0].other, forks[1])
+        self.assertIsNot(forks[1], self.ledger.other)
+        # Other attributes are deep-copied:
+        forks[1].current['value'] = 2
+        self.assertEqual(self.ledger.other.current['value'], 1)
+
+
+class TestColumnarLedger(TestLedger):
+    """ Test class that stores histories in columns. """
+    columnar_history = True
+
+    @recorded_property
+    def value(self):
+        """ A float-valued recorded property. """
+        return self.this_year / 2
+
+
+class TestColumnarLedgerMethods(TestLedgerMethods):
+    """ Runs `Ledger` tests against a ledger with columnar history. """
+
+    def setUp(self):
+        """ Sets up stock attributes for testing. """
+        self.ledger = TestColumnarLedger()
+
+    def test_history_type(self):
+        """ Tests that histories are stored in columns. """
+        # pylint: disable=no-member
+        self.assertIsInstance(self.ledger._value_history, ColumnarHistory)
+
+    def test_next_year(self):
+        """ Tests recording values over several years. """
+        for _ in range(3):
+            self.ledger.next_year()
+        # pylint: disable=no-member
+        self.assertEqual(
+            self.ledger.value_history, {0: 0, 1: 0.5, 2: 1, 3: 1.5})
+        self.assertEqual(
+            self.ledger._value_history.as_array(),
+            array('d', [0, 0.5, 1]))
+
+
+class TestColumnarHistory(unittest.TestCase):
+    """ A test suite for the `ColumnarHistory` class. """
+
+    def setUp(self):
+        """ Sets up stock attributes for testing. """
+        self.history = ColumnarHistory(2000, {2000: 1.0, 2001: 2.0})
+
+    def test_get(self):
+        """ Tests getting values stored in the column. """
+        self.assertEqual(self.history[2000], 1.0)
+        self.assertEqual(self.history[2001], 2.0)
+        with self.assertRaises(KeyError):
+            _ = self.history[2002]
+
+    def test_set_other(self):
+        """ Tests values that aren't stored in the column. """
+        self.history[1999] = 0.0
+        self.history[2001] = Decimal(2)
+        self.history[2002] = {0.5: 1}
+        self.assertEqual(self.history[1999], 0.0)
+        self.assertIsInstance(self.history[2001], Decimal)
+        self.assertEqual(self.history[2002], {0.5: 1})
+        self.assertEqual(list(self.history), [1999, 2000, 2001, 2002])
+
+    def test_set_grow(self):
+        """ Tests setting values beyond the end of the column. """
+        self.history[2100] = 3.0
+        self.assertEqual(self.history[2100], 3.0)
+        self.assertEqual(len(self.history), 3)
+        self.assertNotIn(2050, self.history)
+
+    def test_del(self):
+        """ Tests deleting values. """
+        del self.history[2000]
+        self.assertNotIn(2000, self.history)
+        self.assertEqual(dict(self.history), {2001: 2.0})
+        with self.assertRaises(KeyError):
+            del self.history[2000]
+
+    def test_as_array(self):
+        """ Tests exporting the column, with missing years. """
+        self.history[2003] = 4.0
+        values = self.history.as_array()
+        self.assertEqual(list(values[:2]), [1.0, 2.0])
+        self.assertTrue(math.isnan(values[2]))
+        self.assertEqual(values[3], 4.0)
+
+    def test_copy(self):
+        """ Tests copying and pickling. """
+        self.history[2002] = Decimal(3)
+        self.assertEqual(deepcopy(self.history), self.history)
+        self.assertEqual(
+            pickle.loads(pickle.dumps(self.history)), self.history)
+
 
 if __name__ == '__main__':
     unittest.TextTestRunner().run(
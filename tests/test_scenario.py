@@ -1,6 +1,7 @@
 """ Unit tests for `Scenario` and related classes """
 
 import unittest
+import pickle
 from decimal import Decimal
 from random import Random
 from forecaster import Scenario
@@ -248,6 +249,38 @@ class TestScenarioMethods(unittest.TestCase):
                     scenario.inflation_adjust(base_year, base_year),
                     1)
 
+    def test_accumulation_mutated(self):
+        """ Tests `accumulation_function` after mutating `inflation`. """
+        scenario = Scenario(
+            initial_year=2000, num_years=3, inflation=[0, 1, 1])
+        self.assertEqual(scenario.accumulation_function(2000, 2003), 4)
+        # Double the inflation rate in the second year:
+        scenario.inflation[2001] = 3
+        self.assertEqual(scenario.accumulation_function(2000, 2003), 8)
+        self.assertEqual(scenario.accumulation_function(2003, 2001), 0.125)
+        # Replace the inflation rates entirely:
+        scenario.inflation = {2000: 0, 2001: 0, 2002: 0}
+        self.assertEqual(scenario.accumulation_function(2000, 2003), 1)
+
+    def test_accumulation_before_initial_year(self):
+        """ Tests `accumulation_function` for years before initial_year. """
+        scenario = Scenario(initial_year=2000, num_years=3, inflation=1)
+        self.assertEqual(scenario.accumulation_function(2000, 2002), 4)
+        self.assertEqual(scenario.accumulation_function(1998, 2002), 16)
+        self.assertEqual(scenario.accumulation_function(2002, 1999), 0.125)
+
+    def test_pickle(self):
+        """ Tests that `Scenario` objects can be pickled. """
+        scenario = Scenario(
+            inflation=0.02, stock_return=[0.1, 0.2], bond_return=0,
+            other_return=0, management_fees=0,
+            initial_year=2000, num_years=2)
+        copy = pickle.loads(pickle.dumps(scenario))
+        self.assertEqual(copy.inflation[2001], 0.02)
+        self.assertEqual(copy.stock_return, scenario.stock_return)
+        self.assertEqual(
+            copy.inflation_adjust(2001), scenario.inflation_adjust(2001))
+
     def test_len(self):
         """ Tests `Scenario.__len__`. """
 
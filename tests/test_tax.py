@@ -382,6 +382,64 @@ class TestTax(unittest.TestCase):
             self.accum[self.initial_year][bracket] +
             bracket * self.tax_brackets[self.initial_year][bracket])
 
+    def test_marginal_bracket(self):
+        """ Test finding brackets for incomes at and around thresholds. """
+        year = self.initial_year
+        # Incomes at a threshold are taxed in the bracket below it:
+        self.assertEqual(
+            self.tax.marginal_bracket(self.brackets[1], year),
+            self.brackets[0])
+        self.assertEqual(
+            self.tax.marginal_bracket(self.brackets[1] + 1, year),
+            self.brackets[1])
+        # Incomes below all thresholds use the lowest bracket:
+        self.assertEqual(
+            self.tax.marginal_bracket(-1, year), self.brackets[0])
+        self.assertEqual(
+            self.tax.marginal_rate(self.brackets[2] * 2, year),
+            self.tax_brackets[year][self.brackets[2]])
+
+    def test_tax_money_many(self):
+        """ Test taxing several incomes at once. """
+        incomes = [0, self.brackets[1] / 2, self.brackets[2] * 2]
+        self.assertEqual(
+            self.tax.tax_money_many(incomes, self.initial_year, credit=10),
+            [
+                self.tax.tax_money(income, self.initial_year, credit=10)
+                for income in incomes])
+
+    def test_tax_people_many(self):
+        """ Test taxing a household in several scenarios at once. """
+        year = self.initial_year
+        incomes = [self.brackets[1] / 2, self.brackets[2] * 2]
+        deductions = [0, 100]
+        credits_ = [10, 0]
+        taxes = self.tax.tax_people_many(
+            {self.person: incomes}, year,
+            deductions={self.person: deductions},
+            credits_={self.person: credits_})
+        # Each scenario is taxed like `tax_money`, with the personal
+        # deduction applied on top of `deductions`:
+        self.assertEqual(
+            taxes,
+            [
+                self.tax.tax_money(
+                    income, year,
+                    deduction=deduction + self.tax.personal_deduction(year),
+                    credit=credit)
+                for income, deduction, credit
+                in zip(incomes, deductions, credits_)])
+
+    def test_inflation_adjust_brackets(self):
+        """ Test that brackets are compiled for inflation-adjusted years. """
+        year = self.initial_year + 1
+        table, accums = self.tax.compiled_brackets(year)
+        self.assertEqual(
+            dict(zip(table.thresholds, table.values)),
+            self.tax.tax_brackets(year))
+        self.assertEqual(
+            dict(zip(table.thresholds, accums)), self.tax.accum(year))
+
     def test_taxpayer_single(self):
         """ Call test on a single taxpayer. """
         # The tax paid on the person's income should be the same as if
@@ -431,6 +489,31 @@ class TestTax(unittest.TestCase):
             self.tax(self.person1, self.initial_year)
             + self.tax(self.person2, self.initial_year))
 
+    def test_taxpayer_household(self):
+        """ Call Test on a household with two couples and a single. """
+        year = self.initial_year
+        self.person1.spouse = self.person2
+        person3 = Person(
+            year, "Tester 3", year - 50,
+            retirement_date=year + 15, gross_income=20000)
+        person4 = Person(
+            year, "Tester 4", year - 52,
+            retirement_date=year + 13, gross_income=30000, spouse=person3)
+        people = {self.person, self.person1, self.person2, person3, person4}
+        deduction = {self.person: 50, self.person1: 1000, person4: 200}
+        credit = {self.person2: 100, person3: 10}
+        # Each couple is taxed together and the single person alone,
+        # with only their own deduction and credit (if any) applied:
+        test_target = (
+            self.tax.tax_spouses(
+                {self.person1, self.person2}, year, deduction, credit)
+            + self.tax.tax_spouses({person3, person4}, year, deduction, credit)
+            + self.tax.tax_person(
+                self.person, year, deduction=deduction[self.person]))
+        self.assertAlmostEqual(
+            self.tax.tax_people(people, year, deduction, credit),
+            test_target)
+
     def test_inflation_adjust(self):
         """ Call Test on a future year with inflation effects. """
         # Start with a baseline result in initial_year. Then confirm
@@ -0,0 +1,43 @@
+""" Tests free methods and classes in the utility.brackets module. """
+
+import unittest
+from decimal import Decimal
+from forecaster.utility.brackets import BracketTable
+
+
+class TestBracketTable(unittest.TestCase):
+    """ A test case for BracketTable. """
+
+    def setUp(self):
+        """ Builds a table with unsorted brackets. """
+        self.table = BracketTable({100: 0.2, 0: 0.1, 1000: 0.3})
+
+    def test_init(self):
+        """ Tests that thresholds are sorted. """
+        self.assertEqual(self.table.thresholds, [0, 100, 1000])
+        self.assertEqual(self.table.values, [0.1, 0.2, 0.3])
+
+    def test_init_empty(self):
+        """ Tests that empty brackets are rejected. """
+        with self.assertRaises(ValueError):
+            BracketTable({})
+
+    def test_bracket(self):
+        """ Tests values in, at, and outside of brackets. """
+        self.assertEqual(self.table.bracket(50), 0)
+        # Values equal to a threshold fall into the bracket below it:
+        self.assertEqual(self.table.bracket(100), 0)
+        self.assertEqual(self.table.bracket(101), 100)
+        self.assertEqual(self.table.bracket(10 ** 6), 1000)
+        # Values below the lowest threshold use the lowest bracket:
+        self.assertEqual(self.table.bracket(-1), 0)
+
+    def test_lookup(self):
+        """ Tests looking up values, including with Decimal inputs. """
+        self.assertEqual(self.table.lookup(500), 0.2)
+        self.assertEqual(self.table.lookup(Decimal(1001)), 0.3)
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(
+        unittest.TestLoader().loadTestsFromName(__name__))
@@ -0,0 +1,39 @@
+""" Tests free methods and classes in the utility.functions module. """
+
+import unittest
+import pickle
+from collections import defaultdict
+from forecaster.utility.functions import Constant, identity
+
+class TestConstant(unittest.TestCase):
+    """ A test case for the `Constant` class. """
+
+    def test_call(self):
+        """ Tests that the same value is returned for any args. """
+        func = Constant(5)
+        self.assertEqual(func(), 5)
+        self.assertEqual(func(2000), 5)
+        self.assertEqual(func(2000, key='value'), 5)
+
+    def test_default_factory(self):
+        """ Tests use as a defaultdict default factory. """
+        vals = defaultdict(Constant(0.5))
+        self.assertEqual(vals[2000], 0.5)
+
+    def test_pickle(self):
+        """ Tests that defaultdicts using `Constant` can be pickled. """
+        vals = pickle.loads(pickle.dumps(defaultdict(Constant(0.5))))
+        self.assertEqual(vals[2000], 0.5)
+
+class TestFreeMethods(unittest.TestCase):
+    """ A test case for the free methods in the functions module. """
+
+    def test_identity(self):
+        """ Tests identity(). """
+        obj = object()
+        self.assertIs(identity(obj), obj)
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(
+        unittest.TestLoader().loadTestsFromName(__name__))
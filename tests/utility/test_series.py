@@ -0,0 +1,122 @@
+""" Tests free methods and classes in the utility.series module. """
+
+import unittest
+import pickle
+from array import array
+from copy import copy, deepcopy
+from decimal import Decimal
+from forecaster.utility.series import TransactionSeries
+from forecaster.utility.timing import add_transactions, subtract_transactions
+
+
+class TestTransactionSeries(unittest.TestCase):
+    """ A test case for TransactionSeries. """
+
+    def setUp(self):
+        """ Builds a series with unsorted timings. """
+        self.series = TransactionSeries({1: 10, 0: 50, 0.5: 100})
+
+    def test_init(self):
+        """ Tests that timings are sorted and equal to the input. """
+        self.assertEqual(list(self.series), [0, 0.5, 1])
+        self.assertEqual(self.series, {0: 50, 0.5: 100, 1: 10})
+
+    def test_getitem_missing(self):
+        """ Tests that missing timings read as `zero`. """
+        self.assertEqual(self.series[0.25], 0)
+        self.assertNotIn(0.25, self.series)
+        self.series[0.25] += 5
+        self.assertEqual(list(self.series), [0, 0.25, 0.5, 1])
+        self.assertEqual(self.series[0.25], 5)
+
+    def test_float_storage(self):
+        """ Tests that float series use array storage. """
+        series = TransactionSeries({0.5: 1.0})
+        series[0.25] += 2.0
+        self.assertIsInstance(series.as_arrays()[0], array)
+        self.assertIsInstance(series._whens, array)
+
+    def test_int_types(self):
+        """ Tests that int timings and values keep their type. """
+        self.assertEqual(
+            [type(when) for when in self.series], [int, float, int])
+
+    def test_get_missing(self):
+        """ Tests that `get` doesn't insert missing timings. """
+        self.assertIsNone(self.series.get(0.25))
+        self.assertNotIn(0.25, self.series)
+
+    def test_delitem(self):
+        """ Tests deleting present and missing timings. """
+        del self.series[0.5]
+        self.assertEqual(self.series, {0: 50, 1: 10})
+        with self.assertRaises(KeyError):
+            del self.series[0.5]
+
+    def test_add(self):
+        """ Tests adding overlapping and non-overlapping timings. """
+        self.series.add({0.5: -25, 0.75: 1, 2: 3})
+        self.assertEqual(
+            self.series, {0: 50, 0.5: 75, 0.75: 1, 1: 10, 2: 3})
+
+    def test_add_transactions(self):
+        """ Tests `add_transactions` and `subtract_transactions`. """
+        add_transactions(self.series, TransactionSeries({0.5: 1}))
+        subtract_transactions(self.series, {1: 10})
+        self.assertEqual(self.series, {0: 50, 0.5: 101, 1: 0})
+
+    def test_merge(self):
+        """ Tests that `merge` doesn't mutate its inputs. """
+        other = {0.5: 1}
+        result = self.series.merge(other, other)
+        self.assertEqual(result, {0: 50, 0.5: 102, 1: 10})
+        self.assertEqual(self.series[0.5], 100)
+        self.assertEqual(other, {0.5: 1})
+
+    def test_cumulative(self):
+        """ Tests running totals. """
+        self.assertEqual(
+            self.series.cumulative(), {0: 50, 0.5: 150, 1: 160})
+
+    def test_total(self):
+        """ Tests sums up to and including a timing. """
+        self.assertEqual(self.series.total(0.5), 150)
+        self.assertEqual(self.series.total(), 160)
+
+    def test_present_value(self):
+        """ Tests discounting with a simple-interest accumulation. """
+        series = TransactionSeries({0: 1, 1: 2})
+        self.assertEqual(series.present_value(lambda t: 1 + t), 2)
+
+    def test_future_value(self):
+        """ Tests that later transactions are ignored. """
+        self.assertEqual(
+            self.series.future_value(lambda t: 1 + t, 0.5), 175)
+
+    def test_as_arrays(self):
+        """ Tests exporting columns. """
+        whens, values = self.series.as_arrays()
+        self.assertEqual(whens, array('d', [0, 0.5, 1]))
+        self.assertEqual(values, array('d', [50, 100, 10]))
+
+    def test_decimal(self):
+        """ Tests that Decimal timings and values keep their type. """
+        series = TransactionSeries(zero=Decimal(0))
+        series[Decimal('0.5')] += Decimal(1)
+        series.add({Decimal(0): Decimal(2)})
+        for when, value in series.items():
+            self.assertIsInstance(when, Decimal)
+            self.assertIsInstance(value, Decimal)
+
+    def test_copy(self):
+        """ Tests that copies don't share storage. """
+        for copied in (
+                copy(self.series), deepcopy(self.series),
+                pickle.loads(pickle.dumps(self.series))):
+            copied[0] = 0
+            self.assertEqual(self.series[0], 50)
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(
+        unittest.TestLoader().loadTestsFromName(__name__))
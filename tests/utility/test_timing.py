@@ -1,8 +1,12 @@
 """ Tests free methods and classes in the utility.timing module. """
 
 import unittest
+import pickle
+from copy import deepcopy
+from decimal import Decimal
 from forecaster.utility.timing import (
-    Timing, transactions_from_timing, when_conv, frequency_conv)
+    Timing, FrozenTiming, frozen_timing,
+    transactions_from_timing, when_conv, frequency_conv)
 
 class TestTiming(unittest.TestCase):
     """ A test case for Timing. """
@@ -30,6 +34,13 @@ class TestTiming(unittest.TestCase):
         timing = Timing(frequency="M")
         self.assertEqual(len(timing), 12)
 
+    def test_init_str_freq_decimal(self):
+        """ Init `Timing` with a str `frequency` and Decimal values. """
+        timing = Timing('BW', high_precision=Decimal)
+        self.assertEqual(len(timing), 26)
+        for when in timing:
+            self.assertIsInstance(when, Decimal)
+
     def test_init_str_when(self):
         """ Init `Timing` with a single str parameter, `when`. """
         # 'start' should convert to 0:
@@ -189,6 +200,65 @@ class TestTiming(unittest.TestCase):
         target = Timing({1: 1})
         self.assertEqual(result, target)
 
+    def test_normalized_items(self):
+        """ Tests `normalized_items` with simple input. """
+        timing = Timing({0: 1, 1: 3})
+        self.assertEqual(dict(timing.normalized_items()), {0: 0.25, 1: 0.75})
+
+class TestFrozenTiming(unittest.TestCase):
+    """ A test case for FrozenTiming and frozen_timing. """
+
+    def test_init_matches_timing(self):
+        """ Test that `FrozenTiming` has the same items as `Timing`. """
+        self.assertEqual(FrozenTiming(0, 'Q'), Timing(0, 'Q'))
+
+    def test_whens_weights(self):
+        """ Test precomputed sorted timings and normalized weights. """
+        timing = FrozenTiming({1: 3, 0: 1})
+        self.assertEqual(timing.whens, (0, 1))
+        self.assertEqual(timing.weights, (0.25, 0.75))
+
+    def test_normalized_items(self):
+        """ Test that `normalized_items` uses `whens` and `weights`. """
+        timing = FrozenTiming({1: 3, 0: 1})
+        self.assertEqual(
+            list(timing.normalized_items()), [(0, 0.25), (1, 0.75)])
+
+    def test_immutable(self):
+        """ Test that mutating a `FrozenTiming` raises TypeError. """
+        timing = FrozenTiming()
+        with self.assertRaises(TypeError):
+            timing[0] = 1
+        with self.assertRaises(TypeError):
+            timing.update({0: 1})
+
+    def test_hashable(self):
+        """ Test that equal `FrozenTiming` objects hash equally. """
+        self.assertEqual(
+            hash(FrozenTiming(1, 'M')), hash(FrozenTiming(1, 'M')))
+
+    def test_time_series_repeat(self):
+        """ Test that `time_series` doesn't change cached weights. """
+        timing = FrozenTiming({0: 1, 1: 1})
+        self.assertEqual(timing.time_series(2), {0: 1, 1: 1})
+        self.assertEqual(timing.time_series(2), {0: 1, 1: 1})
+
+    def test_copy_pickle(self):
+        """ Test that copying and pickling preserve the timing. """
+        timing = FrozenTiming(0, 'SA')
+        self.assertIs(deepcopy(timing), timing)
+        self.assertEqual(pickle.loads(pickle.dumps(timing)), timing)
+
+    def test_cached(self):
+        """ Test that `frozen_timing` returns shared instances. """
+        self.assertIs(frozen_timing(0.5, 'M'), frozen_timing(0.5, 'M'))
+
+    def test_cached_decimal(self):
+        """ Test that `frozen_timing` respects `high_precision`. """
+        timing = frozen_timing(high_precision=Decimal)
+        for when in timing:
+            self.assertIsInstance(when, Decimal)
+
 class TestFreeMethods(unittest.TestCase):
     """ A test case for the free methods in the utility module. """
 